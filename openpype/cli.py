@@ -382,6 +382,21 @@ def unpack_project(zipfile, root, dbonly):
     PypeCommands().unpack_project(zipfile, root, dbonly)
 
 
+@main.command()
+@click.option(
+    "--project", help="Project name (all projects if not set)", default=None)
+def index_last_versions(project):
+    """Store last version of subsets to subset documents.
+
+    Index is used to find last versions of subsets fast and is maintained
+    on publish. This is needed only once for projects created before.
+    """
+    if AYON_SERVER_ENABLED:
+        raise RuntimeError(
+            "AYON does not support 'index-last-versions' command.")
+    PypeCommands().index_last_versions(project)
+
+
 @main.command()
 def interactive():
     """Interactive (Python like) console.
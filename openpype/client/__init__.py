@@ -11,6 +11,7 @@ from .entities import (
     get_asset_by_id,
     get_asset_by_name,
     get_assets,
+    get_assets_changed_since,
     get_archived_assets,
     get_asset_ids_with_subsets,
 
@@ -71,6 +72,7 @@ __all__ = (
     "get_asset_by_id",
     "get_asset_by_name",
     "get_assets",
+    "get_assets_changed_since",
     "get_archived_assets",
     "get_asset_ids_with_subsets",
 
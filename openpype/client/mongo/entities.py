@@ -15,6 +15,13 @@ from bson.objectid import ObjectId
 from .mongo import get_project_database, get_project_connection
 
 PatternType = type(re.compile(""))
+# Key on subset document with '_id' and 'name' of its last version. Value
+#   is 'None' if subset does not have any version. Subsets without the key
+#   were not indexed yet (see 'update_last_versions_index').
+LAST_VERSION_KEY = "last_version"
+# Key on asset document with datetime of last change made by operations
+#   session. Assets created or changed by other tools may not have it.
+ASSET_UPDATED_KEY = "updated_at"
 
 
 def _prepare_fields(fields, required_fields=None):
@@ -309,6 +316,34 @@ def get_assets(
     )
 
 
+def get_assets_changed_since(project_name, since, fields=None):
+    """Assets which were created or changed since passed time.
+
+    Creation time is taken from asset id and time of change from
+    'ASSET_UPDATED_KEY' which is set by operations session. Changes made
+    without operations session are not found.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        since (datetime.datetime): Naive datetime in UTC.
+        fields (Optional[Iterable[str]]): Fields that should be returned. All
+            fields are returned if 'None' is passed.
+
+    Returns:
+        Cursor: Query cursor as iterable which returns asset documents.
+    """
+
+    query_filter = {
+        "type": "asset",
+        "$or": [
+            {ASSET_UPDATED_KEY: {"$gte": since}},
+            {"_id": {"$gte": ObjectId.from_datetime(since)}},
+        ]
+    }
+    conn = get_project_connection(project_name)
+    return conn.find(query_filter, _prepare_fields(fields))
+
+
 def get_archived_assets(
     project_name,
     asset_ids=None,
@@ -858,6 +893,9 @@ def get_output_link_versions(project_name, version_id, fields=None):
 def get_last_versions(project_name, subset_ids, active=None, fields=None):
     """Latest versions for entered subset_ids.
 
+    Last versions are read from index on subset documents when 'active' is
+    not specified. Versions of subsets which are not indexed are aggregated.
+
     Args:
         project_name (str): Name of project where to look for queried entities.
         subset_ids (Iterable[Union[str, ObjectId]]): List of subset ids.
@@ -892,13 +930,86 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
                 fields_s.remove(field)
         limit_query = len(fields_s) == 0
 
-    group_item = {
-        "_id": "$parent",
-        "_version_id": {"$last": "$_id"}
+    conn = get_project_connection(project_name)
+    # Last version id and name by subset id
+    last_versions = {}
+    not_indexed_ids = subset_ids
+    # Index does not take 'active' state of versions into account
+    if active is None:
+        last_versions, not_indexed_ids = _get_indexed_last_versions(
+            conn, subset_ids
+        )
+
+    if not_indexed_ids:
+        last_versions.update(
+            _aggregate_last_versions(conn, not_indexed_ids, active)
+        )
+
+    if limit_query:
+        output = {}
+        for subset_id, item in last_versions.items():
+            version_id, version_name = item
+            item_data = {"_id": version_id, "parent": subset_id}
+            if name_needed:
+                item_data["name"] = version_name
+            output[subset_id] = item_data
+        return output
+
+    version_ids = [
+        item[0]
+        for item in last_versions.values()
+    ]
+    if not version_ids:
+        return {}
+
+    fields = _prepare_fields(fields, ["parent"])
+
+    version_docs = get_versions(
+        project_name, version_ids=version_ids, fields=fields
+    )
+
+    return {
+        version_doc["parent"]: version_doc
+        for version_doc in version_docs
     }
-    # Add name if name is needed (only for limit query)
-    if name_needed:
-        group_item["name"] = {"$last": "$name"}
+
+
+def _get_indexed_last_versions(conn, subset_ids):
+    """Last versions of subsets from index stored on subset documents.
+
+    Returns:
+        tuple[dict[ObjectId, tuple[ObjectId, int]], list[ObjectId]]: Last
+            version id and name by subset id and ids of subsets which are
+            not indexed.
+    """
+
+    last_versions = {}
+    not_indexed_ids = []
+    subset_docs = conn.find(
+        {"type": "subset", "_id": {"$in": subset_ids}},
+        {LAST_VERSION_KEY: True}
+    )
+    for subset_doc in subset_docs:
+        subset_id = subset_doc["_id"]
+        if LAST_VERSION_KEY not in subset_doc:
+            not_indexed_ids.append(subset_id)
+            continue
+
+        last_version = subset_doc[LAST_VERSION_KEY]
+        if last_version:
+            last_versions[subset_id] = (
+                last_version["_id"], last_version["name"]
+            )
+    return last_versions, not_indexed_ids
+
+
+def _aggregate_last_versions(conn, subset_ids, active=None):
+    """Find last versions of subsets from all their versions.
+
+    Returns:
+        dict[ObjectId, tuple[ObjectId, int]]: Last version id and name by
+            subset id.
+    """
 
     aggregate_filter = {
         "type": "version",
@@ -918,35 +1029,16 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
         # Sorting versions all together
         {"$sort": {"name": 1}},
         # Group them by "parent", but only take the last
-        {"$group": group_item}
-    ]
-
-    conn = get_project_connection(project_name)
-    aggregate_result = conn.aggregate(aggregation_pipeline)
-    if limit_query:
-        output = {}
-        for item in aggregate_result:
-            subset_id = item["_id"]
-            item_data = {"_id": item["_version_id"], "parent": subset_id}
-            if name_needed:
-                item_data["name"] = item["name"]
-            output[subset_id] = item_data
-        return output
-
-    version_ids = [
-        doc["_version_id"]
-        for doc in aggregate_result
+        {"$group": {
+            "_id": "$parent",
+            "_version_id": {"$last": "$_id"},
+            "name": {"$last": "$name"},
+        }}
     ]
 
-    fields = _prepare_fields(fields, ["parent"])
-
-    version_docs = get_versions(
-        project_name, version_ids=version_ids, fields=fields
-    )
-
     return {
-        version_doc["parent"]: version_doc
-        for version_doc in version_docs
+        item["_id"]: (item["_version_id"], item["name"])
+        for item in conn.aggregate(aggregation_pipeline)
     }
 
 
@@ -1328,10 +1420,6 @@ def get_representations_parents(project_name, representations):
     """
 
     repre_docs_by_version_id = collections.defaultdict(list)
-    version_docs_by_version_id = {}
-    version_docs_by_subset_id = collections.defaultdict(list)
-    subset_docs_by_subset_id = {}
-    subset_docs_by_asset_id = collections.defaultdict(list)
     output = {}
     for repre_doc in representations:
         repre_id = repre_doc["_id"]
@@ -1339,47 +1427,25 @@ def get_representations_parents(project_name, representations):
         output[repre_id] = (None, None, None, None)
         repre_docs_by_version_id[version_id].append(repre_doc)
 
-    version_docs = get_versions(
-        project_name,
-        version_ids=repre_docs_by_version_id.keys(),
-        hero=True
-    )
-    for version_doc in version_docs:
-        version_id = version_doc["_id"]
-        subset_id = version_doc["parent"]
-        version_docs_by_version_id[version_id] = version_doc
-        version_docs_by_subset_id[subset_id].append(version_doc)
-
-    subset_docs = get_subsets(
-        project_name, subset_ids=version_docs_by_subset_id.keys()
-    )
-    for subset_doc in subset_docs:
-        subset_id = subset_doc["_id"]
-        asset_id = subset_doc["parent"]
-        subset_docs_by_subset_id[subset_id] = subset_doc
-        subset_docs_by_asset_id[asset_id].append(subset_doc)
-
-    asset_docs = get_assets(
-        project_name, asset_ids=subset_docs_by_asset_id.keys()
-    )
-    asset_docs_by_id = {
-        asset_doc["_id"]: asset_doc
-        for asset_doc in asset_docs
-    }
+    if not repre_docs_by_version_id:
+        return output
 
-    project_doc = get_project(project_name)
+    project_doc = None
+    parents_by_version_id = {}
+    for doc in _get_versions_with_parents(
+        project_name, list(repre_docs_by_version_id.keys())
+    ):
+        if doc["type"] == "project":
+            project_doc = doc
+            continue
+        subset_doc = doc.pop("_subset", None)
+        asset_doc = doc.pop("_asset", None)
+        parents_by_version_id[doc["_id"]] = (doc, subset_doc, asset_doc)
 
     for version_id, repre_docs in repre_docs_by_version_id.items():
-        asset_doc = None
-        subset_doc = None
-        version_doc = version_docs_by_version_id.get(version_id)
-        if version_doc:
-            subset_id = version_doc["parent"]
-            subset_doc = subset_docs_by_subset_id.get(subset_id)
-            if subset_doc:
-                asset_id = subset_doc["parent"]
-                asset_doc = asset_docs_by_id.get(asset_id)
-
+        version_doc, subset_doc, asset_doc = parents_by_version_id.get(
+            version_id, (None, None, None)
+        )
         for repre_doc in repre_docs:
             repre_id = repre_doc["_id"]
             output[repre_id] = (
@@ -1388,6 +1454,53 @@ def get_representations_parents(project_name, representations):
     return output
 
 
+def _get_versions_with_parents(project_name, version_ids):
+    """Versions with their subset and asset and project document.
+
+    All documents are received with single aggregation. Subset and asset
+    documents are under '_subset' and '_asset' keys of version documents.
+    Project document is part of output. Documents are not projected
+    because callers use them as full entities.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        version_ids (list[ObjectId]): Version or hero version ids.
+
+    Returns:
+        Iterable[dict[str, Any]]: Version and project documents.
+    """
+
+    version_ids = convert_ids(version_ids)
+    if not version_ids:
+        return []
+
+    aggregation_pipeline = [
+        {"$match": {"$or": [
+            {"type": "project"},
+            {
+                "type": {"$in": ["version", "hero_version"]},
+                "_id": {"$in": version_ids}
+            },
+        ]}},
+        {"$lookup": {
+            "from": project_name,
+            "localField": "parent",
+            "foreignField": "_id",
+            "as": "_subset"
+        }},
+        {"$unwind": {"path": "$_subset", "preserveNullAndEmptyArrays": True}},
+        {"$lookup": {
+            "from": project_name,
+            "localField": "_subset.parent",
+            "foreignField": "_id",
+            "as": "_asset"
+        }},
+        {"$unwind": {"path": "$_asset", "preserveNullAndEmptyArrays": True}},
+    ]
+    conn = get_project_connection(project_name)
+    return conn.aggregate(aggregation_pipeline)
+
+
 def get_representation_parents(project_name, representation):
     """Prepare parents of representation entity.
 
@@ -1,5 +1,6 @@
 import re
 import copy
+import datetime
 import collections
 
 from bson.objectid import ObjectId
@@ -13,7 +14,11 @@ from openpype.client.operations_base import (
     BaseOperationsSession
 )
 from .mongo import get_project_connection
-from .entities import get_project
+from .entities import (
+    get_project,
+    LAST_VERSION_KEY,
+    ASSET_UPDATED_KEY,
+)
 
 
 PROJECT_NAME_ALLOWED_SYMBOLS = "a-zA-Z0-9_"
@@ -398,7 +403,15 @@ class MongoCreateOperation(CreateOperation):
         return self._data["_id"]
 
     def to_mongo_operation(self):
-        return InsertOne(copy.deepcopy(self._data))
+        data = copy.deepcopy(self._data)
+        # New subset does not have any version yet, index is maintained
+        #   by operations session
+        if self.entity_type == "subset":
+            data[LAST_VERSION_KEY] = None
+        # Time of change is used for incremental refresh of asset caches
+        elif self.entity_type == "asset":
+            data[ASSET_UPDATED_KEY] = datetime.datetime.utcnow()
+        return InsertOne(data)
 
 
 class MongoUpdateOperation(UpdateOperation):
@@ -427,6 +440,14 @@ class MongoUpdateOperation(UpdateOperation):
         unset_data = {}
         set_data = {}
         for key, value in self._update_data.items():
+            # Last version index is maintained by operations session
+            if self.entity_type == "subset" and key == LAST_VERSION_KEY:
+                continue
+
+            # Time of asset change is set by database
+            if self.entity_type == "asset" and key == ASSET_UPDATED_KEY:
+                continue
+
             if value is REMOVED_VALUE:
                 unset_data[key] = None
             else:
@@ -441,6 +462,9 @@ class MongoUpdateOperation(UpdateOperation):
         if not op_data:
             return None
 
+        if self.entity_type == "asset":
+            op_data["$currentDate"] = {ASSET_UPDATED_KEY: True}
+
         return UpdateOne(
             {"_id": self.entity_id},
             op_data
@@ -470,6 +494,166 @@ class MongoDeleteOperation(DeleteOperation):
         return DeleteOne({"_id": self.entity_id})
 
 
+class _LastVersionIndexUpdater(object):
+    """Keep index of last versions on subset documents up to date.
+
+    Created versions conditionally update index of their subset in the same
+    bulk write. Subsets of deleted versions, or versions with changed name
+    or parent, get their last version found again after the write.
+
+    Only subsets which were already indexed are changed.
+
+    Args:
+        project_name (str): Project name.
+    """
+
+    def __init__(self, project_name):
+        self._project_name = project_name
+        self._collection = get_project_connection(project_name)
+        self._created_versions = []
+        self._changed_version_ids = set()
+        self._changed_subset_ids = set()
+
+    def add_operation(self, operation):
+        if operation.entity_type != "version":
+            return
+
+        operation_name = operation.operation_name
+        if operation_name == "create":
+            data = operation.data
+            self._created_versions.append(
+                (ObjectId(data["parent"]), data["_id"], data["name"])
+            )
+
+        elif operation_name == "update":
+            update_data = operation.update_data
+            if "name" not in update_data and "parent" not in update_data:
+                return
+            self._changed_version_ids.add(operation.entity_id)
+            parent_id = update_data.get("parent")
+            if parent_id is not None and parent_id is not REMOVED_VALUE:
+                self._changed_subset_ids.add(ObjectId(parent_id))
+
+        elif operation_name == "delete":
+            self._changed_version_ids.add(operation.entity_id)
+
+    def prepare(self):
+        """Find subsets of changed versions before they're changed."""
+        if not self._changed_version_ids:
+            return
+
+        version_docs = self._collection.find(
+            {
+                "type": "version",
+                "_id": {"$in": list(self._changed_version_ids)}
+            },
+            {"parent": True}
+        )
+        for version_doc in version_docs:
+            self._changed_subset_ids.add(version_doc["parent"])
+
+    def get_mongo_operations(self):
+        """Operations updating index for created versions.
+
+        Index is changed only if created version is higher than indexed
+        version, so concurrent sessions can't lower it.
+        """
+        operations = []
+        for subset_id, version_id, version_name in self._created_versions:
+            operations.append(UpdateOne(
+                {
+                    "_id": subset_id,
+                    "$or": [
+                        {LAST_VERSION_KEY: {"$type": "null"}},
+                        {
+                            "{}.name".format(LAST_VERSION_KEY): {
+                                "$lt": version_name
+                            }
+                        },
+                    ]
+                },
+                {"$set": {
+                    LAST_VERSION_KEY: {
+                        "_id": version_id,
+                        "name": version_name
+                    }
+                }}
+            ))
+        return operations
+
+    def finalize(self):
+        """Update index of subsets with changed versions."""
+        if self._changed_subset_ids:
+            update_last_versions_index(
+                self._project_name, list(self._changed_subset_ids),
+                indexed_only=True
+            )
+
+
+def update_last_versions_index(
+    project_name, subset_ids=None, indexed_only=False
+):
+    """Store last version of subsets to subset documents.
+
+    Used to index projects created before the index existed. Index is then
+    maintained by 'OperationsSession'.
+
+    Args:
+        project_name (str): Project name.
+        subset_ids (Optional[Iterable[Union[str, ObjectId]]]): Subsets to
+            update. All subsets of project are updated if not passed.
+        indexed_only (Optional[bool]): Update only subsets which already
+            have index.
+
+    Returns:
+        int: Count of updated subsets.
+    """
+
+    collection = get_project_connection(project_name)
+    subset_filter = {"type": "subset"}
+    version_filter = {"type": "version"}
+    if subset_ids is not None:
+        subset_ids = [ObjectId(subset_id) for subset_id in subset_ids]
+        if not subset_ids:
+            return 0
+        subset_filter["_id"] = {"$in": subset_ids}
+        version_filter["parent"] = {"$in": subset_ids}
+
+    if indexed_only:
+        subset_filter[LAST_VERSION_KEY] = {"$exists": True}
+
+    last_versions = {
+        item["_id"]: {"_id": item["_version_id"], "name": item["name"]}
+        for item in collection.aggregate([
+            {"$match": version_filter},
+            {"$sort": {"name": 1}},
+            {"$group": {
+                "_id": "$parent",
+                "_version_id": {"$last": "$_id"},
+                "name": {"$last": "$name"},
+            }}
+        ])
+    }
+
+    count = 0
+    bulk_writes = []
+    for subset_doc in collection.find(subset_filter, {"_id": True}):
+        subset_id = subset_doc["_id"]
+        bulk_writes.append(UpdateOne(
+            {"_id": subset_id},
+            {"$set": {LAST_VERSION_KEY: last_versions.get(subset_id)}}
+        ))
+        if len(bulk_writes) >= 1000:
+            collection.bulk_write(bulk_writes)
+            count += len(bulk_writes)
+            bulk_writes = []
+
+    if bulk_writes:
+        collection.bulk_write(bulk_writes)
+        count += len(bulk_writes)
+    return count
+
+
 class MongoOperationsSession(BaseOperationsSession):
     """Session storing operations that should happen in an order.
 
@@ -496,15 +680,20 @@ class MongoOperationsSession(BaseOperationsSession):
             operations_by_project[operation.project_name].append(operation)
 
         for project_name, operations in operations_by_project.items():
+            index_updater = _LastVersionIndexUpdater(project_name)
             bulk_writes = []
             for operation in operations:
                 mongo_op = operation.to_mongo_operation()
                 if mongo_op is not None:
                     bulk_writes.append(mongo_op)
+                    index_updater.add_operation(operation)
 
             if bulk_writes:
+                index_updater.prepare()
+                bulk_writes.extend(index_updater.get_mongo_operations())
                 collection = get_project_connection(project_name)
                 collection.bulk_write(bulk_writes)
+                index_updater.finalize()
 
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'MongoCreateOperation'.
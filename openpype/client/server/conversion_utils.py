@@ -1,5 +1,8 @@
 import os
+import copy
 import arrow
+import datetime
+import threading
 import collections
 import json
 
@@ -167,9 +170,52 @@ def _fill_template_category(templates, cat_templates, cat_key):
             templates["others"][new_name] = cat_template
 
 
+class _ConvertedProjectsCache(object):
+    """Converted projects by name, server update time and queried keys.
+
+    Only last converted variant of each project is kept. Copy of cached
+    project is returned so callers can modify it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items = {}
+
+    @staticmethod
+    def get_key(project):
+        updated_at = project.get("updatedAt")
+        if not updated_at:
+            return None
+        return (updated_at, tuple(sorted(project.keys())))
+
+    def get(self, project_name, key):
+        if key is None:
+            return None
+        with self._lock:
+            item = self._items.get(project_name)
+        if item is None or item[0] != key:
+            return None
+        return copy.deepcopy(item[1])
+
+    def set(self, project_name, key, converted):
+        if key is None:
+            return
+        with self._lock:
+            self._items[project_name] = (key, copy.deepcopy(converted))
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_CONVERTED_PROJECTS_CACHE = _ConvertedProjectsCache()
+
+
 def convert_v4_project_to_v3(project):
     """Convert Project entity data from v4 structure to v3 structure.
 
+    Converted projects are memoized by project name and server update time.
+
     Args:
         project (Dict[str, Any]): Project entity queried from v4 server.
 
@@ -180,6 +226,17 @@ def convert_v4_project_to_v3(project):
     if not project:
         return project
 
+    project_name = project["name"]
+    # Key must be created before conversion which changes the project
+    key = _CONVERTED_PROJECTS_CACHE.get_key(project)
+    output = _CONVERTED_PROJECTS_CACHE.get(project_name, key)
+    if output is None:
+        output = _convert_v4_project_to_v3(project)
+        _CONVERTED_PROJECTS_CACHE.set(project_name, key, output)
+    return output
+
+
+def _convert_v4_project_to_v3(project):
     project_name = project["name"]
     output = {
         "_id": project_name,
@@ -606,14 +663,40 @@ def convert_v4_version_to_v3(version):
             output_data[dst_key] = version[src_key]
 
     if "createdAt" in version:
-        created_at = arrow.get(version["createdAt"]).to("local")
-        output_data["time"] = created_at.strftime("%Y%m%dT%H%M%SZ")
+        output_data["time"] = _convert_created_at(version["createdAt"])
 
     output["data"] = output_data
 
     return output
 
 
+def _convert_created_at(created_at):
+    """Convert server creation time to v3 'time' in local timezone.
+
+    Parsing with 'arrow' is slow so ISO format strings are parsed with
+    'datetime' which gives the same result.
+
+    Args:
+        created_at (str): Creation time from server.
+
+    Returns:
+        str: Time formatted as '%Y%m%dT%H%M%SZ'.
+    """
+
+    dt = None
+    if isinstance(created_at, six.string_types):
+        try:
+            dt = datetime.datetime.fromisoformat(created_at)
+        except ValueError:
+            pass
+
+    if dt is None or dt.tzinfo is None:
+        dt = arrow.get(created_at).to("local")
+    else:
+        dt = dt.astimezone()
+    return dt.strftime("%Y%m%dT%H%M%SZ")
+
+
 def representation_fields_v3_to_v4(fields, con):
     """Convert representation fields from v3 to v4 structure.
 
@@ -249,6 +249,11 @@ def get_assets(
             yield convert_v4_folder_to_v3(folder, project_name)
 
 
+def get_assets_changed_since(project_name, since, fields=None):
+    # Folders can't be filtered by modification time so all are returned
+    return get_assets(project_name, fields=fields)
+
+
 def get_archived_assets(
     project_name,
     asset_ids=None,
@@ -8,16 +8,344 @@ overflow OpenPype logic it's here for now.
 
 import os
 import time
+import logging
+import threading
 import collections
 
 import appdirs
 
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
 FileInfo = collections.namedtuple(
     "FileInfo",
     ("path", "size", "modification_time")
 )
 
 
+class _ThumbnailsIndex(object):
+    """Index of cached thumbnail files stored in SQLite database.
+
+    Index is stored in thumbnails directory and keeps size and last access
+    time of each file, so expired and least recently used files can be
+    found without scanning the directory. Total size of files is updated
+    by database triggers. Index is created from existing files on first
+    use.
+
+    Access times are kept in memory and written in batches, when there is
+    'max_pending_access' of them or when last write is older than
+    'flush_interval' seconds.
+
+    Args:
+        thumbnails_dir (str): Root directory of thumbnails.
+    """
+
+    filename = "index.sqlite"
+    # Change when schema changes, index is created again
+    schema_version = 1
+    # Count of pending access times which triggers write to database
+    max_pending_access = 50
+    flush_interval = 30
+    # Rows fetched at once when files are evicted
+    fetch_size = 100
+
+    _schema = (
+        """CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            last_access REAL NOT NULL
+        )""",
+        """CREATE INDEX IF NOT EXISTS files_last_access
+            ON files (last_access)""",
+        """CREATE TABLE IF NOT EXISTS stats (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            total_size INTEGER NOT NULL
+        )""",
+        "INSERT OR IGNORE INTO stats (id, total_size) VALUES (0, 0)",
+        """CREATE TRIGGER IF NOT EXISTS files_insert AFTER INSERT ON files
+        BEGIN
+            UPDATE stats SET total_size = total_size + NEW.size;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS files_delete AFTER DELETE ON files
+        BEGIN
+            UPDATE stats SET total_size = total_size - OLD.size;
+        END""",
+        """CREATE TRIGGER IF NOT EXISTS files_update
+            AFTER UPDATE OF size ON files
+        BEGIN
+            UPDATE stats SET total_size = total_size - OLD.size + NEW.size;
+        END""",
+    )
+
+    def __init__(self, thumbnails_dir):
+        self._thumbnails_dir = thumbnails_dir
+        self._path = os.path.join(thumbnails_dir, self.filename)
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pending_access = {}
+        self._last_flush = time.time()
+
+    @classmethod
+    def is_index_file(cls, filename):
+        return filename.startswith(cls.filename)
+
+    def _get_connection(self):
+        if self._connection is None:
+            if not os.path.exists(self._thumbnails_dir):
+                os.makedirs(self._thumbnails_dir)
+            try:
+                connection = self._connect()
+            except sqlite3.DatabaseError as exc:
+                # Subclasses are e.g. locked database which is not broken
+                if exc.__class__ is not sqlite3.DatabaseError:
+                    raise
+                # Index file is broken, create it again from files
+                os.remove(self._path)
+                connection = self._connect()
+            self._connection = connection
+        return self._connection
+
+    def _connect(self):
+        connection = sqlite3.connect(
+            self._path,
+            timeout=10,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        try:
+            self._initialize(connection)
+        except Exception:
+            connection.close()
+            raise
+        return connection
+
+    def _initialize(self, connection):
+        version = connection.execute("PRAGMA user_version").fetchone()[0]
+        if version == self.schema_version:
+            return
+
+        # Other process may be creating the index at the same time
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            version = connection.execute(
+                "PRAGMA user_version").fetchone()[0]
+            if version != self.schema_version:
+                for statement in (
+                    "DROP TABLE IF EXISTS files",
+                    "DROP TABLE IF EXISTS stats",
+                ) + self._schema:
+                    connection.execute(statement)
+                connection.executemany(
+                    "INSERT INTO files (path, size, last_access)"
+                    " VALUES (?, ?, ?)",
+                    self._scan_files()
+                )
+                connection.execute(
+                    "PRAGMA user_version = {}".format(self.schema_version))
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+    def _scan_files(self):
+        for root, _, filenames in os.walk(self._thumbnails_dir):
+            for filename in filenames:
+                if self.is_index_file(filename):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield (
+                    self._get_key(path),
+                    stat.st_size,
+                    stat.st_mtime
+                )
+
+    def _get_key(self, path):
+        return os.path.relpath(path, self._thumbnails_dir)
+
+    def add(self, path, size, access_time):
+        """Add or update file in index.
+
+        Args:
+            path (str): Path to file.
+            size (int): Size of file.
+            access_time (float): Time of last access.
+        """
+
+        key = self._get_key(path)
+        with self._lock:
+            self._pending_access.pop(key, None)
+            connection = self._get_connection()
+            cursor = connection.execute(
+                "UPDATE files SET size = ?, last_access = ? WHERE path = ?",
+                (size, access_time, key)
+            )
+            if cursor.rowcount == 0:
+                connection.execute(
+                    "INSERT INTO files (path, size, last_access)"
+                    " VALUES (?, ?, ?)",
+                    (key, size, access_time)
+                )
+
+    def touch(self, path):
+        """Mark file as accessed now.
+
+        Args:
+            path (str): Path to file.
+        """
+
+        current_time = time.time()
+        with self._lock:
+            self._pending_access[self._get_key(path)] = current_time
+            if (
+                len(self._pending_access) >= self.max_pending_access
+                or current_time - self._last_flush > self.flush_interval
+            ):
+                self._flush()
+
+    def flush(self):
+        """Write pending access times to database."""
+
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        self._last_flush = time.time()
+        if not self._pending_access:
+            return
+        pending_access = self._pending_access
+        self._pending_access = {}
+        connection = self._get_connection()
+        connection.execute("BEGIN")
+        try:
+            for key, access_time in pending_access.items():
+                cursor = connection.execute(
+                    "UPDATE files SET last_access = ? WHERE path = ?",
+                    (access_time, key)
+                )
+                if cursor.rowcount:
+                    continue
+                # File was not created by this index
+                try:
+                    size = os.path.getsize(
+                        os.path.join(self._thumbnails_dir, key))
+                except OSError:
+                    continue
+                connection.execute(
+                    "INSERT INTO files (path, size, last_access)"
+                    " VALUES (?, ?, ?)",
+                    (key, size, access_time)
+                )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+    def get_total_size(self):
+        """Size of all indexed files.
+
+        Returns:
+            int: Size in bytes.
+        """
+
+        with self._lock:
+            return self._get_connection().execute(
+                "SELECT total_size FROM stats WHERE id = 0"
+            ).fetchone()[0]
+
+    def remove_expired(self, expire_time):
+        """Remove files which were not accessed since expire time.
+
+        Args:
+            expire_time (float): Files accessed before are removed.
+
+        Returns:
+            int: Count of removed files.
+        """
+
+        with self._lock:
+            self._flush()
+            connection = self._get_connection()
+            keys = [
+                row[0]
+                for row in connection.execute(
+                    "SELECT path FROM files WHERE last_access < ?",
+                    (expire_time, )
+                )
+            ]
+            self._remove(connection, keys)
+        return len(keys)
+
+    def remove_to_size(self, max_size):
+        """Remove least recently used files to match max size.
+
+        Args:
+            max_size (int): Max size of all files in bytes.
+
+        Returns:
+            int: Count of removed files.
+        """
+
+        with self._lock:
+            self._flush()
+            connection = self._get_connection()
+            diff = connection.execute(
+                "SELECT total_size FROM stats WHERE id = 0"
+            ).fetchone()[0] - max_size
+            if diff <= 0:
+                return 0
+
+            keys = []
+            cursor = connection.execute(
+                "SELECT path, size FROM files ORDER BY last_access")
+            while diff > 0:
+                rows = cursor.fetchmany(self.fetch_size)
+                if not rows:
+                    break
+                for key, size in rows:
+                    keys.append(key)
+                    diff -= size
+                    if diff <= 0:
+                        break
+            cursor.close()
+            self._remove(connection, keys)
+        return len(keys)
+
+    def _remove(self, connection, keys):
+        if not keys:
+            return
+        for key in keys:
+            try:
+                os.remove(os.path.join(self._thumbnails_dir, key))
+            except OSError:
+                pass
+        connection.execute("BEGIN")
+        try:
+            connection.executemany(
+                "DELETE FROM files WHERE path = ?",
+                [(key, ) for key in keys]
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+    def close(self):
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                self._flush()
+            finally:
+                self._connection.close()
+                self._connection = None
+
+
 class AYONThumbnailCache:
     """Cache of thumbnails on local storage.
 
@@ -29,10 +357,14 @@ class AYONThumbnailCache:
     Cache has cleanup mechanism which is triggered on initialized by default.
 
     The cleanup has 2 levels:
-    1. soft cleanup which remove all files that are older then 'days_alive'
-    2. max size cleanup which remove all files until the thumbnails folder
-        contains less then 'max_filesize'
-        - this is time consuming so it's not triggered automatically
+    1. soft cleanup which remove all files that were not used for
+        'days_alive'
+    2. max size cleanup which remove least recently used files until the
+        thumbnails folder contains less then 'max_filesize'
+
+    Size and last access time of files are stored in index in thumbnails
+    directory (see '_ThumbnailsIndex') so cleanup does not have to scan
+    the directory. Directory is scanned if index can't be used.
 
     Args:
         cleanup (bool): Trigger soft cleanup (Cleanup expired thumbnails).
@@ -45,12 +377,48 @@ class AYONThumbnailCache:
     # - default 2 Gb
     max_filesize = 2 * 1024 * 1024 * 1024
 
+    log = logging.getLogger("AYONThumbnailCache")
+
     def __init__(self, cleanup=True):
         self._thumbnails_dir = None
         self._days_alive_secs = self.days_alive * 24 * 60 * 60
+        self._index = None
+        self._index_failed = sqlite3 is None
+        self._index_lock = threading.Lock()
         if cleanup:
             self.cleanup()
 
+    def _get_index(self):
+        if self._index_failed:
+            return None
+        with self._index_lock:
+            if self._index is None:
+                self._index = _ThumbnailsIndex(self.get_thumbnails_dir())
+            return self._index
+
+    def _run_index_method(self, method_name, *args):
+        """Call method of index.
+
+        Index is not used anymore if it fails.
+
+        Returns:
+            tuple[bool, Any]: Index was used and result of method.
+        """
+
+        index = self._get_index()
+        if index is None:
+            return False, None
+        try:
+            return True, getattr(index, method_name)(*args)
+        except (sqlite3.Error, OSError):
+            self.log.warning(
+                "Thumbnails index failed, using file scan instead.",
+                exc_info=True
+            )
+            self._index_failed = True
+            self._index = None
+            return False, None
+
     def get_thumbnails_dir(self):
         """Root directory where thumbnails are stored.
 
@@ -80,6 +448,8 @@ class AYONThumbnailCache:
 
         for root, _, filenames in os.walk(thumbnails_dir):
             for filename in filenames:
+                if _ThumbnailsIndex.is_index_file(filename):
+                    continue
                 path = os.path.join(root, filename)
                 files_info.append(FileInfo(
                     path, os.path.getsize(path), os.path.getmtime(path)
@@ -98,6 +468,11 @@ class AYONThumbnailCache:
         """
 
         if files_info is None:
+            if not os.path.exists(self.thumbnails_dir):
+                return 0
+            used_index, size = self._run_index_method("get_total_size")
+            if used_index:
+                return size
             files_info = self.get_thumbnails_dir_file_info()
 
         if not files_info:
@@ -121,14 +496,27 @@ class AYONThumbnailCache:
         if not os.path.exists(thumbnails_dir):
             return
 
-        self._soft_cleanup(thumbnails_dir)
-        if check_max_size:
+        used_index, _ = self._run_index_method(
+            "remove_expired", time.time() - self._days_alive_secs
+        )
+        if not used_index:
+            self._soft_cleanup(thumbnails_dir)
+
+        if not check_max_size:
+            return
+
+        used_index, _ = self._run_index_method(
+            "remove_to_size", self.max_filesize
+        )
+        if not used_index:
             self._max_size_cleanup(thumbnails_dir)
 
     def _soft_cleanup(self, thumbnails_dir):
         current_time = time.time()
         for root, _, filenames in os.walk(thumbnails_dir):
             for filename in filenames:
+                if _ThumbnailsIndex.is_index_file(filename):
+                    continue
                 path = os.path.join(root, filename)
                 modification_time = os.path.getmtime(path)
                 if current_time - modification_time > self._days_alive_secs:
@@ -175,6 +563,7 @@ class AYONThumbnailCache:
                 self.thumbnails_dir, project_name, thumbnail_id + ext
             )
             if os.path.exists(filepath):
+                self._run_index_method("touch", filepath)
                 return filepath
         return None
 
@@ -225,5 +614,20 @@ class AYONThumbnailCache:
 
         current_time = time.time()
         os.utime(thumbnail_path, (current_time, current_time))
+        self._run_index_method(
+            "add", thumbnail_path, len(content), current_time
+        )
 
         return thumbnail_path
+
+    def flush(self):
+        """Write pending access times of thumbnails to index."""
+
+        self._run_index_method("flush")
+
+    def close(self):
+        """Write pending changes and close index."""
+
+        if self._index is not None:
+            self._run_index_method("close")
+            self._index = None
@@ -2,6 +2,8 @@ import os
 import sys
 import copy
 import json
+import time
+import uuid
 import tempfile
 import platform
 import collections
@@ -16,20 +18,20 @@ from openpype.client import get_asset_name_identifier
 from openpype.settings import (
     get_system_settings,
     get_project_settings,
-    get_local_settings
+    get_local_settings,
+    get_local_settings_revision,
+    save_settings_snapshot,
 )
 from openpype.settings.constants import (
     METADATA_KEYS,
-    M_DYNAMIC_KEY_LABEL
+    M_DYNAMIC_KEY_LABEL,
+    SETTINGS_SNAPSHOT_ENV_KEY,
 )
 from .log import Logger
 from .profiles_filtering import filter_profiles
 from .local_settings import get_openpype_username
 
-from .python_module_tools import (
-    modules_from_path,
-    classes_from_module
-)
+from .python_module_tools import PathModulesCache
 from .execute import (
     find_executable,
     get_linux_launcher_args
@@ -389,6 +391,9 @@ class ApplicationManager:
             using different settings.
     """
 
+    # Max count of cached launch environments
+    environments_cache_size = 20
+
     def __init__(self, system_settings=None):
         self.log = Logger.get_logger(self.__class__.__name__)
 
@@ -399,6 +404,9 @@ class ApplicationManager:
 
         self._system_settings = system_settings
 
+        # Prepared environments of applications and tools
+        self._environments_cache = collections.OrderedDict()
+
         self.refresh()
 
     def set_system_settings(self, system_settings):
@@ -416,6 +424,7 @@ class ApplicationManager:
         self.applications.clear()
         self.tool_groups.clear()
         self.tools.clear()
+        self._environments_cache.clear()
 
         if self._system_settings is not None:
             settings = copy.deepcopy(self._system_settings)
@@ -486,6 +495,30 @@ class ApplicationManager:
             for tool in group:
                 self.tools[tool.full_name] = tool
 
+    def get_cached_environments(self, key):
+        """Environments prepared for application launch with same inputs.
+
+        Cache is cleared on refresh when settings may have changed.
+
+        Args:
+            key (str): Key of inputs used to prepare environments.
+
+        Returns:
+            Union[tuple[dict[str, str], set[str]], None]: Environments to
+                set and keys to remove or 'None' if are not cached.
+        """
+
+        cached = self._environments_cache.get(key)
+        if cached is None:
+            return None
+        env, keys_to_remove = cached
+        return dict(env), set(keys_to_remove)
+
+    def cache_environments(self, key, env, keys_to_remove):
+        self._environments_cache[key] = (dict(env), set(keys_to_remove))
+        while len(self._environments_cache) > self.environments_cache_size:
+            self._environments_cache.popitem(last=False)
+
     def find_latest_available_variant_for_group(self, group_name):
         group = self.app_groups.get(group_name)
         if group is None or not group.enabled:
@@ -908,6 +941,36 @@ class PostLaunchHook(LaunchHook):
     """
 
 
+# Imported launch hook files, imported again only when they change
+_LAUNCH_HOOKS_CACHE = PathModulesCache()
+
+
+def _get_launch_hook_classes(path):
+    """Prelaunch and postlaunch hook classes from directory.
+
+    Args:
+        path (str): Path to directory with launch hooks.
+
+    Returns:
+        tuple[list[type], list[type]]: Prelaunch and postlaunch hook
+            classes.
+    """
+
+    prelaunch_classes = []
+    postlaunch_classes = []
+    file_items, _crashed = _LAUNCH_HOOKS_CACHE.get_file_items(path)
+    for file_item in file_items:
+        prelaunch_classes.extend(file_item.get_classes(PreLaunchHook))
+        postlaunch_classes.extend(file_item.get_classes(PostLaunchHook))
+    return prelaunch_classes, postlaunch_classes
+
+
+def clear_launch_hooks_cache():
+    """Force import of launch hooks on next discovery."""
+
+    _LAUNCH_HOOKS_CACHE.clear()
+
+
 class ApplicationLaunchContext:
     """Context of launching application.
 
@@ -1023,6 +1086,9 @@ class ApplicationLaunchContext:
         self.process = None
         self._prelaunch_hooks_executed = False
 
+        # Durations of launch hooks execution in seconds
+        self.hooks_durations = collections.OrderedDict()
+
     @property
     def env(self):
         if (
@@ -1167,14 +1233,11 @@ class ApplicationLaunchContext:
                 )
                 continue
 
-            modules, _crashed = modules_from_path(path)
-            for _filepath, module in modules:
-                all_classes["pre"].extend(
-                    classes_from_module(PreLaunchHook, module)
-                )
-                all_classes["post"].extend(
-                    classes_from_module(PostLaunchHook, module)
-                )
+            prelaunch_classes, postlaunch_classes = (
+                _get_launch_hook_classes(path)
+            )
+            all_classes["pre"].extend(prelaunch_classes)
+            all_classes["post"].extend(postlaunch_classes)
 
         for launch_type, classes in all_classes.items():
             hooks_with_order = []
@@ -1309,9 +1372,25 @@ class ApplicationLaunchContext:
             self.log.debug("Executing prelaunch hook: {}".format(
                 str(prelaunch_hook.__class__.__name__)
             ))
-            prelaunch_hook.execute()
+            start = time.time()
+            try:
+                prelaunch_hook.execute()
+            finally:
+                self._add_hook_duration(prelaunch_hook, start)
         self._prelaunch_hooks_executed = True
 
+        self.log.debug("Prelaunch hooks took {:.3f}s".format(
+            sum(self.hooks_durations.values())
+        ))
+
+    def _add_hook_duration(self, hook, start):
+        duration = time.time() - start
+        hook_name = hook.__class__.__name__
+        self.hooks_durations[hook_name] = duration
+        self.log.debug("Launch hook {} took {:.3f}s".format(
+            hook_name, duration
+        ))
+
     def launch(self):
         """Collect data for new process and then create it.
 
@@ -1343,6 +1422,8 @@ class ApplicationLaunchContext:
         )
         self.launch_args = args
 
+        self._prepare_settings_snapshot()
+
         # Run process
         self.process = self._run_process()
 
@@ -1354,6 +1435,7 @@ class ApplicationLaunchContext:
 
             # TODO how to handle errors?
             # - store to variable to let them accessible?
+            start = time.time()
             try:
                 postlaunch_hook.execute()
 
@@ -1362,6 +1444,7 @@ class ApplicationLaunchContext:
                     "After launch procedures were not successful.",
                     exc_info=True
                 )
+            self._add_hook_duration(postlaunch_hook, start)
 
         self.log.debug("Launch of {} finished.".format(
             self.application.full_name
@@ -1369,6 +1452,56 @@ class ApplicationLaunchContext:
 
         return self.process
 
+    def _prepare_settings_snapshot(self):
+        """Store resolved settings for launched process.
+
+        Launched process uses settings from the snapshot instead of resolving
+        them again, until any of used overrides change. Snapshot inherited
+        from current process is never passed to the launched process.
+
+        Snapshot file is removed by launched process once it is loaded.
+        Files which were not loaded (e.g. process crashed on start) are
+        removed on next launch when they're older than a day.
+        """
+
+        self.env.pop(SETTINGS_SNAPSHOT_ENV_KEY, None)
+        project_name = self.data.get("project_name")
+        project_names = []
+        if project_name:
+            project_names.append(project_name)
+
+        dirpath = os.path.join(tempfile.gettempdir(), "openpype_settings")
+        self._remove_outdated_settings_snapshots(dirpath)
+        filepath = os.path.join(
+            dirpath,
+            "{}_{}.json".format(
+                project_name or "system", uuid.uuid4().hex
+            )
+        )
+        try:
+            self.env.update(save_settings_snapshot(
+                filepath, project_names, remove_after_load=True
+            ))
+        except Exception:
+            self.log.warning(
+                "Failed to store settings snapshot.", exc_info=True
+            )
+
+    def _remove_outdated_settings_snapshots(self, dirpath):
+        if not os.path.isdir(dirpath):
+            return
+
+        min_mtime = time.time() - (60 * 60 * 24)
+        for filename in os.listdir(dirpath):
+            path = os.path.join(dirpath, filename)
+            try:
+                if os.path.getmtime(path) < min_mtime:
+                    os.remove(path)
+            except OSError:
+                self.log.debug(
+                    "Failed to remove settings snapshot \"{}\"".format(path)
+                )
+
     @staticmethod
     def clear_launch_args(args):
         """Collect launch arguments to final order.
@@ -1540,37 +1673,10 @@ def prepare_app_environments(
         data (EnvironmentPrepData): Dictionary where result and intermediate
             result will be stored.
     """
-    import acre
-
     app = data["app"]
     log = data["log"]
     source_env = data["env"].copy()
 
-    if modules_manager is None:
-        from openpype.modules import ModulesManager
-
-        modules_manager = ModulesManager()
-
-    _add_python_version_paths(app, source_env, log, modules_manager)
-
-    # Use environments from local settings
-    filtered_local_envs = {}
-    system_settings = data["system_settings"]
-    whitelist_envs = system_settings["general"].get("local_env_white_list")
-    if whitelist_envs:
-        local_settings = get_local_settings()
-        local_envs = local_settings.get("environments") or {}
-        filtered_local_envs = {
-            key: value
-            for key, value in local_envs.items()
-            if key in whitelist_envs
-        }
-
-    # Apply local environment variables for already existing values
-    for key, value in filtered_local_envs.items():
-        if key in source_env:
-            source_env[key] = value
-
     # `app_and_tool_labels` has debug purpose
     app_and_tool_labels = [app.full_name]
     # Environments for application
@@ -1606,6 +1712,65 @@ def prepare_app_environments(
         )
     )
 
+    system_settings = data["system_settings"]
+    whitelist_envs = system_settings["general"].get("local_env_white_list")
+    local_settings_revision = None
+    if whitelist_envs:
+        local_settings_revision = get_local_settings_revision()
+
+    # Same inputs lead to same environments so result of previous launch
+    #   can be used
+    # - lookup happens before modules and local settings are used
+    # - modules can't change without refresh of application manager which
+    #   clears the cache
+    cache_key = None
+    if not whitelist_envs or local_settings_revision is not None:
+        cache_key = json.dumps(
+            [
+                app_and_tool_labels,
+                env_group,
+                implementation_envs,
+                whitelist_envs,
+                local_settings_revision,
+                source_env,
+            ],
+            sort_keys=True,
+            default=str
+        )
+        cached = app.manager.get_cached_environments(cache_key)
+        if cached is not None:
+            log.debug("Using cached application environments.")
+            final_env, keys_to_remove = cached
+            data["env"].update(final_env)
+            for key in keys_to_remove:
+                data["env"].pop(key, None)
+            return
+
+    import acre
+
+    if modules_manager is None:
+        from openpype.modules import ModulesManager
+
+        modules_manager = ModulesManager()
+
+    _add_python_version_paths(app, source_env, log, modules_manager)
+
+    # Use environments from local settings
+    filtered_local_envs = {}
+    if whitelist_envs:
+        local_settings = get_local_settings()
+        local_envs = local_settings.get("environments") or {}
+        filtered_local_envs = {
+            key: value
+            for key, value in local_envs.items()
+            if key in whitelist_envs
+        }
+
+    # Apply local environment variables for already existing values
+    for key, value in filtered_local_envs.items():
+        if key in source_env:
+            source_env[key] = value
+
     env_values = {}
     for _env_values in environments:
         if not _env_values:
@@ -1648,6 +1813,8 @@ def prepare_app_environments(
         final_env = loaded_env
 
     keys_to_remove = set(source_env.keys()) - set(final_env.keys())
+    if cache_key is not None:
+        app.manager.cache_environments(cache_key, final_env, keys_to_remove)
 
     # Update env
     data["env"].update(final_env)
@@ -2,15 +2,13 @@ import os
 import logging
 import sys
 import errno
+import hashlib
+import threading
+import concurrent.futures
 import six
 
-from openpype.lib import create_hard_link
-
-# this is needed until speedcopy for linux is fixed
-if sys.platform == "win32":
-    from speedcopy import copyfile
-else:
-    from shutil import copyfile
+from openpype.lib import create_hard_link, copy_file
+from openpype.lib.path_tools import COPY_STRATEGY_COPY
 
 
 class DuplicateDestinationError(ValueError):
@@ -47,19 +45,76 @@ class FileTransaction(object):
         permissions could be changed, other machines could be moving or writing
         files. A lot can happen.
 
+    Transfers can be processed in parallel when 'max_workers' is higher
+    than 1. Number of concurrent transfers to a single destination volume
+    can be limited with 'max_workers_per_volume'. Rollback works the same
+    way in both modes, only files that were completely transferred are
+    removed.
+
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (Optional[logging.Logger]): Logger used for logging.
+        allow_queue_replacements (Optional[bool]): Allow replacement of
+            queued transfer to the same destination.
+        max_workers (Optional[int]): Number of concurrent transfers.
+        max_workers_per_volume (Optional[int]): Maximum number of concurrent
+            transfers to one destination volume. Not limited if is '0' or
+            'None'.
+        progress_callback (Optional[Callable[[int, int, int, int], None]]):
+            Called after each transferred file with transferred files count,
+            total files count, transferred bytes and total bytes.
+        checksum_algorithm (Optional[str]): Name of hashlib algorithm used
+            to calculate checksum of copied files. Checksum is calculated
+            during copy from the data which are written to destination.
+        copy_strategies (Optional[Iterable[str]]): Names of copy strategies
+            that can be used for copy (see 'copy_file'). All registered
+            strategies are used if not passed.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
-
-    def __init__(self, log=None, allow_queue_replacements=False):
+    # Hardlink if source and destination are on same volume, copy otherwise
+    MODE_HARDLINK_OR_COPY = 2
+
+    # Size of chunk used when copying with checksum
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        log=None,
+        allow_queue_replacements=False,
+        max_workers=1,
+        max_workers_per_volume=None,
+        progress_callback=None,
+        checksum_algorithm=None,
+        copy_strategies=None,
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
         self.log = log
 
+        if checksum_algorithm:
+            # Validate algorithm name early
+            hashlib.new(checksum_algorithm)
+
+        self._max_workers = max(1, max_workers or 1)
+        self._max_workers_per_volume = max_workers_per_volume or None
+        self._progress_callback = progress_callback
+        self._checksum_algorithm = checksum_algorithm
+        self._copy_strategies = copy_strategies
+
+        # Checksums of copied files by destination path
+        self._checksums = {}
+        # Used copy strategy and size of transferred files by destination
+        self._strategies_by_dst = {}
+        # Lock for shared data used by parallel transfers
+        self._lock = threading.Lock()
+        self._semaphores_by_volume = {}
+        self._volume_by_dirname = {}
+
         # The transfer queue
         # todo: make this an actual FIFO queue?
         self._transfers = {}
@@ -78,7 +133,8 @@ class FileTransaction(object):
         Args:
             src (str): Source path.
             dst (str): Destination path.
-            mode (MODE_COPY, MODE_HARDLINK): Transfer mode.
+            mode (MODE_COPY, MODE_HARDLINK, MODE_HARDLINK_OR_COPY): Transfer
+                mode.
         """
 
         opts = {"mode": mode}
@@ -110,41 +166,203 @@ class FileTransaction(object):
         self._transfers[dst] = (src, opts)
 
     def process(self):
+        transfers = list(self._transfers.items())
+        if self._max_workers > 1 and len(transfers) > 1:
+            self._process_parallel(transfers)
+            return
+
         # Backup any existing files
-        for dst, (src, _) in self._transfers.items():
-            self.log.debug("Checking file ... {} -> {}".format(src, dst))
-            path_same = self._same_paths(src, dst)
-            if path_same or not os.path.exists(dst):
-                continue
+        same_by_dst = {}
+        sizes_by_dst = {}
+        for dst, (src, _) in transfers:
+            same_by_dst[dst], sizes_by_dst[dst] = self._backup_file(src, dst)
 
-            # Backup original file
-            # todo: add timestamp or uuid to ensure unique
-            backup = dst + ".bak"
-            self._backup_to_original[backup] = dst
-            self.log.debug(
-                "Backup existing file: {} -> {}".format(dst, backup))
-            os.rename(dst, backup)
+        total_bytes = sum(sizes_by_dst.values())
+        progress = _TransferProgress(len(transfers), total_bytes)
 
         # Copy the files to transfer
-        for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
+        for dst, (src, opts) in transfers:
+            if same_by_dst[dst]:
                 self.log.debug(
                     "Source and destination are same files {} -> {}".format(
                         src, dst))
+            else:
+                self._transfer_file(src, dst, opts, sizes_by_dst[dst])
+            self._report_progress(progress, sizes_by_dst[dst])
+
+    def _process_parallel(self, transfers):
+        self.log.debug(
+            "Processing {} transfers with {} workers".format(
+                len(transfers), self._max_workers))
+        with concurrent.futures.ThreadPoolExecutor(
+            self._max_workers
+        ) as executor:
+            # Backup any existing files
+            backup_results = self._run_in_executor(
+                executor,
+                [
+                    (self._backup_file, src, dst)
+                    for dst, (src, _) in transfers
+                ]
+            )
+            total_bytes = sum(size for _, size in backup_results)
+            progress = _TransferProgress(len(transfers), total_bytes)
+
+            # Copy the files to transfer
+            jobs = []
+            for (dst, (src, opts)), (path_same, size) in zip(
+                transfers, backup_results
+            ):
+                if path_same:
+                    self.log.debug((
+                        "Source and destination are same files {} -> {}"
+                    ).format(src, dst))
+                    self._report_progress(progress, size)
+                    continue
+                jobs.append((
+                    self._transfer_file_with_progress,
+                    src, dst, opts, progress, size
+                ))
+            self._run_in_executor(executor, jobs)
+
+    def _run_in_executor(self, executor, jobs):
+        """Run jobs in executor and return results in order of jobs.
+
+        Jobs that did not start yet are cancelled on first error, the
+        running jobs are finished and the first error is raised.
+        """
+        futures = [executor.submit(*job) for job in jobs]
+        done, not_done = concurrent.futures.wait(
+            futures, return_when=concurrent.futures.FIRST_EXCEPTION
+        )
+        if not_done:
+            for future in not_done:
+                future.cancel()
+            concurrent.futures.wait(not_done)
+
+        output = []
+        for future in futures:
+            if future.cancelled():
                 continue
+            output.append(future.result())
+        return output
 
-            self._create_folder_for_file(dst)
-
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
-                    src, dst))
-                create_hard_link(src, dst)
+    def _backup_file(self, src, dst):
+        """Backup existing destination file.
 
+        Returns:
+            tuple[bool, int]: Source and destination are same files and
+                size of source file.
+        """
+        self.log.debug("Checking file ... {} -> {}".format(src, dst))
+        src_stat = self._get_stat(src)
+        dst_stat = self._get_stat(dst)
+        size = src_stat.st_size if src_stat is not None else 0
+        if src_stat is not None and dst_stat is not None:
+            # handles same paths but with C:/project vs c:/project
+            path_same = src_stat == dst_stat
+        else:
+            path_same = src == dst
+
+        if path_same or dst_stat is None:
+            return path_same, size
+
+        # Backup original file
+        # todo: add timestamp or uuid to ensure unique
+        backup = dst + ".bak"
+        self.log.debug(
+            "Backup existing file: {} -> {}".format(dst, backup))
+        os.rename(dst, backup)
+        with self._lock:
+            self._backup_to_original[backup] = dst
+        return path_same, size
+
+    def _transfer_file_with_progress(self, src, dst, opts, progress, size):
+        semaphore = self._get_volume_semaphore(dst)
+        if semaphore is None:
+            self._transfer_file(src, dst, opts, size)
+        else:
+            with semaphore:
+                self._transfer_file(src, dst, opts, size)
+        self._report_progress(progress, size)
+
+    def _transfer_file(self, src, dst, opts, size):
+        self._create_folder_for_file(dst)
+
+        strategy = None
+        if opts["mode"] == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            if self._checksum_algorithm:
+                checksum = self._copy_with_checksum(src, dst)
+                strategy = COPY_STRATEGY_COPY
+                with self._lock:
+                    self._checksums[dst] = checksum
+            else:
+                strategy = copy_file(src, dst, self._copy_strategies)
+        elif opts["mode"] == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            strategy = create_hard_link(src, dst)
+        elif opts["mode"] == self.MODE_HARDLINK_OR_COPY:
+            self.log.debug("Hardlinking or copying file ... {} -> {}".format(
+                src, dst))
+            strategy = create_hard_link(src, dst, fallback_to_copy=True)
+
+        with self._lock:
             self._transferred.append(dst)
+            self._strategies_by_dst[dst] = (strategy, size)
+
+    def _copy_with_checksum(self, src, dst):
+        """Copy file and calculate checksum of data in one read pass."""
+        file_hash = hashlib.new(self._checksum_algorithm)
+        with open(src, "rb") as src_stream:
+            with open(dst, "wb") as dst_stream:
+                while True:
+                    chunk = src_stream.read(self.CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    file_hash.update(chunk)
+                    dst_stream.write(chunk)
+        return file_hash.hexdigest()
+
+    def _report_progress(self, progress, size):
+        if self._progress_callback is None:
+            return
+        with self._lock:
+            progress.files_done += 1
+            progress.bytes_done += size
+            args = (
+                progress.files_done,
+                progress.files_total,
+                progress.bytes_done,
+                progress.bytes_total
+            )
+        try:
+            self._progress_callback(*args)
+        except Exception:
+            self.log.warning(
+                "Failed to report transfer progress", exc_info=True)
+
+    def _get_volume_semaphore(self, dst):
+        if not self._max_workers_per_volume:
+            return None
+
+        dirname = os.path.dirname(dst)
+        with self._lock:
+            volume = self._volume_by_dirname.get(dirname)
+        if volume is None:
+            self._create_folder_for_file(dst)
+            volume = os.stat(dirname).st_dev
+            with self._lock:
+                self._volume_by_dirname[dirname] = volume
+
+        with self._lock:
+            semaphore = self._semaphores_by_volume.get(volume)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(
+                    self._max_workers_per_volume)
+                self._semaphores_by_volume[volume] = semaphore
+        return semaphore
 
     def finalize(self):
         # Delete any backed up files
@@ -195,6 +413,41 @@ class FileTransaction(object):
         """Return the backup file paths"""
         return list(self._backup_to_original.keys())
 
+    @property
+    def checksums(self):
+        """Return checksums of copied files by destination path.
+
+        Checksums are available only if 'checksum_algorithm' is set. Hard
+        linked files don't have checksums.
+        """
+        return dict(self._checksums)
+
+    @property
+    def transfer_strategies(self):
+        """Return name of strategy used for transfer by destination path.
+
+        Strategy is 'hardlink' for hardlinked files and name of copy
+        strategy (e.g. 'reflink', 'copy_file_range', 'copy') for copies.
+        """
+        return {
+            dst: strategy
+            for dst, (strategy, _) in self._strategies_by_dst.items()
+        }
+
+    def get_transfer_stats(self):
+        """Count of files and bytes transferred by each strategy.
+
+        Returns:
+            dict[str, dict[str, int]]: Stats by strategy name with keys
+                'files' and 'bytes'.
+        """
+        output = {}
+        for strategy, size in self._strategies_by_dst.values():
+            stats = output.setdefault(strategy, {"files": 0, "bytes": 0})
+            stats["files"] += 1
+            stats["bytes"] += size
+        return output
+
     def _create_folder_for_file(self, path):
         dirname = os.path.dirname(path)
         try:
@@ -206,9 +459,18 @@ class FileTransaction(object):
                 self.log.critical("An unexpected error occurred.")
                 six.reraise(*sys.exc_info())
 
-    def _same_paths(self, src, dst):
-        # handles same paths but with C:/project vs c:/project
-        if os.path.exists(src) and os.path.exists(dst):
-            return os.stat(src) == os.stat(dst)
+    def _get_stat(self, path):
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+
+class _TransferProgress(object):
+    """Progress of transfers used for progress callback."""
 
-        return src == dst
+    def __init__(self, files_total, bytes_total):
+        self.files_total = files_total
+        self.bytes_total = bytes_total
+        self.files_done = 0
+        self.bytes_done = 0
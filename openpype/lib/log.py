@@ -23,6 +23,8 @@ import time
 import traceback
 import threading
 import copy
+import atexit
+import collections
 
 from openpype import AYON_SERVER_ENABLED
 from openpype.client.mongo import (
@@ -182,6 +184,184 @@ class MongoFormatter(logging.Formatter):
         return document
 
 
+class MongoLogShipper(object):
+    """Insert log documents to mongo in batches from background thread.
+
+    Documents are stored to bounded buffer and inserted with 'insert_many'.
+    When buffer is full the 'overflow_policy' defines what happens:
+    - "drop_oldest": oldest waiting document is dropped
+    - "drop_newest": new document is dropped
+    - "block": caller waits until there is space in the buffer
+
+    Args:
+        collection (pymongo.collection.Collection): Logs collection.
+        buffer_size (int): Maximum count of waiting documents.
+        batch_size (int): Maximum count of documents in one insert.
+        flush_interval (float): Seconds between inserts of not full batches.
+        overflow_policy (str): What happens when buffer is full.
+    """
+
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+    BLOCK = "block"
+
+    def __init__(
+        self,
+        collection,
+        buffer_size=10000,
+        batch_size=500,
+        flush_interval=1.0,
+        overflow_policy=DROP_OLDEST
+    ):
+        if overflow_policy not in (
+            self.DROP_OLDEST, self.DROP_NEWEST, self.BLOCK
+        ):
+            raise ValueError(
+                "Unknown overflow policy \"{}\"".format(overflow_policy)
+            )
+        self._collection = collection
+        self._buffer_size = max(int(buffer_size), 1)
+        self._batch_size = min(max(int(batch_size), 1), self._buffer_size)
+        self._flush_interval = flush_interval
+        self._overflow_policy = overflow_policy
+
+        self._queue = collections.deque()
+        self._condition = threading.Condition()
+        # Only one thread is inserting at a time to keep order of records
+        self._insert_lock = threading.Lock()
+        self._thread = None
+        self._stopped = False
+
+        self.shipped_count = 0
+        self.dropped_count = 0
+        self.failed_count = 0
+
+    def get_metrics(self):
+        """Counters of processed documents.
+
+        Returns:
+            dict[str, int]: Count of shipped, dropped (buffer overflow),
+                failed (insert failed) and pending documents.
+        """
+        return {
+            "shipped": self.shipped_count,
+            "dropped": self.dropped_count,
+            "failed": self.failed_count,
+            "pending": len(self._queue),
+        }
+
+    def put(self, document):
+        """Add document to buffer."""
+        with self._condition:
+            if self._stopped:
+                self.dropped_count += 1
+                return
+
+            while len(self._queue) >= self._buffer_size:
+                if self._overflow_policy == self.DROP_NEWEST:
+                    self.dropped_count += 1
+                    return
+
+                if self._overflow_policy == self.DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped_count += 1
+                    break
+
+                self._condition.notify_all()
+                self._condition.wait(self._flush_interval)
+                if self._stopped:
+                    self.dropped_count += 1
+                    return
+
+            self._queue.append(document)
+            if len(self._queue) >= self._batch_size:
+                self._condition.notify_all()
+
+        if self._thread is None:
+            self._start_thread()
+
+    def flush(self):
+        """Insert all waiting documents in current thread."""
+        with self._insert_lock:
+            while self._ship_batch():
+                pass
+
+    def stop(self):
+        """Stop background thread and insert waiting documents."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(self._flush_interval * 2)
+        self.flush()
+
+    def _start_thread(self):
+        with self._condition:
+            if self._thread is not None:
+                return
+            thread = threading.Thread(
+                target=self._run, name="MongoLogShipper"
+            )
+            thread.daemon = True
+            self._thread = thread
+        thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if (
+                    not self._stopped
+                    and len(self._queue) < self._batch_size
+                ):
+                    self._condition.wait(self._flush_interval)
+                stopped = self._stopped
+
+            self.flush()
+            if stopped:
+                return
+
+    def _ship_batch(self):
+        with self._condition:
+            if not self._queue:
+                return False
+            batch = []
+            while self._queue and len(batch) < self._batch_size:
+                batch.append(self._queue.popleft())
+            # Wake up callers waiting for space in buffer
+            self._condition.notify_all()
+
+        try:
+            self._collection.insert_many(batch, ordered=False)
+            self.shipped_count += len(batch)
+        except Exception:
+            self.failed_count += len(batch)
+        return True
+
+
+class QueuedMongoHandler(MongoHandler):
+    """Mongo handler which does not insert records in emitting thread.
+
+    Records are formatted in emitting thread and passed to shared
+    'MongoLogShipper' which inserts them in batches.
+    """
+
+    shipper = None
+
+    def emit(self, record):
+        shipper = self.shipper
+        if shipper is None:
+            return
+        try:
+            document = self.format(record)
+        except Exception:
+            if not self.fail_silently:
+                self.handleError(record)
+            return
+        shipper.put(document)
+
+
 class Logger:
     DFT = '%(levelname)s >>> { %(name)s }: [ %(message)s ] '
     DBG = "  - { %(name)s }: [ %(message)s ] "
@@ -224,6 +404,13 @@ class Logger:
     process_data = None
     # Cached process name or ability to set different process name
     _process_name = None
+    # Shared background inserter of mongo log records
+    _mongo_log_shipper = None
+    # Options of mongo log shipper
+    log_buffer_size = 10000
+    log_batch_size = 500
+    log_flush_interval = 1.0
+    log_overflow_policy = MongoLogShipper.DROP_OLDEST
 
     @classmethod
     def get_logger(cls, name=None, _host=None):
@@ -300,7 +487,45 @@ class Logger:
         if components["auth_db"]:
             kwargs["authentication_db"] = components["auth_db"]
 
-        return MongoHandler(**kwargs)
+        handler = QueuedMongoHandler(**kwargs)
+        handler.shipper = cls._get_mongo_log_shipper(handler.collection)
+        return handler
+
+    @classmethod
+    def _get_mongo_log_shipper(cls, collection):
+        if collection is None:
+            return None
+
+        if cls._mongo_log_shipper is None:
+            shipper = MongoLogShipper(
+                collection,
+                buffer_size=cls.log_buffer_size,
+                batch_size=cls.log_batch_size,
+                flush_interval=cls.log_flush_interval,
+                overflow_policy=cls.log_overflow_policy
+            )
+            # Insert waiting records when process ends
+            atexit.register(shipper.stop)
+            cls._mongo_log_shipper = shipper
+        return cls._mongo_log_shipper
+
+    @classmethod
+    def flush_mongo_logs(cls):
+        """Insert all waiting log records to mongo."""
+        if cls._mongo_log_shipper is not None:
+            cls._mongo_log_shipper.flush()
+
+    @classmethod
+    def get_mongo_log_metrics(cls):
+        """Counters of shipped and dropped mongo log records.
+
+        Returns:
+            Union[dict[str, int], None]: Metrics or None if mongo logging
+                is not used.
+        """
+        if cls._mongo_log_shipper is None:
+            return None
+        return cls._mongo_log_shipper.get_metrics()
 
     @classmethod
     def _get_console_handler(cls):
@@ -38,6 +38,14 @@ def merge_dict(main_dict, enhance_dict):
     return main_dict
 
 
+def _copy_nested_dicts(data):
+    """Copy dictionary and all nested dictionaries, other values are kept."""
+    return {
+        key: _copy_nested_dicts(value) if isinstance(value, dict) else value
+        for key, value in data.items()
+    }
+
+
 class TemplateMissingKey(Exception):
     """Exception for cases when key does not exist in template."""
 
@@ -182,6 +190,115 @@ class StringTemplate(object):
         result.validate()
         return result
 
+    def format_many(self, data, varying_key, values):
+        """Format template multiple times where only one key is changing.
+
+        Useful for sequences where only '{frame}' or '{udim}' differs
+        between formatted paths. Parts of template which do not use
+        the varying key are solved only once and only the varying parts
+        are formatted for each value. Output is the same as calling
+        'format' for each value.
+
+        Template parts are formatted one by one when the varying key is
+        used in optional part or as sub-dictionary key.
+
+        Args:
+            data (dict): Containing keys to be filled into template.
+            varying_key (str): Key in data which is changing.
+            values (Iterable[Any]): Values of varying key.
+
+        Returns:
+            list[TemplateResult]: Results in order of passed values.
+        """
+
+        data = dict(data)
+        varying_parts = []
+        for part in self._parts:
+            if isinstance(part, OptionalPart):
+                if varying_key in part.get_root_keys():
+                    varying_parts = None
+                    break
+
+            elif (
+                isinstance(part, FormattingPart)
+                and part.root_key == varying_key
+            ):
+                if not part.is_simple_key:
+                    varying_parts = None
+                    break
+                varying_parts.append(part)
+
+        if varying_parts is None:
+            output = []
+            for value in values:
+                data[varying_key] = value
+                output.append(self.format(data))
+            return output
+
+        data.pop(varying_key, None)
+        # Solve invariant parts and remember where varying parts are placed
+        base_result = TemplatePartResult()
+        output_chunks = []
+        last_idx = 0
+        for part in self._parts:
+            if isinstance(part, six.string_types):
+                base_result.add_output(part)
+            elif part in varying_parts:
+                output_len = len(base_result.output)
+                output_chunks.append(base_result.output[last_idx:output_len])
+                last_idx = output_len
+            else:
+                part.format(data, base_result)
+        output_chunks.append(base_result.output[last_idx:])
+
+        base_invalid_types = dict(base_result.invalid_types)
+        base_invalid_types.update(base_result.invalid_optional_types)
+        base_missing_keys = (
+            base_result.missing_keys | base_result.missing_optional_keys
+        )
+        base_solved = base_result.solved
+        base_used_values = base_result.get_clean_used_values()
+
+        output = []
+        for value in values:
+            varying_data = {varying_key: value}
+            result = TemplatePartResult()
+            chunks = [output_chunks[0]]
+            for part, chunk in zip(varying_parts, output_chunks[1:]):
+                output_len = len(result.output)
+                part.format(varying_data, result)
+                chunks.append(result.output[output_len:])
+                chunks.append(chunk)
+
+            invalid_types = dict(base_invalid_types)
+            invalid_types.update(result.invalid_types)
+            invalid_types.update(result.invalid_optional_types)
+            if invalid_types:
+                invalid_types = result.split_keys_to_subdicts(invalid_types)
+
+            used_values = _copy_nested_dicts(base_used_values)
+            used_values.update(result.get_clean_used_values())
+
+            output.append(TemplateResult(
+                "".join(chunks),
+                self.template,
+                base_solved and result.solved,
+                used_values,
+                (
+                    base_missing_keys
+                    | result.missing_keys
+                    | result.missing_optional_keys
+                ),
+                invalid_types
+            ))
+        return output
+
+    def format_strict_many(self, *args, **kwargs):
+        results = self.format_many(*args, **kwargs)
+        for result in results:
+            result.validate()
+        return results
+
     @classmethod
     def format_template(cls, template, data):
         objected_template = cls(template)
@@ -703,11 +820,38 @@ class FormattingPart:
     """
     def __init__(self, template):
         self._template = template
+        # Pre-parse key so regex matching is not done on each format
+        key = template[1:-1]
+        existence_check = key
+        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
+        if key_padding:
+            existence_check = key_padding[0]
+        self._key = key
+        self._existence_check = existence_check
+        self._key_subdict = tuple(SUB_DICT_PATTERN.findall(existence_check))
 
     @property
     def template(self):
         return self._template
 
+    @property
+    def root_key(self):
+        """First key of formatting key e.g. 'project' for '{project[name]}'.
+
+        Returns:
+            Union[str, None]: Root key or None if key is empty.
+        """
+
+        if self._key_subdict:
+            return self._key_subdict[0]
+        return None
+
+    @property
+    def is_simple_key(self):
+        """Key does not expect sub-dictionary e.g. '{frame:0>4}'."""
+
+        return len(self._key_subdict) == 1
+
     def __repr__(self):
         return "<Format:{}>".format(self._template)
 
@@ -732,17 +876,14 @@ class FormattingPart:
             data(dict): Data that should be used for formatting.
             result(TemplatePartResult): Object where result is stored.
         """
-        key = self.template[1:-1]
+        key = self._key
         if key in result.realy_used_values:
             result.add_output(result.realy_used_values[key])
             return result
 
         # check if key expects subdictionary keys (e.g. project[name])
-        existence_check = key
-        key_padding = list(KEY_PADDING_PATTERN.findall(existence_check))
-        if key_padding:
-            existence_check = key_padding[0]
-        key_subdict = list(SUB_DICT_PATTERN.findall(existence_check))
+        existence_check = self._existence_check
+        key_subdict = self._key_subdict
 
         value = data
         missing_key = False
@@ -829,6 +970,21 @@ class OptionalPart:
     def __repr__(self):
         return "<Optional:{}>".format("".join([str(p) for p in self._parts]))
 
+    def get_root_keys(self):
+        """Root keys of all formatting parts, including nested optionals.
+
+        Returns:
+            set[str]: Root keys used in the optional part.
+        """
+
+        output = set()
+        for part in self._parts:
+            if isinstance(part, OptionalPart):
+                output |= part.get_root_keys()
+            elif isinstance(part, FormattingPart):
+                output.add(part.root_key)
+        return output
+
     def format(self, data, result):
         new_result = TemplatePartResult(True)
         for part in self._parts:
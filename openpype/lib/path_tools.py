@@ -1,5 +1,8 @@
 import os
 import re
+import sys
+import errno
+import shutil
 import logging
 import platform
 
@@ -7,6 +10,42 @@ import clique
 
 log = logging.getLogger(__name__)
 
+COPY_STRATEGY_HARDLINK = "hardlink"
+COPY_STRATEGY_REFLINK = "reflink"
+COPY_STRATEGY_COPY_FILE_RANGE = "copy_file_range"
+COPY_STRATEGY_SENDFILE = "sendfile"
+COPY_STRATEGY_COPY = "copy"
+
+# Errors which mean that copy strategy is not supported for source and
+#   destination, next strategy should be used
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.EBADF,
+    errno.EOPNOTSUPP,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+}
+# Errors which mean that strategy is never supported between the devices,
+#   other errors may be caused by the files
+_DEVICE_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.ENOTTY,
+    errno.EOPNOTSUPP,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+}
+# Errors when hardlink can't be created but copy may be possible
+_HARDLINK_UNSUPPORTED_ERRNOS = _UNSUPPORTED_ERRNOS | {
+    errno.EPERM,
+    errno.EMLINK,
+}
+# Linux ioctl request to clone file content (reflink)
+_FICLONE = 0x40049409
+# Max bytes copied by one kernel copy call
+_KERNEL_COPY_CHUNK_SIZE = 1024 * 1024 * 1024
+
 
 def format_file_size(file_size, suffix=None):
     """Returns formatted string with size in appropriate unit.
@@ -29,7 +68,7 @@ def format_file_size(file_size, suffix=None):
     return "%.1f%s%s" % (file_size, "Yi", suffix)
 
 
-def create_hard_link(src_path, dst_path):
+def create_hard_link(src_path, dst_path, fallback_to_copy=False):
     """Create hardlink of file.
 
     Args:
@@ -37,7 +76,30 @@ def create_hard_link(src_path, dst_path):
             hardlink.
         dst_path(str): Full path to a file where a link of source will be
             added.
+        fallback_to_copy(Optional[bool]): Copy the file using 'copy_file'
+            if hardlink can't be created, e.g. when source and destination
+            are on different volumes.
+
+    Returns:
+        str: Name of used strategy. 'hardlink' or copy strategy if fallback
+            to copy was used.
     """
+    if fallback_to_copy:
+        try:
+            _create_hard_link(src_path, dst_path)
+        except OSError as exc:
+            if exc.errno not in _HARDLINK_UNSUPPORTED_ERRNOS:
+                raise
+            log.debug((
+                "Hardlink can't be created ({}). Copying file {} -> {}"
+            ).format(exc, src_path, dst_path))
+            return copy_file(src_path, dst_path)
+    else:
+        _create_hard_link(src_path, dst_path)
+    return COPY_STRATEGY_HARDLINK
+
+
+def _create_hard_link(src_path, dst_path):
     # Use `os.link` if is available
     #   - should be for all platforms with newer python versions
     if hasattr(os, "link"):
@@ -65,6 +127,187 @@ def create_hard_link(src_path, dst_path):
     )
 
 
+def _reflink_file(src_path, dst_path):
+    """Clone file content on copy-on-write filesystems (Btrfs, XFS)."""
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.ENOTSUP, "Reflink is supported only on Linux")
+
+    import fcntl
+
+    with open(src_path, "rb") as src_stream:
+        with open(dst_path, "wb") as dst_stream:
+            fcntl.ioctl(dst_stream.fileno(), _FICLONE, src_stream.fileno())
+
+
+def _kernel_copy(copy_func, src_path, dst_path):
+    with open(src_path, "rb") as src_stream:
+        with open(dst_path, "wb") as dst_stream:
+            src_fd = src_stream.fileno()
+            dst_fd = dst_stream.fileno()
+            size = os.fstat(src_fd).st_size
+            copied = 0
+            while True:
+                result = copy_func(src_fd, dst_fd, copied)
+                if not result:
+                    break
+                copied += result
+
+    # Some filesystems report success without copying anything
+    if copied != size:
+        raise OSError(
+            errno.EINVAL,
+            "Copied {} bytes out of {}".format(copied, size)
+        )
+
+
+def _copy_file_range_file(src_path, dst_path):
+    """Copy file in kernel, server side copy on NFS 4.2 and SMB."""
+    if not hasattr(os, "copy_file_range"):
+        raise OSError(errno.ENOSYS, "'copy_file_range' is not available")
+
+    def copy_func(src_fd, dst_fd, _offset):
+        return os.copy_file_range(src_fd, dst_fd, _KERNEL_COPY_CHUNK_SIZE)
+
+    _kernel_copy(copy_func, src_path, dst_path)
+
+
+def _sendfile_file(src_path, dst_path):
+    """Copy file in kernel without passing data through user space."""
+    if not sys.platform.startswith("linux") or not hasattr(os, "sendfile"):
+        raise OSError(
+            errno.ENOSYS, "'sendfile' to file is supported only on Linux"
+        )
+
+    def copy_func(src_fd, dst_fd, offset):
+        return os.sendfile(dst_fd, src_fd, offset, _KERNEL_COPY_CHUNK_SIZE)
+
+    _kernel_copy(copy_func, src_path, dst_path)
+
+
+def _copy_file(src_path, dst_path):
+    # this is needed until speedcopy for linux is fixed
+    if sys.platform == "win32":
+        from speedcopy import copyfile
+
+        copyfile(src_path, dst_path)
+    else:
+        shutil.copyfile(src_path, dst_path)
+
+
+# Copy strategies in order in which are tried
+_copy_strategies = [
+    (COPY_STRATEGY_REFLINK, _reflink_file),
+    (COPY_STRATEGY_COPY_FILE_RANGE, _copy_file_range_file),
+    (COPY_STRATEGY_SENDFILE, _sendfile_file),
+]
+# Strategies that failed as unsupported for source and destination devices
+_unsupported_strategies = set()
+
+
+def register_copy_strategy(name, func, index=None):
+    """Register copy strategy used by 'copy_file'.
+
+    Strategy function is called with source and destination path. It should
+    raise 'OSError' with one of 'errno.EXDEV', 'errno.ENOSYS',
+    'errno.EINVAL', 'errno.ENOTTY', 'errno.EBADF' or 'errno.EOPNOTSUPP' when
+    the strategy can't be used for the files, so next strategy is tried.
+
+    Args:
+        name (str): Name of strategy.
+        func (Callable[[str, str], None]): Copy function.
+        index (Optional[int]): Position in order of strategies. Strategy is
+            added as last before plain copy if not passed.
+    """
+    unregister_copy_strategy(name)
+    if index is None:
+        index = len(_copy_strategies)
+    _copy_strategies.insert(index, (name, func))
+
+
+def unregister_copy_strategy(name):
+    """Remove copy strategy by name.
+
+    Args:
+        name (str): Name of strategy.
+    """
+    for idx, item in enumerate(tuple(_copy_strategies)):
+        if item[0] == name:
+            _copy_strategies.pop(idx)
+            break
+
+
+def get_copy_strategy_names():
+    """Names of registered copy strategies in order in which are tried.
+
+    Plain copy ('copy') is not included as it's always used as last option.
+
+    Returns:
+        list[str]: Names of copy strategies.
+    """
+    return [name for name, _ in _copy_strategies]
+
+
+def copy_file(src_path, dst_path, strategies=None):
+    """Copy file content using the fastest available strategy.
+
+    Registered strategies (reflink, 'copy_file_range', 'sendfile') are tried
+    in order and plain copy is used if none of them is supported. A strategy
+    that is not supported between source and destination device is not
+    tried again for the same devices.
+
+    Args:
+        src_path (str): Path to source file.
+        dst_path (str): Path to destination file.
+        strategies (Optional[Iterable[str]]): Names of strategies which can
+            be used. All registered strategies are used if not passed.
+
+    Returns:
+        str: Name of used strategy.
+    """
+    devices_key = _get_devices_key(src_path, dst_path)
+    for name, func in tuple(_copy_strategies):
+        if strategies is not None and name not in strategies:
+            continue
+
+        unsupported_key = (name, devices_key)
+        if unsupported_key in _unsupported_strategies:
+            continue
+
+        try:
+            func(src_path, dst_path)
+            return name
+
+        except OSError as exc:
+            if exc.errno not in _UNSUPPORTED_ERRNOS:
+                raise
+            log.debug("Copy strategy '{}' is not supported: {}".format(
+                name, exc))
+            if (
+                devices_key is not None
+                and exc.errno in _DEVICE_UNSUPPORTED_ERRNOS
+            ):
+                _unsupported_strategies.add(unsupported_key)
+
+    _copy_file(src_path, dst_path)
+    return COPY_STRATEGY_COPY
+
+
+def _get_devices_key(src_path, dst_path):
+    """Devices of source file and destination directory.
+
+    Returns:
+        Union[tuple[int, int], None]: Device ids or None if they can't
+            be received.
+    """
+    try:
+        return (
+            os.stat(src_path).st_dev,
+            os.stat(os.path.dirname(os.path.abspath(dst_path))).st_dev
+        )
+    except OSError:
+        return None
+
+
 def collect_frames(files):
     """Returns dict of source path and its frame, if from sequence
 
@@ -1,8 +1,16 @@
 import re
+import json
 import logging
+import threading
+import collections
 
 log = logging.getLogger(__name__)
 
+# Max number of compiled profiles kept by 'get_compiled_profiles'
+COMPILED_PROFILES_CACHE_SIZE = 128
+# Max number of memoized results in 'CompiledProfiles'
+COMPILED_PROFILES_RESULTS_SIZE = 1024
+
 
 def compile_list_of_regexes(in_list):
     """Convert strings in entered list to compiled regex objects."""
@@ -162,14 +170,17 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
                 _keys_order.append(key)
         keys_order = tuple(_keys_order)
 
-    log_parts = " | ".join([
-        "{}: \"{}\"".format(*item)
-        for item in key_values.items()
-    ])
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    log_parts = ""
+    if debug_enabled:
+        log_parts = " | ".join([
+            "{}: \"{}\"".format(*item)
+            for item in key_values.items()
+        ])
 
-    logger.debug(
-        "Looking for matching profile for: {}".format(log_parts)
-    )
+        logger.debug(
+            "Looking for matching profile for: {}".format(log_parts)
+        )
 
     matching_profiles = None
     highest_profile_points = -1
@@ -184,11 +195,12 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
             value = key_values[key]
             match = validate_value_by_regexes(value, profile.get(key))
             if match == -1:
-                profile_value = profile.get(key) or []
-                logger.debug(
-                    "\"{}\" not found in \"{}\": {}".format(value, key,
-                                                            profile_value)
-                )
+                if debug_enabled:
+                    profile_value = profile.get(key) or []
+                    logger.debug(
+                        "\"{}\" not found in \"{}\": {}".format(
+                            value, key, profile_value)
+                    )
                 profile_points = -1
                 break
 
@@ -208,20 +220,294 @@ def filter_profiles(profiles_data, key_values, keys_order=None, logger=None):
         if profile_points == highest_profile_points:
             matching_profiles.append((profile, profile_scores))
 
+    return _select_profile(matching_profiles, log_parts, logger)
+
+
+def _select_profile(matching_profiles, log_parts, logger):
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     if not matching_profiles:
-        logger.debug(
-            "None of profiles match your setup. {}".format(log_parts)
-        )
+        if debug_enabled:
+            logger.debug(
+                "None of profiles match your setup. {}".format(log_parts)
+            )
         return None
 
-    if len(matching_profiles) > 1:
+    if len(matching_profiles) > 1 and debug_enabled:
         logger.debug(
             "More than one profile match your setup. {}".format(log_parts)
         )
 
     profile = _profile_exclusion(matching_profiles, logger)
-    if profile:
+    if profile and debug_enabled:
         logger.debug(
             "Profile selected: {}".format(profile)
         )
     return profile
+
+
+class _CompiledProfilesKey(object):
+    """Matching of one key for all profiles.
+
+    Profile values are split to literal strings, which are stored in index
+    by value, and regexes that must be matched one by one.
+    """
+
+    def __init__(self, profiles_data, key):
+        # Indexes of profiles which don't filter by key
+        self.wildcard_indexes = set()
+        # Profile indexes by literal value
+        self.literal_index = collections.defaultdict(set)
+        # Profile indexes with regexes
+        self.regexes_by_index = []
+
+        for idx, profile in enumerate(profiles_data):
+            in_list = profile.get(key)
+            if in_list and not isinstance(in_list, (list, tuple, set)):
+                in_list = [in_list]
+
+            if not in_list or "*" in in_list:
+                self.wildcard_indexes.add(idx)
+                continue
+
+            regexes = []
+            for item in in_list:
+                if not item:
+                    continue
+
+                if not isinstance(item, str):
+                    # Use same validation as 'filter_profiles'
+                    regexes.extend(compile_list_of_regexes([item]))
+
+                elif re.escape(item) == item:
+                    self.literal_index[item].add(idx)
+
+                else:
+                    regexes.append(re.compile(item))
+
+            if regexes:
+                self.regexes_by_index.append((idx, regexes))
+
+    def get_matching_indexes(self, value):
+        """Indexes of profiles that have value matching the key.
+
+        Returns:
+            set[int]: Profile indexes which get 1 point.
+        """
+        if not value:
+            return set()
+
+        matching = set(self.literal_index.get(value, ()))
+        for idx, regexes in self.regexes_by_index:
+            if idx in matching:
+                continue
+            for regex in regexes:
+                if regex.fullmatch(value):
+                    matching.add(idx)
+                    break
+        return matching
+
+
+class CompiledProfiles(object):
+    """Profiles prepared for repeated filtering.
+
+    Result of 'filter_profiles' method is the same as result of
+    'filter_profiles' function with same profiles. Regexes of profiles are
+    compiled once, literal values are indexed and results are memoized by
+    passed values.
+
+    Profiles must not be changed after the object is created.
+
+    Args:
+        profiles_data (list[dict]): Profile definitions as dictionaries.
+    """
+
+    def __init__(self, profiles_data):
+        self._profiles_data = list(profiles_data or [])
+        self._keys = {}
+        self._results = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def profiles_data(self):
+        return list(self._profiles_data)
+
+    def _copy_for(self, profiles_data):
+        """Compiled profiles for equal profiles in different object.
+
+        Compiled keys are shared as they depend only on content of profiles.
+        Memoized results are not shared because they contain profiles of
+        the original list.
+        """
+        compiled_profiles = self.__class__(profiles_data)
+        compiled_profiles._keys = self._keys
+        return compiled_profiles
+
+    def _get_key(self, key):
+        compiled_key = self._keys.get(key)
+        if compiled_key is None:
+            compiled_key = _CompiledProfilesKey(self._profiles_data, key)
+            self._keys[key] = compiled_key
+        return compiled_key
+
+    def filter_profiles(self, key_values, keys_order=None, logger=None):
+        """Filter profiles by entered key -> values.
+
+        Args:
+            key_values (dict): Mapping of Key <-> Value. Key is checked if is
+                available in profile and if Value is matching it's values.
+            keys_order (list, tuple): Order of keys from `key_values` which
+                matters only when multiple profiles have same score.
+            logger (logging.Logger): Optionally can be passed different
+                logger.
+
+        Returns:
+            dict/None: Return most matching profile or None if none of
+                profiles match at least one criteria.
+        """
+        if not self._profiles_data:
+            return None
+
+        if not logger:
+            logger = log
+
+        if not keys_order:
+            keys_order = tuple(key_values.keys())
+        else:
+            _keys_order = list(keys_order)
+            for key in key_values.keys():
+                if key not in _keys_order:
+                    _keys_order.append(key)
+            keys_order = tuple(_keys_order)
+
+        cache_key = tuple((key, key_values[key]) for key in keys_order)
+        try:
+            hash(cache_key)
+        except TypeError:
+            cache_key = None
+
+        with self._lock:
+            if cache_key is not None and cache_key in self._results:
+                self._results.move_to_end(cache_key)
+                return self._results[cache_key]
+
+            profile = self._filter_profiles(key_values, keys_order, logger)
+            if cache_key is not None:
+                self._results[cache_key] = profile
+                if len(self._results) > COMPILED_PROFILES_RESULTS_SIZE:
+                    self._results.popitem(last=False)
+        return profile
+
+    def _filter_profiles(self, key_values, keys_order, logger):
+        log_parts = ""
+        if logger.isEnabledFor(logging.DEBUG):
+            log_parts = " | ".join([
+                "{}: \"{}\"".format(*item)
+                for item in key_values.items()
+            ])
+            logger.debug(
+                "Looking for matching profile for: {}".format(log_parts)
+            )
+
+        scores_by_key = []
+        for key in keys_order:
+            compiled_key = self._get_key(key)
+            scores_by_key.append((
+                compiled_key.wildcard_indexes,
+                compiled_key.get_matching_indexes(key_values[key])
+            ))
+
+        matching_profiles = None
+        highest_profile_points = -1
+        for idx, profile in enumerate(self._profiles_data):
+            profile_points = 0
+            profile_scores = []
+            for wildcard_indexes, matching_indexes in scores_by_key:
+                if idx in matching_indexes:
+                    profile_points += 1
+                    profile_scores.append(True)
+                elif idx in wildcard_indexes:
+                    profile_scores.append(False)
+                else:
+                    profile_points = -1
+                    break
+
+            if (
+                profile_points < 0
+                or profile_points < highest_profile_points
+            ):
+                continue
+
+            if profile_points > highest_profile_points:
+                matching_profiles = []
+                highest_profile_points = profile_points
+
+            if profile_points == highest_profile_points:
+                matching_profiles.append((profile, profile_scores))
+
+        return _select_profile(matching_profiles, log_parts, logger)
+
+
+_compiled_profiles_cache = collections.OrderedDict()
+_compiled_profiles_by_content = collections.OrderedDict()
+_compiled_profiles_lock = threading.Lock()
+
+
+def _get_profiles_content_key(profiles_data):
+    try:
+        return json.dumps(profiles_data, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+
+
+def _add_to_cache(cache, key, item):
+    cache[key] = item
+    if len(cache) > COMPILED_PROFILES_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def get_compiled_profiles(profiles_data):
+    """Get compiled profiles for profiles list.
+
+    Compiled profiles are cached by identity of passed list, so the same
+    object is returned for the same list from settings. Lists with equal
+    content (e.g. from copied settings) share compiled regexes and indexes
+    but returned profiles are always from the passed list.
+
+    Args:
+        profiles_data (list[dict]): Profile definitions as dictionaries.
+
+    Returns:
+        CompiledProfiles: Compiled profiles.
+    """
+    cache_key = id(profiles_data)
+    with _compiled_profiles_lock:
+        item = _compiled_profiles_cache.get(cache_key)
+        # Validate identity as 'id' can be reused for new object
+        if item is not None and item[0] is profiles_data:
+            _compiled_profiles_cache.move_to_end(cache_key)
+            return item[1]
+
+    content_key = _get_profiles_content_key(profiles_data)
+    with _compiled_profiles_lock:
+        source = None
+        if content_key is not None:
+            source = _compiled_profiles_by_content.get(content_key)
+
+        if source is None:
+            compiled_profiles = CompiledProfiles(profiles_data)
+            if content_key is not None:
+                _add_to_cache(
+                    _compiled_profiles_by_content,
+                    content_key,
+                    compiled_profiles
+                )
+        else:
+            _compiled_profiles_by_content.move_to_end(content_key)
+            compiled_profiles = source._copy_for(profiles_data)
+
+        _add_to_cache(
+            _compiled_profiles_cache,
+            cache_key,
+            (profiles_data, compiled_profiles)
+        )
+    return compiled_profiles
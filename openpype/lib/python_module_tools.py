@@ -1,9 +1,11 @@
 import os
 import sys
+import copy
 import types
 import importlib
 import inspect
 import logging
+import threading
 
 import six
 
@@ -139,6 +141,186 @@ def classes_from_module(superclass, module):
     return classes
 
 
+class ModuleFileItem(object):
+    """Python file imported by 'PathModulesCache'.
+
+    Classes found in the module are cached by superclass.
+
+    Args:
+        filepath (str): Path to python file.
+        stat_key (tuple[int, int]): Modification time and size of file.
+        module (types.ModuleType): Imported module.
+    """
+
+    def __init__(self, filepath, stat_key, module):
+        self.filepath = filepath
+        self.stat_key = stat_key
+        self.module = module
+        self._classes_by_superclass = {}
+
+    def get_classes(self, superclass, subclass_defined=False):
+        """Classes from the module which are subclasses of superclass.
+
+        Args:
+            superclass (type): Superclass of classes.
+            subclass_defined (bool): Return new subclass for each class
+                defined in the module. Changes of attributes of returned
+                classes don't affect cached classes.
+
+        Returns:
+            list[type]: Classes from the module.
+        """
+
+        classes = self._classes_by_superclass.get(superclass)
+        if classes is None:
+            classes = classes_from_module(superclass, self.module)
+            self._classes_by_superclass[superclass] = classes
+
+        if not subclass_defined:
+            return list(classes)
+
+        return [self.create_subclass(cls) for cls in classes]
+
+    def create_subclass(self, cls):
+        """New subclass of class defined in the module.
+
+        Classes imported to the module from other modules, and classes with
+        attribute values which can't be copied, are returned as they are.
+
+        Args:
+            cls (type): Class from the module.
+
+        Returns:
+            type: New subclass or passed class.
+        """
+
+        if cls.__module__ != self.module.__name__:
+            return cls
+
+        # Mutable values are copied so they can be changed in place
+        try:
+            attributes = {
+                key: copy.deepcopy(value)
+                for key, value in vars(cls).items()
+                if not key.startswith("__")
+                and isinstance(value, (list, dict, set))
+            }
+        except Exception:
+            log.debug(
+                "Failed to copy attributes of {}".format(cls.__name__),
+                exc_info=True
+            )
+            return cls
+
+        attributes.update({
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "__doc__": cls.__doc__,
+        })
+        return type(cls)(cls.__name__, (cls,), attributes)
+
+
+class PathModulesCache(object):
+    """Python files imported from directories.
+
+    Same rules as in 'modules_from_path' apply. Imported files are kept in
+    memory with their modification time and size and are imported again
+    only when they changed. Files which crashed are tried again on each
+    call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items_by_path = {}
+
+    def clear(self, folder_path=None):
+        """Forget imported files so they're imported on next call.
+
+        Args:
+            folder_path (Optional[str]): Clear only files of the directory.
+        """
+
+        with self._lock:
+            if folder_path is None:
+                self._items_by_path = {}
+            else:
+                self._items_by_path.pop(os.path.normpath(folder_path), None)
+
+    def get_file_items(self, folder_path):
+        """Imported python files from a directory.
+
+        Args:
+            folder_path (str): Path to directory with python files.
+
+        Returns:
+            tuple[list[ModuleFileItem], list[tuple[str, tuple]]]: Imported
+                file items and crashed file paths with exception info.
+        """
+
+        file_items = []
+        crashed = []
+        output = (file_items, crashed)
+        if not folder_path:
+            return output
+
+        # Do not allow relative imports
+        if folder_path.startswith("."):
+            log.warning((
+                "BUG: Relative paths are not allowed for security reasons. {}"
+            ).format(folder_path))
+            return output
+
+        folder_path = os.path.normpath(folder_path)
+        with self._lock:
+            if not os.path.isdir(folder_path):
+                log.warning("Not a directory path: {}".format(folder_path))
+                self._items_by_path.pop(folder_path, None)
+                return output
+
+            cached_items = self._items_by_path.get(folder_path) or {}
+            new_items = {}
+            with os.scandir(folder_path) as entries:
+                entries = sorted(entries, key=lambda entry: entry.name)
+
+            for entry in entries:
+                filename = entry.name
+                # Ignore files which start with underscore
+                if filename.startswith("_"):
+                    continue
+
+                mod_name, mod_ext = os.path.splitext(filename)
+                if not mod_ext == ".py":
+                    continue
+
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                full_path = os.path.join(folder_path, filename)
+                stat_key = (stat.st_mtime_ns, stat.st_size)
+                item = cached_items.get(full_path)
+                if item is None or item.stat_key != stat_key:
+                    try:
+                        module = import_filepath(full_path, mod_name)
+                    except Exception:
+                        crashed.append((full_path, sys.exc_info()))
+                        log.warning(
+                            "Failed to load path: \"{0}\"".format(full_path),
+                            exc_info=True
+                        )
+                        continue
+                    item = ModuleFileItem(full_path, stat_key, module)
+
+                new_items[full_path] = item
+                file_items.append(item)
+
+            self._items_by_path[folder_path] = new_items
+        return output
+
+
 def _import_module_from_dirpath_py2(dirpath, module_name, dst_module_name):
     """Import passed dirpath as python module using `imp`."""
     if dst_module_name:
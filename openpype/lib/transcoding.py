@@ -1,14 +1,19 @@
 import os
 import re
+import math
 import logging
 import json
 import collections
 import tempfile
+import threading
 import subprocess
 import platform
+import concurrent.futures
 
 import xml.etree.ElementTree
 
+import clique
+
 from .execute import run_subprocess
 from .vendor_bin_utils import (
     get_ffmpeg_tool_args,
@@ -20,6 +25,12 @@ from .vendor_bin_utils import (
 MAX_FFMPEG_STRING_LEN = 8196
 # Not allowed symbols in attributes for ffmpeg
 NOT_ALLOWED_FFMPEG_CHARS = ("\"", )
+# Characters that oiiotool handles as frame number wildcards in filenames
+OIIO_WILDCARD_CHARS = ("%", "#", "@")
+# Max number of oiiotool processes used by default for conversion
+MAX_CONVERT_WORKERS = 4
+# Max number of probe outputs kept in memory
+PROBE_CACHE_MAX_ITEMS = 512
 
 # OIIO known xml tags
 STRING_TAGS = {
@@ -78,10 +89,100 @@ def get_transcode_temp_directory():
     )
 
 
+class ProbeCache(object):
+    """Process wide cache of metadata probe outputs.
+
+    Outputs of probe commands (oiiotool info, ffprobe) are stored by file
+    path, file size and modification time, so a changed file is probed
+    again. Least recently used outputs are removed when cache is full.
+
+    Raw command output is stored, so each call returns newly parsed data
+    and callers can't modify cached values.
+
+    Args:
+        max_items (int): Maximum number of outputs kept in memory.
+    """
+
+    def __init__(self, max_items=PROBE_CACHE_MAX_ITEMS):
+        self._max_items = max_items
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_key(self, probe_type, filepath, args=None):
+        """Create cache key for a file.
+
+        Args:
+            probe_type (str): Type of probe e.g. 'oiio' or 'ffprobe'.
+            filepath (str): Path to probed file.
+            args (Optional[Iterable[str]]): Arguments that affect output.
+
+        Returns:
+            Union[tuple, None]: Cache key or 'None' if file is not available
+                (e.g. path is a sequence pattern).
+        """
+        try:
+            stat = os.stat(filepath)
+        except (OSError, ValueError):
+            return None
+        return (
+            probe_type,
+            os.path.abspath(filepath),
+            stat.st_size,
+            stat.st_mtime_ns,
+            tuple(args or ())
+        )
+
+    def get(self, key):
+        """Cached output for key.
+
+        Returns:
+            Union[str, None]: Output or 'None' if is not cached.
+        """
+        if key is None:
+            return None
+
+        with self._lock:
+            output = self._items.get(key)
+            if output is not None:
+                self._items.move_to_end(key)
+            return output
+
+    def set(self, key, output):
+        if key is None or output is None:
+            return
+        with self._lock:
+            self._items[key] = output
+            self._items.move_to_end(key)
+            while len(self._items) > self._max_items:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+_probe_cache = ProbeCache()
+
+
+def get_probe_cache():
+    """Process wide cache of metadata probe outputs.
+
+    Returns:
+        ProbeCache: Cache object.
+    """
+    return _probe_cache
+
+
+def clear_probe_cache():
+    """Clear cache of metadata probe outputs."""
+    _probe_cache.clear()
+
+
 def get_oiio_info_for_input(filepath, logger=None, subimages=False):
     """Call oiiotool to get information about input and return stdout.
 
-    Stdout should contain xml format string.
+    Stdout should contain xml format string. Output of oiiotool is cached
+    for unchanged files.
     """
     args = get_oiio_tool_args(
         "oiiotool",
@@ -93,8 +194,14 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
 
     args.extend(["-i:infoformat=xml", filepath])
 
-    output = run_subprocess(args, logger=logger)
-    output = output.replace("\r\n", "\n")
+    cache_key = _probe_cache.get_key("oiio", filepath, args[:-1])
+    output = _probe_cache.get(cache_key)
+    if output is None:
+        output = run_subprocess(args, logger=logger)
+        output = output.replace("\r\n", "\n")
+        cache_item = True
+    else:
+        cache_item = False
 
     xml_started = False
     subimages_lines = []
@@ -119,6 +226,9 @@ def get_oiio_info_for_input(filepath, logger=None, subimages=False):
             )
         )
 
+    if cache_item:
+        _probe_cache.set(cache_key, output)
+
     output = []
     for subimage_lines in subimages_lines:
         xml_text = "\n".join(subimage_lines)
@@ -656,10 +766,168 @@ def convert_for_ffmpeg(
     run_subprocess(oiio_cmd, logger=logger)
 
 
+def get_convert_workers(max_workers=None):
+    """Number of concurrent oiiotool processes used for conversion.
+
+    Args:
+        max_workers (Optional[int]): Requested number of workers. Value
+            lower than 1 or 'None' means that the default is used.
+
+    Returns:
+        int: Number of workers.
+    """
+    if max_workers is not None and max_workers > 0:
+        return int(max_workers)
+    return max(1, min(MAX_CONVERT_WORKERS, os.cpu_count() or 1))
+
+
+def get_contiguous_frame_ranges(indexes, max_frames=None):
+    """Split frame indexes to contiguous ranges.
+
+    Args:
+        indexes (Iterable[int]): Frame indexes.
+        max_frames (Optional[int]): Maximum number of frames in one range.
+
+    Returns:
+        list[tuple[int, int]]: Start and end frame (both inclusive).
+    """
+    ranges = []
+    start = end = None
+    for index in sorted(indexes):
+        if (
+            start is not None
+            and index == end + 1
+            and (not max_frames or index - start < max_frames)
+        ):
+            end = index
+            continue
+
+        if start is not None:
+            ranges.append((start, end))
+        start = end = index
+
+    if start is not None:
+        ranges.append((start, end))
+    return ranges
+
+
+def get_oiio_frame_chunks(input_paths, output_dir, chunks_count=1):
+    """Split input paths to chunks that can be processed by single oiiotool.
+
+    Frames of a sequence are grouped into contiguous ranges which are
+    converted with one 'oiiotool --frames' call each. Gaps in sequence are
+    kept, because each range contains only existing frames, and output
+    filenames match input filenames. Paths that are not part of a sequence,
+    or that contain characters oiiotool would consider as frame wildcard,
+    are converted one by one.
+
+    Args:
+        input_paths (list[str]): Paths to input files.
+        output_dir (str): Directory where output will be stored.
+        chunks_count (int): Preferred minimum number of chunks, so the work
+            can be distributed between multiple processes.
+
+    Returns:
+        list[tuple[str, str, Union[str, None]]]: Input path, output path
+            and frames range for '--frames' argument. Frames range is 'None'
+            if chunk contains only single file.
+    """
+    chunks = []
+    file_collections, remainder = clique.assemble(
+        input_paths,
+        patterns=[clique.PATTERNS["frames"]],
+        assume_padded_when_ambiguous=True,
+    )
+    single_paths = list(remainder)
+    for collection in file_collections:
+        head = collection.head
+        tail = collection.tail
+        if any(
+            char in head or char in tail
+            for char in OIIO_WILDCARD_CHARS
+        ):
+            single_paths.extend(list(collection))
+            continue
+
+        max_frames = int(
+            math.ceil(len(collection.indexes) / float(chunks_count))
+        )
+        if collection.padding:
+            frame_pattern = "%0{}d".format(collection.padding)
+        else:
+            frame_pattern = "%d"
+        input_path = "".join((head, frame_pattern, tail))
+        output_path = os.path.join(
+            output_dir,
+            "".join((os.path.basename(head), frame_pattern, tail))
+        )
+        for start, end in get_contiguous_frame_ranges(
+            collection.indexes, max_frames
+        ):
+            if start == end:
+                single_paths.append(collection.format(
+                    "{head}{padding}{tail}") % start)
+                continue
+            chunks.append(
+                (input_path, output_path, "{}-{}".format(start, end))
+            )
+
+    for input_path in single_paths:
+        output_path = os.path.join(output_dir, os.path.basename(input_path))
+        chunks.append((input_path, output_path, None))
+    return chunks
+
+
+def run_oiio_commands(commands, max_workers=None, logger=None):
+    """Run oiiotool commands concurrently in bounded pool of processes.
+
+    Commands are started from a thread pool, so at most 'max_workers'
+    oiiotool processes are running at the same time. When any command fails
+    the commands that did not start yet are cancelled and the error is
+    raised.
+
+    Args:
+        commands (list[list[str]]): Subprocess arguments of commands.
+        max_workers (Optional[int]): Maximum number of concurrent processes.
+        logger (logging.Logger): Logger used for logging.
+    """
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    max_workers = min(get_convert_workers(max_workers), len(commands))
+    if max_workers <= 1:
+        for oiio_cmd in commands:
+            logger.debug(
+                "Conversion command: {}".format(" ".join(oiio_cmd)))
+            run_subprocess(oiio_cmd, logger=logger)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = []
+        for oiio_cmd in commands:
+            logger.debug(
+                "Conversion command: {}".format(" ".join(oiio_cmd)))
+            futures.append(
+                executor.submit(run_subprocess, oiio_cmd, logger=logger)
+            )
+
+        done, not_done = concurrent.futures.wait(
+            futures, return_when=concurrent.futures.FIRST_EXCEPTION
+        )
+        for future in not_done:
+            future.cancel()
+
+        # Raise first error in order of commands
+        for future in futures:
+            if future in done:
+                future.result()
+
+
 def convert_input_paths_for_ffmpeg(
     input_paths,
     output_dir,
-    logger=None
+    logger=None,
+    max_workers=None
 ):
     """Convert source file to format supported in ffmpeg.
 
@@ -672,12 +940,17 @@ def convert_input_paths_for_ffmpeg(
     - This way it can handle gaps and can keep input filenames without handling
         frame template
 
+    Contiguous frame ranges of a sequence are converted by single oiiotool
+    process and the ranges are processed concurrently.
+
     Args:
         input_paths (str): Paths that should be converted. It is expected that
             contains single file or image sequence of same type.
         output_dir (str): Path to directory where output will be rendered.
             Must not be same as input's directory.
         logger (logging.Logger): Logger used for logging.
+        max_workers (Optional[int]): Maximum number of concurrently running
+            oiiotool processes. Default is based on CPU count.
 
     Raises:
         ValueError: If input filepath has extension not supported by function.
@@ -706,16 +979,56 @@ def convert_input_paths_for_ffmpeg(
     # Collect channels to export
     input_arg, channels_arg = get_oiio_input_and_channel_args(input_info)
 
-    for input_path in input_paths:
-        # Prepare subprocess arguments
-        oiio_cmd = get_oiio_tool_args(
-            "oiiotool",
-            # Don't add any additional attributes
-            "--nosoftwareattrib",
-        )
-        # Add input compression if available
-        if compression:
-            oiio_cmd.extend(["--compression", compression])
+    # Prepare subprocess arguments shared by all commands
+    base_oiio_cmd = get_oiio_tool_args(
+        "oiiotool",
+        # Don't add any additional attributes
+        "--nosoftwareattrib",
+    )
+    # Add input compression if available
+    if compression:
+        base_oiio_cmd.extend(["--compression", compression])
+
+    erase_args = []
+    for attr_name, attr_value in input_info["attribs"].items():
+        if not isinstance(attr_value, str):
+            continue
+
+        # Remove attributes that have string value longer than allowed
+        #   length for ffmpeg or when containing prohibited symbols
+        erase_reason = "Missing reason"
+        erase_attribute = False
+        if len(attr_value) > MAX_FFMPEG_STRING_LEN:
+            erase_reason = "has too long value ({} chars).".format(
+                len(attr_value)
+            )
+            erase_attribute = True
+
+        if not erase_attribute:
+            for char in NOT_ALLOWED_FFMPEG_CHARS:
+                if char in attr_value:
+                    erase_attribute = True
+                    erase_reason = (
+                        "contains unsupported character \"{}\"."
+                    ).format(char)
+                    break
+
+        if erase_attribute:
+            # Set attribute to empty string
+            logger.info((
+                "Removed attribute \"{}\" from metadata because {}."
+            ).format(attr_name, erase_reason))
+            erase_args.extend(["--eraseattrib", attr_name])
+
+    max_workers = get_convert_workers(max_workers)
+    commands = []
+    for input_path, output_path, frames in get_oiio_frame_chunks(
+        input_paths, output_dir, max_workers
+    ):
+        oiio_cmd = list(base_oiio_cmd)
+        # Frames must be defined before input
+        if frames:
+            oiio_cmd.extend(["--frames", frames])
 
         oiio_cmd.extend([
             input_arg, input_path,
@@ -725,52 +1038,22 @@ def convert_input_paths_for_ffmpeg(
             # Use first subimage
             "--subimage", "0"
         ])
-
-        for attr_name, attr_value in input_info["attribs"].items():
-            if not isinstance(attr_value, str):
-                continue
-
-            # Remove attributes that have string value longer than allowed
-            #   length for ffmpeg or when containing prohibited symbols
-            erase_reason = "Missing reason"
-            erase_attribute = False
-            if len(attr_value) > MAX_FFMPEG_STRING_LEN:
-                erase_reason = "has too long value ({} chars).".format(
-                    len(attr_value)
-                )
-                erase_attribute = True
-
-            if not erase_attribute:
-                for char in NOT_ALLOWED_FFMPEG_CHARS:
-                    if char in attr_value:
-                        erase_attribute = True
-                        erase_reason = (
-                            "contains unsupported character \"{}\"."
-                        ).format(char)
-                        break
-
-            if erase_attribute:
-                # Set attribute to empty string
-                logger.info((
-                    "Removed attribute \"{}\" from metadata because {}."
-                ).format(attr_name, erase_reason))
-                oiio_cmd.extend(["--eraseattrib", attr_name])
-
+        oiio_cmd.extend(erase_args)
         # Add last argument - path to output
-        base_filename = os.path.basename(input_path)
-        output_path = os.path.join(output_dir, base_filename)
         oiio_cmd.extend([
             "-o", output_path
         ])
+        commands.append(oiio_cmd)
 
-        logger.debug("Conversion command: {}".format(" ".join(oiio_cmd)))
-        run_subprocess(oiio_cmd, logger=logger)
+    run_oiio_commands(commands, max_workers, logger)
 
 
 # FFMPEG functions
 def get_ffprobe_data(path_to_file, logger=None):
     """Load data about entered filepath via ffprobe.
 
+    Output of ffprobe is cached for unchanged files.
+
     Args:
         path_to_file (str): absolute path
         logger (logging.Logger): injected logger, if empty new is created
@@ -794,6 +1077,12 @@ def get_ffprobe_data(path_to_file, logger=None):
         path_to_file
     ]
 
+    cache_key = _probe_cache.get_key("ffprobe", path_to_file, args[:-1])
+    cached_output = _probe_cache.get(cache_key)
+    if cached_output is not None:
+        logger.debug("Using cached FFprobe output.")
+        return json.loads(cached_output)
+
     logger.debug("FFprobe command: {}".format(
         subprocess.list2cmdline(args)
     ))
@@ -821,7 +1110,11 @@ def get_ffprobe_data(path_to_file, logger=None):
             popen_stderr.decode("utf-8")
         ))
 
-    return json.loads(popen_stdout)
+    output = json.loads(popen_stdout)
+    # Cache only successful probes
+    if popen.returncode == 0 and "error" not in output:
+        _probe_cache.set(cache_key, popen_stdout.decode("utf-8"))
+    return output
 
 
 def get_ffprobe_streams(path_to_file, logger=None):
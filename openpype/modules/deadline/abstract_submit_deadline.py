@@ -9,12 +9,16 @@ import os
 from abc import abstractmethod
 import platform
 import getpass
+import threading
 from functools import partial
 from collections import OrderedDict
 
 import six
 import attr
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from six.moves.urllib.parse import urlparse
 
 import pyblish.api
 from openpype.pipeline.publish import (
@@ -30,6 +34,155 @@ from openpype import AYON_SERVER_ENABLED
 JSONDecodeError = getattr(json.decoder, "JSONDecodeError", ValueError)
 
 
+class DeadlineSessionManager(object):
+    """Shared HTTP sessions to Deadline webservices.
+
+    One 'requests.Session' is kept for each webservice (scheme and host) so
+    requests reuse keep-alive connections from pool of the session instead
+    of opening new connection for each call. Requests failed on connection
+    errors or on unavailable webservice (502, 503, 504) are retried with
+    backoff.
+
+    POST requests use separate session which retries only errors raised
+    before request was sent to webservice (e.g. refused connection). Job
+    might be already created when response was not received, so retry
+    could submit the job twice.
+
+    Default timeout and count of retries can be changed with environment
+    variables 'OPENPYPE_DEADLINE_TIMEOUT' and 'OPENPYPE_DEADLINE_RETRIES'.
+    """
+
+    default_timeout = 10
+    default_retries = 3
+    backoff_factor = 0.5
+    retry_status_codes = (502, 503, 504)
+    retry_methods = frozenset({"HEAD", "GET", "OPTIONS", "PUT"})
+    pool_maxsize = 10
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sessions = {}
+
+    @staticmethod
+    def _get_env_value(env_key, value_type, default):
+        value = os.getenv(env_key)
+        if not value:
+            return default
+        try:
+            return value_type(value)
+        except ValueError:
+            return default
+
+    def get_timeout(self):
+        return self._get_env_value(
+            "OPENPYPE_DEADLINE_TIMEOUT", float, self.default_timeout
+        )
+
+    def get_retries(self):
+        return self._get_env_value(
+            "OPENPYPE_DEADLINE_RETRIES", int, self.default_retries
+        )
+
+    def _create_retry(self, post):
+        retries = self.get_retries()
+        if post:
+            # Retry only connection errors
+            return Retry(
+                total=retries,
+                connect=retries,
+                read=0,
+                status=0,
+                other=0,
+                backoff_factor=self.backoff_factor,
+                raise_on_status=False
+            )
+        return Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.retry_status_codes,
+            allowed_methods=self.retry_methods,
+            raise_on_status=False
+        )
+
+    def _create_session(self, post):
+        retry = self._create_retry(post)
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=1,
+            pool_maxsize=self.pool_maxsize
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def get_session(self, url, method=None):
+        """Session for webservice of url.
+
+        Args:
+            url (str): Url of webservice or of its end-point.
+            method (Optional[str]): HTTP method of requests. POST requests
+                have separate session with different retries.
+
+        Returns:
+            requests.Session: Session shared for the webservice.
+        """
+
+        post = bool(method) and method.upper() == "POST"
+        parsed_url = urlparse(url)
+        key = (parsed_url.scheme, parsed_url.netloc, post)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._create_session(post)
+                self._sessions[key] = session
+            return session
+
+    def request(self, method, url, **kwargs):
+        """Send request using shared session of webservice.
+
+        Default timeout is used if 'timeout' is not passed. Pass 'None'
+        to wait for response without timeout.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Url of request.
+            **kwargs (Any): Arguments passed to 'requests.Session.request'.
+
+        Returns:
+            requests.Response: Response of webservice.
+        """
+
+        if "timeout" not in kwargs:
+            kwargs["timeout"] = self.get_timeout()
+        return self.get_session(url, method).request(method, url, **kwargs)
+
+    def close(self):
+        """Close all sessions and their connections."""
+
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+
+_SESSION_MANAGER = DeadlineSessionManager()
+
+
+def get_deadline_session_manager():
+    """Session manager shared by all Deadline requests of the process.
+
+    Returns:
+        DeadlineSessionManager: Shared session manager.
+    """
+
+    return _SESSION_MANAGER
+
+
 def requests_post(*args, **kwargs):
     """Wrap request post method.
 
@@ -38,6 +191,9 @@ def requests_post(*args, **kwargs):
     running with self-signed certificates and its certificate is not
     added to trusted certificates on client machines.
 
+    Request is sent using shared session of the webservice, see
+    'DeadlineSessionManager'.
+
     Warning:
         Disabling SSL certificate validation is defeating one line
         of defense SSL is providing, and it is not recommended.
@@ -46,9 +202,7 @@ def requests_post(*args, **kwargs):
     if 'verify' not in kwargs:
         kwargs['verify'] = False if os.getenv("OPENPYPE_DONT_VERIFY_SSL",
                                               True) else True  # noqa
-    # add 10sec timeout before bailing out
-    kwargs['timeout'] = 10
-    return requests.post(*args, **kwargs)
+    return _SESSION_MANAGER.request("POST", *args, **kwargs)
 
 
 def requests_get(*args, **kwargs):
@@ -59,6 +213,9 @@ def requests_get(*args, **kwargs):
     running with self-signed certificates and its certificate is not
     added to trusted certificates on client machines.
 
+    Request is sent using shared session of the webservice, see
+    'DeadlineSessionManager'.
+
     Warning:
         Disabling SSL certificate validation is defeating one line
         of defense SSL is providing, and it is not recommended.
@@ -67,9 +224,7 @@ def requests_get(*args, **kwargs):
     if 'verify' not in kwargs:
         kwargs['verify'] = False if os.getenv("OPENPYPE_DONT_VERIFY_SSL",
                                               True) else True  # noqa
-    # add 10sec timeout before bailing out
-    kwargs['timeout'] = 10
-    return requests.get(*args, **kwargs)
+    return _SESSION_MANAGER.request("GET", *args, **kwargs)
 
 
 class DeadlineKeyValueVar(dict):
@@ -3,7 +3,7 @@ import requests
 import six
 import sys
 
-from openpype.lib import requests_get, Logger
+from openpype.lib import Logger
 from openpype.modules import OpenPypeModule, IPluginPaths
 
 
@@ -56,6 +56,9 @@ class DeadlineModule(OpenPypeModule, IPluginPaths):
             RuntimeError: If deadline webservice is unreachable.
 
         """
+        # Use shared session of webservice
+        from .abstract_submit_deadline import requests_get
+
         if not log:
             log = Logger.get_logger(__name__)
 
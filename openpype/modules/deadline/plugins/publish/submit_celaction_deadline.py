@@ -2,8 +2,10 @@ import os
 import re
 import json
 import getpass
-import requests
 import pyblish.api
+from openpype_modules.deadline.abstract_submit_deadline import (
+    get_deadline_session_manager
+)
 
 
 class CelactionSubmitDeadline(pyblish.api.InstancePlugin):
@@ -193,7 +195,10 @@ class CelactionSubmitDeadline(pyblish.api.InstancePlugin):
         self.log.debug("__ expectedFiles: `{}`".format(
             instance.data["expectedFiles"]))
 
-        response = requests.post(self.deadline_url, json=payload)
+        # Wait for response without timeout
+        response = get_deadline_session_manager().request(
+            "POST", self.deadline_url, json=payload, timeout=None
+        )
 
         if not response.ok:
             self.log.error(
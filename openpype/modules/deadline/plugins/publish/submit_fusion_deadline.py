@@ -2,8 +2,6 @@ import os
 import json
 import getpass
 
-import requests
-
 import pyblish.api
 
 from openpype import AYON_SERVER_ENABLED
@@ -16,6 +14,9 @@ from openpype.lib import (
     NumberDef,
     is_running_from_build
 )
+from openpype_modules.deadline.abstract_submit_deadline import (
+    get_deadline_session_manager
+)
 
 
 class FusionSubmitDeadline(
@@ -261,7 +262,10 @@ class FusionSubmitDeadline(
 
         # E.g. http://192.168.0.1:8082/api/jobs
         url = "{}/api/jobs".format(deadline_url)
-        response = requests.post(url, json=payload)
+        # Wait for response without timeout
+        response = get_deadline_session_manager().request(
+            "POST", url, json=payload, timeout=None
+        )
         if not response.ok:
             raise Exception(response.text)
 
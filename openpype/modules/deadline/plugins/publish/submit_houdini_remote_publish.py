@@ -2,13 +2,14 @@ import os
 import json
 from datetime import datetime
 
-import requests
-
 import pyblish.api
 
 from openpype.pipeline import legacy_io
 from openpype.tests.lib import is_in_tests
 from openpype.lib import is_running_from_build
+from openpype_modules.deadline.abstract_submit_deadline import (
+    get_deadline_session_manager
+)
 
 
 class HoudiniSubmitPublishDeadline(pyblish.api.ContextPlugin):
@@ -168,6 +169,9 @@ class HoudiniSubmitPublishDeadline(pyblish.api.ContextPlugin):
 
         # E.g. http://192.168.0.1:8082/api/jobs
         url = "{}/api/jobs".format(deadline)
-        response = requests.post(url, json=payload)
+        # Wait for response without timeout
+        response = get_deadline_session_manager().request(
+            "POST", url, json=payload, timeout=None
+        )
         if not response.ok:
             raise Exception(response.text)
@@ -4,7 +4,6 @@ import json
 import getpass
 from datetime import datetime
 
-import requests
 import pyblish.api
 
 from openpype import AYON_SERVER_ENABLED
@@ -18,6 +17,9 @@ from openpype.lib import (
     BoolDef,
     NumberDef
 )
+from openpype_modules.deadline.abstract_submit_deadline import (
+    get_deadline_session_manager
+)
 
 
 class NukeSubmitDeadline(pyblish.api.InstancePlugin,
@@ -444,7 +446,9 @@ class NukeSubmitDeadline(pyblish.api.InstancePlugin,
 
         self.log.debug("__ expectedFiles: `{}`".format(
             instance.data["expectedFiles"]))
-        response = requests.post(self.deadline_url, json=payload, timeout=10)
+        response = get_deadline_session_manager().request(
+            "POST", self.deadline_url, json=payload, timeout=10
+        )
 
         if not response.ok:
             raise Exception(response.text)
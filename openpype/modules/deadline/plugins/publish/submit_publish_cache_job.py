@@ -4,7 +4,6 @@ import os
 import json
 import re
 from copy import deepcopy
-import requests
 
 import pyblish.api
 
@@ -22,7 +21,11 @@ from openpype.pipeline.farm.pyblish_functions import (
     create_instances_for_cache,
     attach_instances_to_subset,
     prepare_cache_representations,
-    create_metadata_path
+    create_metadata_path,
+    save_farm_settings_snapshot,
+)
+from openpype_modules.deadline.abstract_submit_deadline import (
+    get_deadline_session_manager
 )
 
 
@@ -172,6 +175,10 @@ class ProcessSubmittedCacheJobOnFarm(pyblish.api.InstancePlugin,
             if mongo_url:
                 environment["OPENPYPE_MONGO"] = mongo_url
 
+        environment.update(
+            save_farm_settings_snapshot(instance, metadata_path)
+        )
+
         priority = self.deadline_priority or instance.data.get("priority", 50)
 
         instance_settings = self.get_attr_values_from_data(instance.data)
@@ -241,7 +248,9 @@ class ProcessSubmittedCacheJobOnFarm(pyblish.api.InstancePlugin,
         self.log.debug("Submitting Deadline publish job ...")
 
         url = "{}/api/jobs".format(self.deadline_url)
-        response = requests.post(url, json=payload, timeout=10)
+        response = get_deadline_session_manager().request(
+            "POST", url, json=payload, timeout=10
+        )
         if not response.ok:
             raise Exception(response.text)
 
@@ -4,7 +4,6 @@ import os
 import json
 import re
 from copy import deepcopy
-import requests
 import clique
 
 import pyblish.api
@@ -23,7 +22,11 @@ from openpype.pipeline.farm.pyblish_functions import (
     create_instances_for_aov,
     attach_instances_to_subset,
     prepare_representations,
-    create_metadata_path
+    create_metadata_path,
+    save_farm_settings_snapshot,
+)
+from openpype_modules.deadline.abstract_submit_deadline import (
+    get_deadline_session_manager
 )
 
 
@@ -228,6 +231,10 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin,
             if mongo_url:
                 environment["OPENPYPE_MONGO"] = mongo_url
 
+        environment.update(
+            save_farm_settings_snapshot(instance, metadata_path)
+        )
+
         priority = self.deadline_priority or instance.data.get("priority", 50)
 
         instance_settings = self.get_attr_values_from_data(instance.data)
@@ -314,7 +321,9 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin,
         self.log.debug("Submitting Deadline publish job ...")
 
         url = "{}/api/jobs".format(self.deadline_url)
-        response = requests.post(url, json=payload, timeout=10)
+        response = get_deadline_session_manager().request(
+            "POST", url, json=payload, timeout=10
+        )
         if not response.ok:
             raise Exception(response.text)
 
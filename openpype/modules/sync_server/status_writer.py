@@ -0,0 +1,213 @@
+import time
+import threading
+import collections
+
+from bson.objectid import ObjectId
+from pymongo import UpdateOne
+
+from openpype.lib import Logger
+
+
+class _PendingFileUpdate(object):
+    """Merged update of one file on one site."""
+
+    def __init__(self, file_id, site):
+        self.file_id = file_id
+        self.site = site
+        self.set_values = {}
+        self.unset_values = {}
+        self.callbacks = []
+
+    def merge(self, update, callback=None):
+        """Merge update into pending values, later values win."""
+        for key, value in update.get("$set", {}).items():
+            self.set_values[key] = value
+            self.unset_values.pop(key, None)
+
+        for key, value in update.get("$unset", {}).items():
+            self.unset_values[key] = value
+            self.set_values.pop(key, None)
+
+        if callback is not None:
+            self.callbacks.append(callback)
+
+
+class SyncStatusWriter(object):
+    """Buffer of file status updates written to DB in bulk.
+
+    Updates of files (success, error, progress) are merged per file and
+    site, and updates of all files of one representation are written by
+    single 'update_one' operation. Pending updates are written with
+    'bulk_write' per project when count of files reaches 'max_items' or
+    when oldest update is older than 'max_age' seconds.
+
+    Args:
+        get_collection (Callable[[str], Collection]): Returns DB collection
+            of a project.
+        max_items (int): Count of pending file updates which triggers write.
+        max_age (float): Seconds after which pending updates are written.
+    """
+    default_max_items = 100
+    default_max_age = 2.0
+
+    def __init__(self, get_collection, max_items=None, max_age=None):
+        if max_items is None:
+            max_items = self.default_max_items
+        if max_age is None:
+            max_age = self.default_max_age
+
+        self.log = Logger.get_logger(self.__class__.__name__)
+        self._get_collection = get_collection
+        self._max_items = max_items
+        self._max_age = max_age
+
+        self._lock = threading.Lock()
+        # Writes must keep order of updates
+        self._write_lock = threading.Lock()
+        self._pending = self._new_pending()
+        self._pending_count = 0
+        self._oldest_time = None
+
+    @staticmethod
+    def _new_pending():
+        # {project_name: {representation_id: {(file_id, site): update}}}
+        return collections.defaultdict(
+            lambda: collections.defaultdict(collections.OrderedDict)
+        )
+
+    @property
+    def pending_count(self):
+        return self._pending_count
+
+    def add(
+        self, project_name, representation_id, file_id, site, update,
+        callback=None
+    ):
+        """Add update of file on site.
+
+        Args:
+            project_name (str): Name of project.
+            representation_id (Union[str, ObjectId]): Representation id.
+            file_id (Union[str, ObjectId]): Id of file in representation.
+            site (str): Name of site.
+            update (dict[str, dict]): Update with '$set' and '$unset' keys
+                using 'files.$[f].sites.$[s]' paths.
+            callback (Optional[Callable]): Called when update was written.
+        """
+        key = (str(file_id), site)
+        with self._lock:
+            repre_updates = self._pending[project_name][representation_id]
+            file_update = repre_updates.get(key)
+            if file_update is None:
+                file_update = _PendingFileUpdate(file_id, site)
+                repre_updates[key] = file_update
+                self._pending_count += 1
+
+            file_update.merge(update, callback)
+            if self._oldest_time is None:
+                self._oldest_time = time.time()
+
+        if self.is_due():
+            self.flush()
+
+    def is_due(self):
+        """Pending updates should be written."""
+        if not self._pending_count:
+            return False
+        if self._pending_count >= self._max_items:
+            return True
+        oldest_time = self._oldest_time
+        return (
+            oldest_time is not None
+            and (time.time() - oldest_time) >= self._max_age
+        )
+
+    def flush(self, force=True):
+        """Write pending updates to DB.
+
+        Args:
+            force (bool): Write even if thresholds were not reached.
+        """
+        if not force and not self.is_due():
+            return
+
+        with self._write_lock:
+            with self._lock:
+                pending = self._pending
+                self._pending = self._new_pending()
+                self._pending_count = 0
+                self._oldest_time = None
+
+            for project_name, repre_updates in pending.items():
+                self._write_project(project_name, repre_updates)
+
+    def _write_project(self, project_name, repre_updates):
+        operations = []
+        callbacks = []
+        for representation_id, file_updates in repre_updates.items():
+            operations.append(
+                self._prepare_operation(representation_id, file_updates)
+            )
+            for file_update in file_updates.values():
+                callbacks.extend(file_update.callbacks)
+
+        if operations:
+            try:
+                self._get_collection(project_name).bulk_write(
+                    operations, ordered=False
+                )
+            except Exception:
+                self.log.warning(
+                    "Failed to write {} status updates of '{}'".format(
+                        len(operations), project_name
+                    ),
+                    exc_info=True
+                )
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                self.log.warning("Update callback failed", exc_info=True)
+
+    @staticmethod
+    def _prepare_operation(representation_id, file_updates):
+        """Create one update operation for all files of representation.
+
+        Each file and site pair gets own array filter identifiers.
+        """
+        update = {}
+        array_filters = []
+        for idx, file_update in enumerate(file_updates.values()):
+            file_ident = "f{}".format(idx)
+            site_ident = "s{}".format(idx)
+
+            for src_key, dst_key in (
+                ("set_values", "$set"),
+                ("unset_values", "$unset"),
+            ):
+                values = getattr(file_update, src_key)
+                if not values:
+                    continue
+                dst_values = update.setdefault(dst_key, {})
+                for key, value in values.items():
+                    key = (
+                        key
+                        .replace("$[f]", "$[{}]".format(file_ident))
+                        .replace("$[s]", "$[{}]".format(site_ident))
+                    )
+                    dst_values[key] = value
+
+            array_filters.append(
+                {"{}._id".format(file_ident): ObjectId(file_update.file_id)}
+            )
+            array_filters.append(
+                {"{}.name".format(site_ident): file_update.site}
+            )
+
+        return UpdateOne(
+            {"_id": representation_id},
+            update,
+            upsert=True,
+            array_filters=array_filters
+        )
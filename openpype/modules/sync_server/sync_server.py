@@ -1,7 +1,10 @@
 """Python 3 only implementation."""
 import os
+import time
 import asyncio
+import functools
 import threading
+import collections
 import concurrent.futures
 from time import sleep
 
@@ -17,7 +20,8 @@ from .utils import SyncStatus, ResumableError
 
 
 async def upload(module, project_name, file, representation, provider_name,
-                 remote_site_name, tree=None, preset=None):
+                 remote_site_name, tree=None, preset=None, executor=None,
+                 lock=None):
     """
         Upload single 'file' of a 'representation' to 'provider'.
         Source url is taken from 'file' portion, where {root} placeholder
@@ -41,35 +45,48 @@ async def upload(module, project_name, file, representation, provider_name,
             have multiple sites (different accounts, credentials)
         tree (dictionary): injected memory structure for performance
         preset (dictionary): site config ('credentials_url', 'root'...)
+        executor (concurrent.futures.Executor): executor where upload runs,
+            default executor of loop is used if not passed
+        lock (threading.Lock): lock guarding structure on 'remote_site',
+            'module.lock' is used if not passed
 
     """
-    # create ids sequentially, upload file in parallel later
-    with module.lock:
-        # this part modifies structure on 'remote_site', only single
-        # thread can do that at a time, upload/download to prepared
-        # structure should be run in parallel
-        remote_handler = lib.factory.get_provider(provider_name,
-                                                  project_name,
-                                                  remote_site_name,
-                                                  tree=tree,
-                                                  presets=preset)
-
-        file_path = file.get("path", "")
-        local_file_path, remote_file_path = resolve_paths(
-            module, file_path, project_name,
-            remote_site_name, remote_handler
-        )
+    if lock is None:
+        lock = module.lock
+
+    def _prepare_upload():
+        # create ids sequentially, upload file in parallel later
+        with lock:
+            # this part modifies structure on 'remote_site', only single
+            # thread can do that at a time, upload/download to prepared
+            # structure should be run in parallel
+            remote_handler = lib.factory.get_provider(provider_name,
+                                                      project_name,
+                                                      remote_site_name,
+                                                      tree=tree,
+                                                      presets=preset)
+
+            file_path = file.get("path", "")
+            local_file_path, remote_file_path = resolve_paths(
+                module, file_path, project_name,
+                remote_site_name, remote_handler
+            )
 
-        target_folder = os.path.dirname(remote_file_path)
-        folder_id = remote_handler.create_folder(target_folder)
+            target_folder = os.path.dirname(remote_file_path)
+            folder_id = remote_handler.create_folder(target_folder)
 
-        if not folder_id:
-            err = "Folder {} wasn't created. Check permissions.". \
-                format(target_folder)
-            raise NotADirectoryError(err)
+            if not folder_id:
+                err = "Folder {} wasn't created. Check permissions.". \
+                    format(target_folder)
+                raise NotADirectoryError(err)
+        return remote_handler, local_file_path, remote_file_path
 
     loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
+    # folder creation could be slow, do not block event loop
+    remote_handler, local_file_path, remote_file_path = (
+        await loop.run_in_executor(executor, _prepare_upload)
+    )
+    file_id = await loop.run_in_executor(executor,
                                          remote_handler.upload_file,
                                          local_file_path,
                                          remote_file_path,
@@ -89,7 +106,8 @@ async def upload(module, project_name, file, representation, provider_name,
 
 
 async def download(module, project_name, file, representation, provider_name,
-                   remote_site_name, tree=None, preset=None):
+                   remote_site_name, tree=None, preset=None, executor=None,
+                   lock=None):
     """
         Downloads file to local folder denoted in representation.Context.
 
@@ -103,29 +121,43 @@ async def download(module, project_name, file, representation, provider_name,
             have multiple sites (different accounts, credentials)
         tree (dictionary): injected memory structure for performance
         preset (dictionary): site config ('credentials_url', 'root'...)
+        executor (concurrent.futures.Executor): executor where download
+            runs, default executor of loop is used if not passed
+        lock (threading.Lock): lock guarding structure on 'remote_site',
+            'module.lock' is used if not passed
 
         Returns:
         (string) - 'name' of local file
     """
-    with module.lock:
-        remote_handler = lib.factory.get_provider(provider_name,
-                                                  project_name,
-                                                  remote_site_name,
-                                                  tree=tree,
-                                                  presets=preset)
-
-        file_path = file.get("path", "")
-        local_file_path, remote_file_path = resolve_paths(
-            module, file_path, project_name, remote_site_name, remote_handler
-        )
+    if lock is None:
+        lock = module.lock
+
+    def _prepare_download():
+        with lock:
+            remote_handler = lib.factory.get_provider(provider_name,
+                                                      project_name,
+                                                      remote_site_name,
+                                                      tree=tree,
+                                                      presets=preset)
+
+            file_path = file.get("path", "")
+            local_file_path, remote_file_path = resolve_paths(
+                module, file_path, project_name, remote_site_name,
+                remote_handler
+            )
+
+            local_folder = os.path.dirname(local_file_path)
+            os.makedirs(local_folder, exist_ok=True)
+        return remote_handler, local_file_path, remote_file_path
 
-        local_folder = os.path.dirname(local_file_path)
-        os.makedirs(local_folder, exist_ok=True)
+    loop = asyncio.get_running_loop()
+    remote_handler, local_file_path, remote_file_path = (
+        await loop.run_in_executor(executor, _prepare_download)
+    )
 
     local_site = module.get_active_site(project_name)
 
-    loop = asyncio.get_running_loop()
-    file_id = await loop.run_in_executor(None,
+    file_id = await loop.run_in_executor(executor,
                                          remote_handler.download_file,
                                          remote_file_path,
                                          local_file_path,
@@ -285,11 +317,161 @@ def download_last_published_workfile(
     return last_published_workfile_path
 
 
+class SyncItem(object):
+    """Single file which should be uploaded or downloaded."""
+
+    def __init__(
+        self, project_name, status, file, representation, provider_name,
+        remote_site, db_site, tree, preset, key
+    ):
+        self.project_name = project_name
+        self.status = status
+        self.file = file
+        self.representation = representation
+        self.provider_name = provider_name
+        self.remote_site = remote_site
+        # site which is updated in DB after processing
+        self.db_site = db_site
+        self.tree = tree
+        self.preset = preset
+        self.key = key
+
+
+class SiteWorkerPool(object):
+    """Workers processing files of one remote site.
+
+    Files are put into bounded queue so producer waits when all workers
+    are busy. Each pool has own executor and lock so slow site does not
+    block other sites.
+
+    Args:
+        thread (SyncServerThread): Thread which owns the pool.
+        site_name (str): Name of remote site.
+        workers (int): Count of files processed in parallel.
+    """
+
+    def __init__(self, thread, site_name, workers):
+        self.thread = thread
+        self.site_name = site_name
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers
+        )
+        self.queue = asyncio.Queue(maxsize=workers * 2)
+        self._worker_tasks = [
+            asyncio.ensure_future(self._work())
+            for _ in range(workers)
+        ]
+
+    async def put(self, item):
+        await self.queue.put(item)
+
+    async def close(self):
+        """Stop workers when all queued files are processed."""
+        for _ in self._worker_tasks:
+            await self.queue.put(None)
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self.executor.shutdown(wait=False)
+
+    def shutdown(self):
+        for task in self._worker_tasks:
+            task.cancel()
+        self.executor.shutdown(wait=True)
+
+    async def _work(self):
+        while True:
+            item = await self.queue.get()
+            try:
+                if item is None:
+                    return
+                await self._process(item)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Keep worker alive, file is tried again in next delayed loop
+                self.thread.log.warning(
+                    "Failed to process file of \"{}\" on site \"{}\"".format(
+                        item.project_name, self.site_name
+                    ),
+                    exc_info=True
+                )
+                self.thread.failed_keys.add(item.key)
+                self.thread.in_progress_keys.discard(item.key)
+            finally:
+                self.queue.task_done()
+
+    async def _process(self, item):
+        module = self.thread.module
+        func = upload
+        if item.status == SyncStatus.DO_DOWNLOAD:
+            func = download
+
+        file_id = None
+        error = None
+        try:
+            file_id = await func(module,
+                                 item.project_name,
+                                 item.file,
+                                 item.representation,
+                                 item.provider_name,
+                                 item.remote_site,
+                                 item.tree,
+                                 item.preset,
+                                 executor=self.executor,
+                                 lock=self.lock)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            error = str(exc)
+            self.thread.failed_keys.add(item.key)
+
+        # File is released when status is written so next search of DB
+        # does not find it again
+        def release():
+            self.thread.in_progress_keys.discard(item.key)
+
+        # Status writer may write buffered updates to DB, do not block
+        #   event loop
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(
+                self.executor,
+                functools.partial(
+                    module.update_db,
+                    item.project_name,
+                    file_id,
+                    item.file,
+                    item.representation,
+                    item.db_site,
+                    error,
+                    callback=release
+                )
+            )
+        except Exception:
+            release()
+            raise
+
+
 class SyncServerThread(threading.Thread):
     """
         Separate thread running synchronization server with asyncio loop.
         Stopped when tray is closed.
+
+        Files which should be synchronized are streamed from DB into
+        bounded queues of remote sites where are processed by workers of
+        the site. DB is searched again right after all found files are
+        queued, so transfers continue without waiting for the slowest file.
+        Files that are queued or processed are skipped by next search and
+        files that failed are not tried again until next delayed loop.
+
+        Next search waits at least 'min_search_interval' seconds and until
+        queues of sites are empty. Batch limit of provider is shared by all
+        searches until next delayed loop.
     """
+    default_site_workers = 3
+    min_search_interval = 1
+
     def __init__(self, module):
         self.log = Logger.get_logger(self.__class__.__name__)
 
@@ -299,6 +481,12 @@ class SyncServerThread(threading.Thread):
         self.is_running = False
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
         self.timer = None
+        self.site_pools = {}
+        self.in_progress_keys = set()
+        self.failed_keys = set()
+        # Count of queued files by project and remote site until next
+        #   delayed loop
+        self.queued_counts = collections.Counter()
 
     def run(self):
         self.is_running = True
@@ -326,134 +514,49 @@ class SyncServerThread(threading.Thread):
                 - gets list of collections in DB
                 - gets list of active remote providers (has configuration,
                     credentials)
-                - for each project_name it looks for representations that
-                  should be synced
-                - synchronize found collections
-                - update representations - fills error messages for exceptions
-                - waits X seconds and repeat
+                - for each project_name it streams files of representations
+                  that should be synced into queues of remote sites
+                - workers of remote sites synchronize queued files and
+                  update representations - fills error messages for
+                  exceptions
+                - searches again immediately if any file was queued,
+                  otherwise waits X seconds and repeat
         Returns:
 
         """
+        search_again = False
         while self.is_running and not self.module.is_paused():
             try:
-                import time
                 start_time = time.time()
-                self.module.set_sync_project_settings()  # clean cache
+                if not search_again:
+                    self.module.set_sync_project_settings()  # clean cache
+                    self.queued_counts.clear()
+                search_again = False
                 project_name = None
+                queued_count = 0
                 enabled_projects = self.module.get_enabled_projects()
                 for project_name in enabled_projects:
-                    preset = self.module.sync_project_settings[project_name]
-
-                    local_site, remote_site = self._working_sites(project_name,
-                                                                  preset)
-                    if not all([local_site, remote_site]):
-                        continue
-
-                    sync_repres = self.module.get_sync_representations(
-                        project_name,
-                        local_site,
-                        remote_site
+                    queued_count += await self._queue_project_files(
+                        project_name
                     )
 
-                    task_files_to_process = []
-                    files_processed_info = []
-                    # process only unique file paths in one batch
-                    # multiple representation could have same file path
-                    # (textures),
-                    # upload process can find already uploaded file and
-                    # reuse same id
-                    processed_file_path = set()
-
-                    site_preset = preset.get('sites')[remote_site]
-                    remote_provider = \
-                        self.module.get_provider_for_site(site=remote_site)
-                    handler = lib.factory.get_provider(remote_provider,
-                                                       project_name,
-                                                       remote_site,
-                                                       presets=site_preset)
-                    limit = lib.factory.get_provider_batch_limit(
-                        remote_provider)
-                    # first call to get_provider could be expensive, its
-                    # building folder tree structure in memory
-                    # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
-                    for sync in sync_repres:
-                        if limit <= 0:
-                            continue
-                        files = sync.get("files") or []
-                        if files:
-                            for file in files:
-                                # skip already processed files
-                                file_path = file.get('path', '')
-                                if file_path in processed_file_path:
-                                    continue
-                                status = self.module.check_status(
-                                    file,
-                                    local_site,
-                                    remote_site,
-                                    preset.get('config'))
-                                if status == SyncStatus.DO_UPLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        upload(self.module,
-                                               project_name,
-                                               file,
-                                               sync,
-                                               remote_provider,
-                                               remote_site,
-                                               tree,
-                                               site_preset))
-                                    task_files_to_process.append(task)
-                                    # store info for exception handlingy
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 remote_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-                                if status == SyncStatus.DO_DOWNLOAD:
-                                    tree = handler.get_tree()
-                                    limit -= 1
-                                    task = asyncio.create_task(
-                                        download(self.module,
-                                                 project_name,
-                                                 file,
-                                                 sync,
-                                                 remote_provider,
-                                                 remote_site,
-                                                 tree,
-                                                 site_preset))
-                                    task_files_to_process.append(task)
-
-                                    files_processed_info.append((file,
-                                                                 sync,
-                                                                 local_site,
-                                                                 project_name
-                                                                 ))
-                                    processed_file_path.add(file_path)
-
-                    self.log.debug("Sync tasks count {}".format(
-                        len(task_files_to_process)
-                    ))
-                    files_created = await asyncio.gather(
-                        *task_files_to_process,
-                        return_exceptions=True)
-                    for file_id, info in zip(files_created,
-                                             files_processed_info):
-                        file, representation, site, project_name = info
-                        error = None
-                        if isinstance(file_id, BaseException):
-                            error = str(file_id)
-                            file_id = None
-                        self.module.update_db(project_name,
-                                              file_id,
-                                              file,
-                                              representation,
-                                              site,
-                                              error)
-
                 duration = time.time() - start_time
-                self.log.debug("One loop took {:.2f}s".format(duration))
+                self.log.debug(
+                    "Search of files took {:.2f}s, queued {} files".format(
+                        duration, queued_count
+                    )
+                )
+                if queued_count:
+                    # Search again while workers are processing queued files
+                    search_again = True
+                    await self._wait_for_search(start_time)
+                    continue
+
+                # Failed files can be tried again in next delayed loop
+                self.failed_keys.clear()
+                await self.loop.run_in_executor(
+                    None, self.module.flush_db_updates
+                )
                 delay = self.module.get_loop_delay(project_name)
                 self.log.debug(
                     "Waiting for {} seconds to new loop".format(delay)
@@ -478,6 +581,138 @@ class SyncServerThread(threading.Thread):
                     "Unhandled except. in sync loop, stopping server",
                     exc_info=True)
 
+    async def _wait_for_search(self, start_time):
+        """Wait before files are searched again without delay.
+
+        Args:
+            start_time (float): Time when previous search started.
+        """
+        delay = self.min_search_interval - (time.time() - start_time)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        while self.is_running and any(
+            not pool.queue.empty()
+            for pool in self.site_pools.values()
+        ):
+            await asyncio.sleep(0.1)
+
+    async def _queue_project_files(self, project_name):
+        """Put files of project which should be synchronized to queues.
+
+        Waits when queue of remote site is full.
+
+        Returns:
+            int: Count of queued files.
+        """
+        preset = self.module.sync_project_settings[project_name]
+
+        local_site, remote_site = self._working_sites(project_name, preset)
+        if not all([local_site, remote_site]):
+            return 0
+
+        sync_repres = self.module.get_sync_representations(
+            project_name,
+            local_site,
+            remote_site
+        )
+
+        # process only unique file paths in one batch
+        # multiple representation could have same file path
+        # (textures),
+        # upload process can find already uploaded file and
+        # reuse same id
+        processed_file_path = set()
+
+        site_preset = preset.get('sites')[remote_site]
+        remote_provider = \
+            self.module.get_provider_for_site(site=remote_site)
+        handler = lib.factory.get_provider(remote_provider,
+                                           project_name,
+                                           remote_site,
+                                           presets=site_preset)
+        # Limit is shared by all searches until next delayed loop
+        limit_key = (project_name, remote_site)
+        limit = (
+            lib.factory.get_provider_batch_limit(remote_provider)
+            - self.queued_counts[limit_key]
+        )
+        pool = await self._get_site_pool(remote_site, preset)
+        queued_count = 0
+        # first call to get_provider could be expensive, its
+        # building folder tree structure in memory
+        # call only if needed, eg. DO_UPLOAD or DO_DOWNLOAD
+        for sync in sync_repres:
+            if limit <= 0 or not self.is_running:
+                break
+            files = sync.get("files") or []
+            for file in files:
+                # skip already processed files
+                file_path = file.get('path', '')
+                key = (project_name, file_path)
+                if (
+                    file_path in processed_file_path
+                    or key in self.in_progress_keys
+                    or key in self.failed_keys
+                ):
+                    continue
+                status = self.module.check_status(
+                    file,
+                    local_site,
+                    remote_site,
+                    preset.get('config'))
+                if status == SyncStatus.DO_UPLOAD:
+                    db_site = remote_site
+                elif status == SyncStatus.DO_DOWNLOAD:
+                    db_site = local_site
+                else:
+                    continue
+
+                tree = handler.get_tree()
+                limit -= 1
+                processed_file_path.add(file_path)
+                self.in_progress_keys.add(key)
+                await pool.put(SyncItem(
+                    project_name,
+                    status,
+                    file,
+                    sync,
+                    remote_provider,
+                    remote_site,
+                    db_site,
+                    tree,
+                    site_preset,
+                    key
+                ))
+                queued_count += 1
+
+        self.queued_counts[limit_key] += queued_count
+        self.log.debug("Sync tasks count {}".format(queued_count))
+        return queued_count
+
+    async def _get_site_pool(self, site_name, preset):
+        """Get workers pool of remote site.
+
+        Pool is recreated when count of workers changed in settings.
+        """
+        workers = (preset.get("config") or {}).get("site_workers")
+        try:
+            workers = max(int(workers), 1)
+        except (TypeError, ValueError):
+            workers = self.default_site_workers
+
+        pool = self.site_pools.get(site_name)
+        if pool is not None and pool.workers != workers:
+            self.site_pools.pop(site_name)
+            # Finish already queued files in background
+            asyncio.ensure_future(pool.close())
+            pool = None
+
+        if pool is None:
+            pool = SiteWorkerPool(self, site_name, workers)
+            self.site_pools[site_name] = pool
+        return pool
+
     def stop(self):
         """Sets is_running flag to false, 'check_shutdown' shuts server down"""
         self.is_running = False
@@ -493,6 +728,9 @@ class SyncServerThread(threading.Thread):
                 await self.loop.run_in_executor(None, task["func"])
                 self.log.info("finished long running")
                 self.module.projects_processed.remove(task["project_name"])
+            await self.loop.run_in_executor(
+                None, self.module.flush_db_updates, False
+            )
             await asyncio.sleep(0.5)
         tasks = [task for task in asyncio.all_tasks() if
                  task is not asyncio.current_task()]
@@ -502,6 +740,16 @@ class SyncServerThread(threading.Thread):
             f'Finished awaiting cancelled tasks, results: {results}...')
         await self.loop.shutdown_asyncgens()
         # to really make sure everything else has time to stop
+        for pool in self.site_pools.values():
+            pool.shutdown()
+        self.site_pools = {}
+        # write statuses of finished files
+        try:
+            self.module.flush_db_updates()
+        except Exception:
+            self.log.warning(
+                "Failed to write file statuses", exc_info=True
+            )
         self.executor.shutdown(wait=True)
         await asyncio.sleep(0.07)
         self.loop.stop()
@@ -11,7 +11,6 @@ from bson.objectid import ObjectId
 
 from openpype.client import (
     get_projects,
-    get_representations,
     get_representation_by_id,
 )
 from openpype.modules import (
@@ -139,6 +138,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         self._anatomies = {}
 
         self._connection = None
+        # buffered writer of file statuses, used when server is running
+        self._status_writer = None
 
         # list of long blocking tasks
         self.long_running_tasks = deque()
@@ -476,77 +477,44 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         self.projects_processed.add(project_name)
         self.long_running_tasks.append(task)
 
-    def validate_project(self, project_name, site_name, reset_missing=False):
+    def validate_project(self, project_name, site_name, reset_missing=False,
+                         resume=True):
         """Validate 'project_name' of 'site_name' and its local files
 
         If file present and not marked with a 'site_name' in DB, DB is
         updated with site name and file modified date.
 
+        Representations are processed in pages, files are checked in
+        parallel and progress is stored so interrupted validation
+        continues with next run (see 'ProjectSiteValidator').
+
         Args:
             project_name (string): project name
             site_name (string): active site name
             reset_missing (bool): if True reset site in DB if missing
                 physically
+            resume (bool): continue interrupted validation
         """
+        from .validation import ProjectSiteValidator
+
         self.log.debug("Validation of {} for {} started".format(project_name,
                                                                 site_name))
-        representations = list(get_representations(project_name))
-        if not representations:
-            self.log.debug("No repre found")
-            return
-
-        sites_added = 0
-        sites_reset = 0
-        for repre in representations:
-            repre_id = repre["_id"]
-            for repre_file in repre.get("files", []):
-                try:
-                    is_on_site = site_name in [site["name"]
-                                               for site in repre_file["sites"]
-                                               if (site.get("created_dt") and
-                                               not site.get("error"))]
-                except (TypeError, AttributeError):
-                    self.log.debug("Structure error in {}".format(repre_id))
-                    continue
-
-                file_path = repre_file.get("path", "")
-                local_file_path = self.get_local_file_path(project_name,
-                                                           site_name,
-                                                           file_path)
-
-                file_exists = (local_file_path and
-                               os.path.exists(local_file_path))
-                if not is_on_site:
-                    if file_exists:
-                        self.log.debug(
-                            "Adding site {} for {}".format(site_name,
-                                                           repre_id))
-
-                        created_dt = datetime.fromtimestamp(
-                            os.path.getmtime(local_file_path))
-                        elem = {"name": site_name,
-                                "created_dt": created_dt}
-                        self._add_site(project_name, repre, elem,
-                                       site_name=site_name,
-                                       file_id=repre_file["_id"],
-                                       force=True)
-                        sites_added += 1
-                else:
-                    if not file_exists and reset_missing:
-                        self.log.debug("Resetting site {} for {}".
-                                       format(site_name, repre_id))
-                        self.reset_site_on_representation(
-                            project_name, repre_id, site_name=site_name,
-                            file_id=repre_file["_id"])
-                        sites_reset += 1
-
-        if sites_added % 100 == 0:
-            self.log.debug("Sites added {}".format(sites_added))
+        handler = LocalDriveHandler(project_name, site_name)
+        root_config = handler.get_roots_config()
+
+        validator = ProjectSiteValidator(
+            self.connection.database[project_name],
+            project_name,
+            site_name,
+            lambda path: handler.resolve_path(path, root_config),
+            reset_missing=reset_missing
+        )
+        sites_added, sites_reset = validator.validate(resume)
 
         self.log.debug("Validation of {} for {} ended".format(project_name,
                                                               site_name))
         self.log.info("Sites added {}, sites reset {}".format(sites_added,
-                                                              reset_missing))
+                                                              sites_reset))
 
     def pause_representation(self, project_name, representation_id, site_name):
         """
@@ -1418,7 +1386,12 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
         from .sync_server import SyncServerThread
 
+        from .status_writer import SyncStatusWriter
+
         self.lock = threading.Lock()
+        self._status_writer = SyncStatusWriter(
+            lambda project_name: self.connection.database[project_name]
+        )
 
         self.sync_server_thread = SyncServerThread(self)
 
@@ -1852,11 +1825,15 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
         return SyncStatus.DO_NOTHING
 
     def update_db(self, project_name, new_file_id, file, representation,
-                  site, error=None, progress=None, priority=None):
+                  site, error=None, progress=None, priority=None,
+                  callback=None):
         """
             Update 'provider' portion of records in DB with success (file_id)
             or error (exception)
 
+            When server is running, updates of files (except priority) are
+            buffered and written in bulk, see 'flush_db_updates'.
+
         Args:
             project_name (string): name of project - force to db connection as
               each file might come from different collection
@@ -1867,6 +1844,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             error (string): exception message
             progress (float): 0-0.99 of progress of upload/download
             priority (int): 0-100 set priority
+            callback (Callable): called when update is written to DB
 
         Returns:
             None
@@ -1895,18 +1873,35 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
 
             update["$set"] = self._get_error_dict(error, tries)
 
-        arr_filter = [
-            {'s.name': site}
-        ]
-        if file_id:
-            arr_filter.append({'f._id': ObjectId(file_id)})
+        if (
+            self._status_writer is not None
+            and file_id
+            and priority is None
+        ):
+            self._status_writer.add(
+                project_name,
+                representation_id,
+                file_id,
+                site,
+                update,
+                callback
+            )
 
-        self.connection.database[project_name].update_one(
-            query,
-            update,
-            upsert=True,
-            array_filters=arr_filter
-        )
+        else:
+            arr_filter = [
+                {'s.name': site}
+            ]
+            if file_id:
+                arr_filter.append({'f._id': ObjectId(file_id)})
+
+            self.connection.database[project_name].update_one(
+                query,
+                update,
+                upsert=True,
+                array_filters=arr_filter
+            )
+            if callback is not None:
+                callback()
 
         if progress is not None or priority is not None:
             return
@@ -1929,6 +1924,16 @@ class SyncServerModule(OpenPypeModule, ITrayModule, IPluginPaths):
             )
         )
 
+    def flush_db_updates(self, force=True):
+        """Write buffered updates of files to DB.
+
+        Args:
+            force (bool): Write even if size or time threshold of buffer
+                was not reached.
+        """
+        if self._status_writer is not None:
+            self._status_writer.flush(force)
+
     def _get_file_info(self, files, _id):
         """
             Return record from list of records which name matches to 'provider'
@@ -0,0 +1,316 @@
+import os
+import json
+import collections
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import appdirs
+from bson.objectid import ObjectId
+from pymongo import UpdateOne
+
+from openpype.lib import Logger
+
+
+class ProjectSiteValidator(object):
+    """Validate files of project representations on a site.
+
+    Representations are read from DB in pages sorted by id. Files of a page
+    are checked in parallel, directory by directory using 'os.scandir', and
+    site changes of the page are written with one 'bulk_write'. Id of last
+    processed representation is stored to checkpoint file after each page
+    so interrupted validation can continue where it ended.
+
+    If file is present and not marked with a 'site_name' in DB, site is
+    added with file modified date. If 'reset_missing' is enabled and file
+    is marked with 'site_name' but is not present, site is reset.
+
+    Args:
+        collection (Collection): Project collection.
+        project_name (str): Name of project.
+        site_name (str): Name of validated site.
+        resolve_path (Callable[[str], str]): Resolves file path from
+            representation to local path.
+        reset_missing (bool): Reset site on missing files.
+        workers (int): Count of threads checking directories.
+        checkpoint_dir (str): Directory where checkpoint files are stored.
+    """
+    page_size = 1000
+    default_workers = 8
+
+    def __init__(
+        self,
+        collection,
+        project_name,
+        site_name,
+        resolve_path,
+        reset_missing=False,
+        workers=None,
+        checkpoint_dir=None
+    ):
+        if workers is None:
+            workers = self.default_workers
+        if checkpoint_dir is None:
+            checkpoint_dir = os.path.join(
+                appdirs.user_data_dir("openpype", "pypeclub"),
+                "sync_server_validation"
+            )
+
+        self.log = Logger.get_logger(self.__class__.__name__)
+        self._collection = collection
+        self._project_name = project_name
+        self._site_name = site_name
+        self._resolve_path = resolve_path
+        self._reset_missing = reset_missing
+        self._workers = max(int(workers), 1)
+        self._checkpoint_dir = checkpoint_dir
+
+        self.sites_added = 0
+        self.sites_reset = 0
+
+    @property
+    def checkpoint_path(self):
+        filename = "{}_{}.json".format(self._project_name, self._site_name)
+        return os.path.join(self._checkpoint_dir, filename)
+
+    def load_checkpoint(self):
+        """Checkpoint of interrupted validation.
+
+        Returns:
+            Union[dict[str, Any], None]: Checkpoint data or None.
+        """
+        path = self.checkpoint_path
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as stream:
+                data = json.load(stream)
+        except (OSError, ValueError):
+            self.log.warning(
+                "Failed to read checkpoint {}".format(path), exc_info=True
+            )
+            return None
+
+        if data.get("reset_missing") != self._reset_missing:
+            return None
+        return data
+
+    def clear_checkpoint(self):
+        path = self.checkpoint_path
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _save_checkpoint(self, last_id):
+        data = {
+            "last_id": str(last_id),
+            "reset_missing": self._reset_missing,
+            "sites_added": self.sites_added,
+            "sites_reset": self.sites_reset,
+        }
+        if not os.path.exists(self._checkpoint_dir):
+            os.makedirs(self._checkpoint_dir)
+
+        # Write to temp file first so checkpoint is never half written
+        path = self.checkpoint_path
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as stream:
+            json.dump(data, stream)
+        os.replace(tmp_path, path)
+
+    def validate(self, resume=True):
+        """Run validation.
+
+        Args:
+            resume (bool): Continue from checkpoint of interrupted
+                validation if there is any.
+
+        Returns:
+            tuple[int, int]: Count of added and reset sites.
+        """
+        last_id = None
+        checkpoint = None
+        if resume:
+            checkpoint = self.load_checkpoint()
+
+        if checkpoint:
+            last_id = ObjectId(checkpoint["last_id"])
+            self.sites_added = checkpoint.get("sites_added", 0)
+            self.sites_reset = checkpoint.get("sites_reset", 0)
+            self.log.debug(
+                "Resuming validation of {} for {} after {}".format(
+                    self._project_name, self._site_name, last_id
+                )
+            )
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            for page in self._iter_pages(last_id):
+                self._process_page(page, executor)
+                self._save_checkpoint(page[-1]["_id"])
+                self.log.debug("Sites added {}, sites reset {}".format(
+                    self.sites_added, self.sites_reset
+                ))
+
+        self.clear_checkpoint()
+        return self.sites_added, self.sites_reset
+
+    def _iter_pages(self, last_id):
+        query = {"type": "representation"}
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+
+        cursor = (
+            self._collection
+            .find(query, {"files": True})
+            .sort("_id", 1)
+            .batch_size(self.page_size)
+        )
+        page = []
+        for repre in cursor:
+            page.append(repre)
+            if len(page) >= self.page_size:
+                yield page
+                page = []
+        if page:
+            yield page
+
+    def _process_page(self, representations, executor):
+        site_name = self._site_name
+        items = []
+        filenames_by_dir = collections.defaultdict(set)
+        for repre in representations:
+            repre_id = repre["_id"]
+            for repre_file in repre.get("files") or []:
+                try:
+                    file_id = repre_file["_id"]
+                    sites = repre_file["sites"]
+                    is_on_site = any(
+                        site["name"] == site_name
+                        and site.get("created_dt")
+                        and not site.get("error")
+                        for site in sites
+                    )
+                    has_site = any(
+                        site["name"] == site_name
+                        for site in sites
+                    )
+                except (TypeError, AttributeError, KeyError):
+                    self.log.debug("Structure error in {}".format(repre_id))
+                    continue
+
+                # Only files which would change something are checked
+                if is_on_site and not self._reset_missing:
+                    continue
+
+                local_path = None
+                file_path = repre_file.get("path")
+                if file_path:
+                    local_path = self._resolve_path(file_path)
+
+                if local_path:
+                    dirpath, filename = os.path.split(local_path)
+                    filenames_by_dir[dirpath].add(filename)
+
+                items.append(
+                    (repre_id, file_id, is_on_site, has_site, local_path)
+                )
+
+        mtimes = {}
+        dirpaths = list(filenames_by_dir.keys())
+        results = executor.map(
+            lambda dirpath: self._scan_directory(
+                dirpath, filenames_by_dir[dirpath]
+            ),
+            dirpaths
+        )
+        for dirpath, result in zip(dirpaths, results):
+            for filename, mtime in result.items():
+                mtimes[os.path.join(dirpath, filename)] = mtime
+
+        operations = []
+        for repre_id, file_id, is_on_site, has_site, local_path in items:
+            mtime = None
+            if local_path:
+                mtime = mtimes.get(local_path)
+
+            if not is_on_site:
+                if mtime is None:
+                    continue
+                elem = {
+                    "name": site_name,
+                    "created_dt": datetime.fromtimestamp(mtime)
+                }
+                self.log.debug(
+                    "Adding site {} for {}".format(site_name, repre_id))
+                operations.append(
+                    self._site_operation(repre_id, file_id, elem, has_site)
+                )
+                self.sites_added += 1
+
+            elif mtime is None:
+                self.log.debug(
+                    "Resetting site {} for {}".format(site_name, repre_id))
+                operations.append(self._site_operation(
+                    repre_id, file_id, {"name": site_name}, True
+                ))
+                self.sites_reset += 1
+
+        if operations:
+            self._collection.bulk_write(operations, ordered=True)
+
+    def _site_operation(self, repre_id, file_id, elem, replace):
+        """Update operation setting site element of a file."""
+        if not isinstance(file_id, ObjectId):
+            file_id = ObjectId(file_id)
+
+        if replace:
+            update = {"$set": {"files.$[f].sites.$[s]": elem}}
+            array_filters = [
+                {"s.name": self._site_name},
+                {"f._id": file_id}
+            ]
+        else:
+            update = {"$push": {"files.$[f].sites": elem}}
+            array_filters = [{"f._id": file_id}]
+
+        return UpdateOne(
+            {"_id": ObjectId(repre_id)},
+            update,
+            upsert=True,
+            array_filters=array_filters
+        )
+
+    @staticmethod
+    def _scan_directory(dirpath, filenames):
+        """Modification times of files in directory.
+
+        Args:
+            dirpath (str): Path to directory.
+            filenames (set[str]): Names of files in directory.
+
+        Returns:
+            dict[str, Union[float, None]]: Modification time by filename,
+                'None' if file does not exist.
+        """
+        output = {filename: None for filename in filenames}
+        # Windows filesystem is not case sensitive
+        by_normcase = {
+            os.path.normcase(filename): filename
+            for filename in filenames
+        }
+        try:
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    filename = by_normcase.get(os.path.normcase(entry.name))
+                    if filename is not None:
+                        output[filename] = entry.stat().st_mtime
+
+        except FileNotFoundError:
+            pass
+
+        except OSError:
+            # Fallback to check files one by one
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                if os.path.exists(path):
+                    output[filename] = os.path.getmtime(path)
+
+        return output
@@ -1,7 +1,11 @@
 import os
 import re
 import copy
+import json
+import hashlib
 import platform
+import threading
+import weakref
 import collections
 import numbers
 
@@ -17,6 +21,7 @@ from openpype.settings.constants import (
 )
 from openpype.client import get_project, get_ayon_server_api_connection
 from openpype.lib import Logger, get_local_site_id
+from openpype.lib.events import register_event_callback
 from openpype.lib.path_templates import (
     TemplateUnsolved,
     TemplateResult,
@@ -417,7 +422,160 @@ class CacheItem:
         self._cached = time.time()
 
 
+ANATOMY_CHANGED_TOPIC = "project.anatomy.changed"
+
+
+class AnatomyCacheEntry:
+    """Anatomy data shared between 'Anatomy' objects.
+
+    Templates and roots are solved lazily on first access of the shared
+    'BaseAnatomy' and are reused by all 'Anatomy' objects with the same key.
+
+    Args:
+        key (tuple[str, str, Union[str, None]]): Project name, anatomy hash
+            and site name.
+        project_doc (dict[str, Any]): Project document.
+        root_overrides (Union[dict[str, str], None]): Root overrides of site.
+    """
+
+    def __init__(self, key, project_doc, root_overrides):
+        self.key = key
+        self.refcount = 0
+        self.base_anatomy = BaseAnatomy(project_doc, root_overrides)
+
+
+class AnatomyCache:
+    """Process level registry of shared anatomy data.
+
+    Entries are identified by project name, hash of project anatomy data
+    with root overrides and site name. Unchanged data always lead to the
+    same entry so solved templates and roots are not created again when
+    a new 'Anatomy' object is created.
+
+    Entries which are used by any 'Anatomy' object are never removed.
+    Unused entries are kept until 'max_unused' limit is reached or until
+    anatomy changed event is emitted.
+    """
+
+    max_unused = 16
+
+    _lock = threading.RLock()
+    _entries = {}
+    _unused = collections.OrderedDict()
+    _event_callback = None
+
+    @classmethod
+    def get_anatomy_hash(cls, project_doc, root_overrides):
+        """Hash of anatomy data of a project.
+
+        Args:
+            project_doc (dict[str, Any]): Project document.
+            root_overrides (Union[dict[str, str], None]): Root overrides.
+
+        Returns:
+            str: Hash of anatomy data.
+        """
+
+        data = {
+            "config": project_doc.get("config"),
+            "data": project_doc.get("data"),
+            "root_overrides": root_overrides,
+        }
+        content = json.dumps(data, sort_keys=True, default=str)
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def acquire(cls, anatomy, project_doc, root_overrides, site_name):
+        """Get shared entry for anatomy object.
+
+        Entry is released when the anatomy object is garbage collected.
+
+        Args:
+            anatomy (Anatomy): Anatomy object which will use the entry.
+            project_doc (dict[str, Any]): Project document.
+            root_overrides (Union[dict[str, str], None]): Root overrides.
+            site_name (Union[str, None]): Site name.
+
+        Returns:
+            AnatomyCacheEntry: Shared entry.
+        """
+
+        cls._register_event_callback()
+        key = (
+            project_doc["name"],
+            cls.get_anatomy_hash(project_doc, root_overrides),
+            site_name
+        )
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                entry = AnatomyCacheEntry(key, project_doc, root_overrides)
+                cls._entries[key] = entry
+            cls._unused.pop(key, None)
+            entry.refcount += 1
+
+        weakref.finalize(anatomy, cls.release, entry)
+        return entry
+
+    @classmethod
+    def release(cls, entry):
+        """Release entry used by an anatomy object.
+
+        Args:
+            entry (AnatomyCacheEntry): Entry which is not used anymore.
+        """
+
+        with cls._lock:
+            entry.refcount -= 1
+            if (
+                entry.refcount > 0
+                or cls._entries.get(entry.key) is not entry
+            ):
+                return
+
+            cls._unused[entry.key] = entry
+            while len(cls._unused) > cls.max_unused:
+                key, _ = cls._unused.popitem(last=False)
+                cls._entries.pop(key, None)
+
+    @classmethod
+    def invalidate(cls, project_name=None):
+        """Remove entries of project from registry.
+
+        Anatomy objects which already use removed entries are not affected.
+
+        Args:
+            project_name (Optional[str]): Project name. All entries are
+                removed when not passed.
+        """
+
+        with cls._lock:
+            for key in tuple(cls._entries.keys()):
+                if project_name is None or key[0] == project_name:
+                    cls._entries.pop(key)
+                    cls._unused.pop(key, None)
+
+    @classmethod
+    def _register_event_callback(cls):
+        if cls._event_callback is None:
+            cls._event_callback = register_event_callback(
+                ANATOMY_CHANGED_TOPIC, _on_anatomy_changed
+            )
+
+
+def _on_anatomy_changed(event):
+    # Project name is not set when default anatomy of all projects changed
+    project_name = event.get("project_name")
+    Anatomy.clear_cache(project_name)
+
+
 class Anatomy(BaseAnatomy):
+    """Anatomy of a project.
+
+    Solved templates and roots are shared with other 'Anatomy' objects
+    of the same project, anatomy data and site using 'AnatomyCache'.
+    """
+
     _sync_server_addon_cache = CacheItem()
     _project_cache = collections.defaultdict(CacheItem)
     _default_site_id_cache = collections.defaultdict(CacheItem)
@@ -435,17 +593,59 @@ class Anatomy(BaseAnatomy):
                 " to load data for specific project."
             ))
 
-        project_doc = self.get_project_doc_from_cache(project_name)
+        project_doc = self._get_cached_project_doc(project_name)
         root_overrides = self._get_site_root_overrides(project_name, site_name)
 
-        super(Anatomy, self).__init__(project_doc, root_overrides)
+        entry = AnatomyCache.acquire(
+            self, project_doc, root_overrides, site_name
+        )
+        base_anatomy = entry.base_anatomy
+        self.project_name = base_anatomy.project_name
+        self.project_code = base_anatomy.project_code
+        self._data = base_anatomy._data
+        self._templates_obj = base_anatomy.templates_obj
+        self._roots_obj = base_anatomy.roots_obj
+
+    @property
+    def templates(self):
+        """Copy of solved templates.
+
+        Templates are shared with other 'Anatomy' objects so a copy is
+        returned to avoid changes of them.
+        """
+        return copy.deepcopy(self._templates_obj.templates)
 
     @classmethod
-    def get_project_doc_from_cache(cls, project_name):
+    def _get_cached_project_doc(cls, project_name):
         project_cache = cls._project_cache[project_name]
         if project_cache.is_outdated:
             project_cache.update_data(get_project(project_name))
-        return copy.deepcopy(project_cache.data)
+        return project_cache.data
+
+    @classmethod
+    def get_project_doc_from_cache(cls, project_name):
+        return copy.deepcopy(cls._get_cached_project_doc(project_name))
+
+    @classmethod
+    def clear_cache(cls, project_name=None):
+        """Clear cached project data and shared anatomy data.
+
+        Args:
+            project_name (Optional[str]): Project name. Cache of all projects
+                is cleared when not passed.
+        """
+
+        caches = (
+            cls._project_cache,
+            cls._default_site_id_cache,
+            cls._root_overrides_cache,
+        )
+        for cache in caches:
+            if project_name is None:
+                cache.clear()
+            else:
+                cache.pop(project_name, None)
+        AnatomyCache.invalidate(project_name)
 
     @classmethod
     def get_sync_server_addon(cls):
@@ -640,6 +840,31 @@ class AnatomyStringTemplate(StringTemplate):
         rootless_path = anatomy_templates.rootless_path_from_result(result)
         return AnatomyTemplateResult(result, rootless_path)
 
+    def format_many(self, data, varying_key, values):
+        """Format template for each value of varying key.
+
+        Args:
+            data (dict[str, Any]): Formatting data for template.
+            varying_key (str): Key in data which is changing.
+            values (Iterable[Any]): Values of varying key.
+
+        Returns:
+            list[AnatomyTemplateResult]: Formatting results.
+        """
+
+        anatomy_templates = self.anatomy_templates
+        if not data.get("root"):
+            data = copy.deepcopy(data)
+            data["root"] = anatomy_templates.anatomy.roots
+        return [
+            AnatomyTemplateResult(
+                result, anatomy_templates.rootless_path_from_result(result)
+            )
+            for result in StringTemplate.format_many(
+                self, data, varying_key, values
+            )
+        ]
+
 
 class AnatomyTemplates(TemplatesDict):
     inner_key_pattern = re.compile(r"(\{@.*?[^{}0]*\})")
@@ -671,6 +896,11 @@ class AnatomyTemplates(TemplatesDict):
     @property
     def objected_templates(self):
         self._validate_discovery()
+        # Template objects are created on first access
+        if self._objected_templates is None:
+            self._objected_templates = self.create_objected_templates(
+                self._templates
+            )
         return self._objected_templates
 
     def _validate_discovery(self):
@@ -713,9 +943,7 @@ class AnatomyTemplates(TemplatesDict):
 
         solved_templates = self.solve_template_inner_links(templates)
         self._templates = solved_templates
-        self._objected_templates = self.create_objected_templates(
-            solved_templates
-        )
+        self._objected_templates = None
 
     def _create_template_object(self, template):
         return AnatomyStringTemplate(self, template)
@@ -10,6 +10,12 @@ from .utils import (
     get_next_versions_for_instances,
 )
 
+from .asset_hierarchy import (
+    AssetHierarchyIndex,
+    get_asset_hierarchy_index,
+    clear_asset_hierarchy_index,
+)
+
 from .subset_name import (
     TaskNotSetError,
     get_subset_name_template,
@@ -56,6 +62,10 @@ __all__ = (
     "get_last_versions_for_instances",
     "get_next_versions_for_instances",
 
+    "AssetHierarchyIndex",
+    "get_asset_hierarchy_index",
+    "clear_asset_hierarchy_index",
+
     "TaskNotSetError",
     "get_subset_name_template",
     "get_subset_name",
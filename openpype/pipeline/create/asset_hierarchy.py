@@ -0,0 +1,393 @@
+import time
+import datetime
+import threading
+import collections
+
+from openpype import AYON_SERVER_ENABLED
+from openpype.client import (
+    get_assets,
+    get_assets_changed_since,
+    get_asset_name_identifier,
+)
+
+
+class AssetHierarchyIndex(object):
+    """Read-only index of asset documents of a project.
+
+    Index is not changed after it is created. Refresh creates new index
+    which shares documents of unchanged assets with previous index, so
+    returned documents and containers must not be modified.
+
+    Documents contain only fields from 'fields'. Asset ids are used as
+    strings in all methods.
+
+    Args:
+        project_name (str): Name of project.
+        asset_docs_by_id (dict[str, dict[str, Any]]): Asset documents by
+            their id as string.
+        refreshed_at (datetime.datetime): UTC time when documents were
+            queried.
+    """
+
+    fields = {
+        "_id",
+        "name",
+        "data.visualParent",
+        "data.parents",
+        "data.tasks",
+    }
+
+    def __init__(self, project_name, asset_docs_by_id, refreshed_at):
+        self._project_name = project_name
+        self._asset_docs_by_id = asset_docs_by_id
+        self._refreshed_at = refreshed_at
+
+        asset_docs_by_name = {}
+        asset_docs_by_short_name = collections.defaultdict(list)
+        children_by_parent_id = collections.defaultdict(list)
+        for asset_doc in asset_docs_by_id.values():
+            asset_docs_by_name[get_asset_name_identifier(asset_doc)] = (
+                asset_doc
+            )
+            asset_docs_by_short_name[asset_doc["name"]].append(asset_doc)
+            parent_id = asset_doc["data"]["visualParent"]
+            if parent_id is not None:
+                parent_id = str(parent_id)
+            children_by_parent_id[parent_id].append(asset_doc)
+
+        self._asset_docs_by_name = asset_docs_by_name
+        self._asset_docs_by_short_name = asset_docs_by_short_name
+        self._children_by_parent_id = children_by_parent_id
+
+        # Lazy values
+        self._hierarchy = None
+        self._task_names_by_asset_name = None
+
+    @property
+    def project_name(self):
+        return self._project_name
+
+    @property
+    def refreshed_at(self):
+        return self._refreshed_at
+
+    @property
+    def asset_docs(self):
+        """All asset documents of project.
+
+        Returns:
+            list[dict[str, Any]]: Asset documents.
+        """
+
+        return list(self._asset_docs_by_id.values())
+
+    def get_asset_by_id(self, asset_id):
+        if asset_id is None:
+            return None
+        return self._asset_docs_by_id.get(str(asset_id))
+
+    def get_asset_by_name(self, asset_name):
+        """Asset document by name identifier.
+
+        Name identifier is asset name, or full path in AYON mode.
+
+        Args:
+            asset_name (str): Asset name identifier.
+
+        Returns:
+            Union[dict[str, Any], None]: Asset document.
+        """
+
+        return self._asset_docs_by_name.get(asset_name)
+
+    def get_assets_by_short_name(self, name):
+        """Asset documents with passed name.
+
+        Names are not unique in AYON mode.
+
+        Args:
+            name (str): Name of asset.
+
+        Returns:
+            list[dict[str, Any]]: Asset documents.
+        """
+
+        return list(self._asset_docs_by_short_name.get(name) or [])
+
+    def get_children(self, parent_id):
+        """Direct children of asset.
+
+        Args:
+            parent_id (Union[str, ObjectId, None]): Asset id or 'None' for
+                top level assets.
+
+        Returns:
+            list[dict[str, Any]]: Asset documents.
+        """
+
+        if parent_id is not None:
+            parent_id = str(parent_id)
+        return list(self._children_by_parent_id.get(parent_id) or [])
+
+    def get_hierarchy(self):
+        """Asset documents by parent id.
+
+        Documents in hierarchy are shallow copies with ids (and parent ids)
+        converted to string.
+
+        Returns:
+            dict[Union[str, None], list[dict[str, Any]]]: Mapping of parent
+                id to it's children. Top level assets have parent id 'None'.
+        """
+
+        if self._hierarchy is None:
+            hierarchy = collections.defaultdict(list)
+            for parent_id, asset_docs in self._children_by_parent_id.items():
+                children = hierarchy[parent_id]
+                for asset_doc in asset_docs:
+                    data = dict(asset_doc["data"])
+                    data["visualParent"] = parent_id
+                    child = dict(asset_doc)
+                    child["_id"] = str(asset_doc["_id"])
+                    child["data"] = data
+                    children.append(child)
+            self._hierarchy = hierarchy
+        return self._hierarchy
+
+    def get_task_names_by_asset_name(self):
+        """Task names by asset name identifier.
+
+        Returns:
+            dict[str, list[str]]: Task names by asset name.
+        """
+
+        if self._task_names_by_asset_name is None:
+            self._task_names_by_asset_name = {
+                asset_name: list(asset_doc["data"]["tasks"].keys())
+                for asset_name, asset_doc in self._asset_docs_by_name.items()
+            }
+        return self._task_names_by_asset_name
+
+    def get_task_type(self, asset_name, task_name):
+        """Type of task on asset.
+
+        Args:
+            asset_name (str): Asset name identifier.
+            task_name (str): Name of task.
+
+        Returns:
+            Union[str, None]: Task type or 'None' if task was not found.
+        """
+
+        asset_doc = self._asset_docs_by_name.get(asset_name)
+        if asset_doc is None or not task_name:
+            return None
+        task_info = asset_doc["data"]["tasks"].get(task_name) or {}
+        return task_info.get("type")
+
+    def updated(self, asset_docs, asset_ids, refreshed_at):
+        """Create new index with changed documents.
+
+        Args:
+            asset_docs (Iterable[dict[str, Any]]): Created or changed asset
+                documents.
+            asset_ids (Iterable[Union[str, ObjectId]]): Ids of all existing
+                assets. Assets which are not there were removed.
+            refreshed_at (datetime.datetime): UTC time when documents were
+                queried.
+
+        Returns:
+            AssetHierarchyIndex: New index.
+        """
+
+        asset_ids = {str(asset_id) for asset_id in asset_ids}
+        asset_docs_by_id = {
+            asset_id: asset_doc
+            for asset_id, asset_doc in self._asset_docs_by_id.items()
+            if asset_id in asset_ids
+        }
+        for asset_doc in asset_docs:
+            asset_id = str(asset_doc["_id"])
+            if asset_id in asset_ids:
+                asset_docs_by_id[asset_id] = _prepare_asset_doc(asset_doc)
+
+        return self.__class__(
+            self._project_name, asset_docs_by_id, refreshed_at
+        )
+
+    def with_assets(self, asset_names, asset_docs):
+        """Create new index with replaced documents of passed assets.
+
+        Used to refresh only assets of interest without querying whole
+        project. Assets matching passed names which are not in
+        'asset_docs' were removed.
+
+        Args:
+            asset_names (Iterable[str]): Name identifiers or short names of
+                refreshed assets.
+            asset_docs (Iterable[dict[str, Any]]): Current documents of
+                the assets.
+
+        Returns:
+            AssetHierarchyIndex: New index.
+        """
+
+        asset_names = set(asset_names)
+        asset_docs_by_id = {
+            asset_id: asset_doc
+            for asset_id, asset_doc in self._asset_docs_by_id.items()
+            if (
+                asset_doc["name"] not in asset_names
+                and get_asset_name_identifier(asset_doc) not in asset_names
+            )
+        }
+        for asset_doc in asset_docs:
+            asset_docs_by_id[str(asset_doc["_id"])] = (
+                _prepare_asset_doc(asset_doc)
+            )
+
+        return self.__class__(
+            self._project_name, asset_docs_by_id, self._refreshed_at
+        )
+
+    @classmethod
+    def from_asset_docs(cls, project_name, asset_docs, refreshed_at):
+        return cls(
+            project_name,
+            {
+                str(asset_doc["_id"]): _prepare_asset_doc(asset_doc)
+                for asset_doc in asset_docs
+            },
+            refreshed_at
+        )
+
+
+def _prepare_asset_doc(asset_doc):
+    data = asset_doc.get("data")
+    if data is None:
+        data = asset_doc["data"] = {}
+    data.setdefault("visualParent", None)
+    data.setdefault("parents", [])
+    if data.get("tasks") is None:
+        data["tasks"] = {}
+    return asset_doc
+
+
+class _AssetHierarchyIndexCache(object):
+    """Shared indexes of projects with incremental refresh.
+
+    Refresh queries only assets which were created or changed since last
+    refresh, and ids of all assets to find removed assets. Whole index is
+    queried again when full refresh is older than 'full_refresh_interval'
+    because assets changed without operations session can't be found by
+    incremental refresh. AYON server does not support query of changed
+    folders so each refresh is full. Refresh of only passed assets can be
+    used to avoid query of whole project.
+    """
+
+    # Seconds between full refreshes
+    full_refresh_interval = 600
+    # Seconds subtracted from last refresh time to cover time differences
+    #   between workstations and database
+    refresh_overlap = 60
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes = {}
+        self._full_refresh_times = {}
+
+    def get(self, project_name, refresh=False, asset_names=None):
+        with self._lock:
+            index = self._indexes.get(project_name)
+            if index is None:
+                index = self._refresh(project_name, index)
+            elif refresh and asset_names is not None:
+                index = self._refresh_assets(project_name, index, asset_names)
+            elif refresh:
+                index = self._refresh(project_name, index)
+            self._indexes[project_name] = index
+            return index
+
+    def clear(self, project_name=None):
+        with self._lock:
+            if project_name is None:
+                self._indexes.clear()
+                self._full_refresh_times.clear()
+            else:
+                self._indexes.pop(project_name, None)
+                self._full_refresh_times.pop(project_name, None)
+
+    def _refresh(self, project_name, index):
+        refreshed_at = datetime.datetime.utcnow()
+        full_refresh_time = self._full_refresh_times.get(project_name)
+        if (
+            index is None
+            or AYON_SERVER_ENABLED
+            or full_refresh_time is None
+            or (time.time() - full_refresh_time) > self.full_refresh_interval
+        ):
+            self._full_refresh_times[project_name] = time.time()
+            return AssetHierarchyIndex.from_asset_docs(
+                project_name,
+                get_assets(
+                    project_name, fields=AssetHierarchyIndex.fields
+                ),
+                refreshed_at
+            )
+
+        since = index.refreshed_at - datetime.timedelta(
+            seconds=self.refresh_overlap
+        )
+        asset_docs = list(get_assets_changed_since(
+            project_name, since, fields=AssetHierarchyIndex.fields
+        ))
+        asset_ids = [
+            asset_doc["_id"]
+            for asset_doc in get_assets(project_name, fields=["_id"])
+        ]
+        return index.updated(asset_docs, asset_ids, refreshed_at)
+
+    def _refresh_assets(self, project_name, index, asset_names):
+        asset_names = set(asset_names)
+        if not asset_names:
+            return index
+        asset_docs = get_assets(
+            project_name,
+            asset_names=asset_names,
+            fields=AssetHierarchyIndex.fields
+        )
+        return index.with_assets(asset_names, asset_docs)
+
+
+_CACHE = _AssetHierarchyIndexCache()
+
+
+def get_asset_hierarchy_index(project_name, refresh=False, asset_names=None):
+    """Shared index of asset hierarchy of a project.
+
+    Index is created on first call for a project and is shared by all
+    callers in the process.
+
+    Args:
+        project_name (str): Name of project.
+        refresh (bool): Refresh index with changes since last refresh.
+        asset_names (Optional[Iterable[str]]): Refresh only assets with
+            passed name identifiers or names instead of whole index. Used
+            only with 'refresh'.
+
+    Returns:
+        AssetHierarchyIndex: Index of project assets.
+    """
+
+    return _CACHE.get(project_name, refresh, asset_names)
+
+
+def clear_asset_hierarchy_index(project_name=None):
+    """Remove shared index of a project or of all projects.
+
+    Args:
+        project_name (Optional[str]): Name of project. Indexes of all
+            projects are removed if not passed.
+    """
+
+    _CACHE.clear(project_name)
@@ -13,7 +13,6 @@ import pyblish.api
 
 from openpype import AYON_SERVER_ENABLED
 from openpype.client import (
-    get_assets,
     get_asset_by_name,
     get_asset_name_identifier,
 )
@@ -31,6 +30,7 @@ from openpype.host import IPublishHost, IWorkfileHost
 from openpype.pipeline import legacy_io, Anatomy
 from openpype.pipeline.plugin_discover import DiscoverResult
 
+from .asset_hierarchy import get_asset_hierarchy_index
 from .creator_plugins import (
     Creator,
     AutoCreator,
@@ -1595,6 +1595,22 @@ class CreateContext:
                 self._current_project_name)
         return self._current_project_anatomy
 
+    def get_asset_hierarchy_index(self, refresh=False, asset_names=None):
+        """Shared index of asset hierarchy of current project.
+
+        Args:
+            refresh (bool): Refresh index with changes since last refresh.
+            asset_names (Optional[Iterable[str]]): Refresh only assets with
+                passed names instead of whole index.
+
+        Returns:
+            AssetHierarchyIndex: Index of project assets.
+        """
+
+        return get_asset_hierarchy_index(
+            self.project_name, refresh, asset_names
+        )
+
     @property
     def context_has_changed(self):
         """Host context has changed.
@@ -2266,22 +2282,10 @@ class CreateContext:
             for asset_name in task_names_by_asset_name.keys()
             if asset_name is not None
         }
-        fields = {"name", "data.tasks"}
-        if AYON_SERVER_ENABLED:
-            fields |= {"data.parents"}
-        asset_docs = list(get_assets(
-            self.project_name,
-            asset_names=asset_names,
-            fields=fields
-        ))
-
-        task_names_by_asset_name = {}
-        asset_docs_by_name = collections.defaultdict(list)
-        for asset_doc in asset_docs:
-            asset_name = get_asset_name_identifier(asset_doc)
-            tasks = asset_doc.get("data", {}).get("tasks") or {}
-            task_names_by_asset_name[asset_name] = set(tasks.keys())
-            asset_docs_by_name[asset_doc["name"]].append(asset_doc)
+        # Refresh only assets of instances, shared index may be stale
+        asset_index = self.get_asset_hierarchy_index(
+            refresh=True, asset_names=asset_names
+        )
 
         for instance in instances:
             if not instance.has_valid_asset or not instance.has_valid_task:
@@ -2290,14 +2294,16 @@ class CreateContext:
             if AYON_SERVER_ENABLED:
                 asset_name = instance["folderPath"]
                 if asset_name and "/" not in asset_name:
-                    asset_docs = asset_docs_by_name.get(asset_name)
+                    asset_docs = asset_index.get_assets_by_short_name(
+                        asset_name)
                     if len(asset_docs) == 1:
                         asset_name = get_asset_name_identifier(asset_docs[0])
                         instance["folderPath"] = asset_name
             else:
                 asset_name = instance["asset"]
 
-            if asset_name not in task_names_by_asset_name:
+            asset_doc = asset_index.get_asset_by_name(asset_name)
+            if asset_doc is None:
                 instance.set_asset_invalid(True)
                 continue
 
@@ -2305,7 +2311,7 @@ class CreateContext:
             if not task_name:
                 continue
 
-            if task_name not in task_names_by_asset_name[asset_name]:
+            if task_name not in asset_doc["data"]["tasks"]:
                 instance.set_task_invalid(True)
 
     def save_changes(self):
@@ -1,5 +1,144 @@
 # -*- coding: utf-8 -*-
 import re
+import threading
+
+# Patterns with backreferences can't be combined as group numbers change
+_BACKREFERENCE_REGEX = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class AOVPatternMatcher(object):
+    """Compiled AOV patterns of a host.
+
+    Patterns are combined into one regex alternation where each pattern is
+    wrapped in a named group, so a file name is matched in one pass and
+    the matched pattern can be found by the group. Patterns which can't be
+    combined (e.g. with backreferences or inline flags) are matched one by
+    one.
+
+    Results are cached by file name. Pattern is matched against start of
+    file name same way as 're.match'.
+
+    Args:
+        patterns (Iterable[str]): AOV patterns.
+    """
+
+    # Max count of cached results
+    cache_size = 10000
+
+    def __init__(self, patterns):
+        patterns = tuple(patterns or [])
+        self._patterns = patterns
+        self._group_names = []
+        self._combined_regex = None
+        self._regexes = None
+        self._cache = {}
+        self._lock = threading.Lock()
+
+        if not patterns:
+            return
+
+        if not any(
+            _BACKREFERENCE_REGEX.search(pattern)
+            for pattern in patterns
+        ):
+            group_names = [
+                "_aov_pattern_{}".format(idx)
+                for idx in range(len(patterns))
+            ]
+            try:
+                self._combined_regex = re.compile("|".join(
+                    "(?P<{}>{})".format(group_name, pattern)
+                    for group_name, pattern in zip(group_names, patterns)
+                ))
+                self._group_names = group_names
+            except re.error:
+                pass
+
+        if self._combined_regex is None:
+            self._regexes = [re.compile(pattern) for pattern in patterns]
+
+    @property
+    def patterns(self):
+        return list(self._patterns)
+
+    def get_matched_pattern(self, file_name):
+        """First pattern which matches file name.
+
+        Args:
+            file_name (str): Render file name or path.
+
+        Returns:
+            Union[str, None]: Matched pattern or 'None'.
+        """
+
+        if not self._patterns:
+            return None
+
+        with self._lock:
+            if file_name in self._cache:
+                return self._cache[file_name]
+
+        matched = self._get_matched_pattern(file_name)
+        with self._lock:
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[file_name] = matched
+        return matched
+
+    def _get_matched_pattern(self, file_name):
+        if self._combined_regex is None:
+            for pattern, regex in zip(self._patterns, self._regexes):
+                if regex.match(file_name):
+                    return pattern
+            return None
+
+        match = self._combined_regex.match(file_name)
+        if not match:
+            return None
+        for pattern, group_name in zip(self._patterns, self._group_names):
+            if match.group(group_name) is not None:
+                return pattern
+        return None
+
+    def match(self, file_name):
+        """File name matches any of patterns.
+
+        Args:
+            file_name (str): Render file name or path.
+
+        Returns:
+            bool: File name matches a pattern.
+        """
+
+        return self.get_matched_pattern(file_name) is not None
+
+
+_matchers = {}
+_matchers_lock = threading.Lock()
+
+
+def get_aov_pattern_matcher(host_name, aov_patterns):
+    """Compiled matcher of AOV patterns for a host.
+
+    Matchers are shared for same host name and patterns.
+
+    Args:
+        host_name (str): Host name.
+        aov_patterns (dict[str, list[str]]): AOV patterns by host name from
+            AOV filters.
+
+    Returns:
+        AOVPatternMatcher: Matcher of host patterns.
+    """
+
+    patterns = tuple((aov_patterns or {}).get(host_name) or [])
+    key = (host_name, patterns)
+    with _matchers_lock:
+        matcher = _matchers.get(key)
+        if matcher is None:
+            matcher = AOVPatternMatcher(patterns)
+            _matchers[key] = matcher
+    return matcher
 
 
 def match_aov_pattern(host_name, aov_patterns, render_file_name):
@@ -18,7 +157,6 @@ def match_aov_pattern(host_name, aov_patterns, render_file_name):
     Returns:
         bool: Review state for rendered file (render_file_name).
     """
-    aov_pattern = aov_patterns.get(host_name, [])
-    if not aov_pattern:
-        return False
-    return any(re.match(p, render_file_name) for p in aov_pattern)
+    return get_aov_pattern_matcher(host_name, aov_patterns).match(
+        render_file_name
+    )
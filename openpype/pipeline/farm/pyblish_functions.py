@@ -5,6 +5,7 @@ import os
 import clique
 from copy import deepcopy
 import re
+import threading
 import warnings
 
 from openpype.pipeline import (
@@ -16,9 +17,14 @@ from openpype.client import (
     get_last_version_by_subset_name,
     get_representations
 )
-from openpype.lib import Logger
+from openpype.lib import Logger, format_file_size
+from openpype.settings import save_settings_snapshot
+from openpype.lib.file_transaction import FileTransaction
 from openpype.pipeline.publish import KnownPublishError
-from openpype.pipeline.farm.patterning import match_aov_pattern
+from openpype.pipeline.farm.patterning import get_aov_pattern_matcher
+
+# Number of concurrent transfers used by 'copy_extend_frames'
+EXTEND_FRAMES_MAX_WORKERS = 8
 
 
 @attr.s
@@ -322,6 +328,7 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
     """
     representations = []
     host_name = os.environ.get("AVALON_APP", "")
+    aov_matcher = get_aov_pattern_matcher(host_name, aov_filter)
     collections, remainders = clique.assemble(exp_files)
 
     log = Logger.get_logger("farm_publishing")
@@ -346,9 +353,7 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
                 render_file_name = list(collection)[0]
                 # if filtered aov name is found in filename, toggle it for
                 # preview video rendering
-                preview = match_aov_pattern(
-                    host_name, aov_filter, render_file_name
-                )
+                preview = aov_matcher.match(render_file_name)
 
         staging = os.path.dirname(list(collection)[0])
         success, rootless_staging_dir = (
@@ -421,9 +426,7 @@ def prepare_representations(skeleton_data, exp_files, anatomy, aov_filter,
             "stagingDir": staging,
         }
 
-        preview = match_aov_pattern(
-            host_name, aov_filter, remainder
-        )
+        preview = aov_matcher.match(remainder)
         preview = preview and not do_not_add_review
         if preview:
             rep.update({
@@ -548,6 +551,9 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
     cameras = instance.data.get("cameras", [])
     exp_files = instance.data["expectedFiles"]
     log = Logger.get_logger("farm_publishing")
+    aov_matcher = get_aov_pattern_matcher(
+        os.environ.get("AVALON_APP", ""), aov_filter
+    )
 
     instances = []
     # go through AOVs in expected files
@@ -611,15 +617,12 @@ def _create_instances_for_aov(instance, skeleton, aov_filter, additional_data,
 
         log.info("Creating data for: {}".format(subset_name))
 
-        app = os.environ.get("AVALON_APP", "")
-
         if isinstance(col, list):
             render_file_name = os.path.basename(col[0])
         else:
             render_file_name = os.path.basename(col)
-        aov_patterns = aov_filter
 
-        preview = match_aov_pattern(app, aov_patterns, render_file_name)
+        preview = aov_matcher.match(render_file_name)
         # toggle preview on if multipart is on
         if instance.data.get("multipartExr"):
             log.debug("Adding preview tag because its multipartExr")
@@ -981,20 +984,56 @@ def create_instances_for_cache(instance, skeleton):
     return instances
 
 
-def copy_extend_frames(instance, representation):
+class _ExtendFramesProgress(object):
+    """Log progress of frames back-fill.
+
+    Back-fill runs in submitting process, so progress is logged only as
+    debug message in coarse steps to not flood publish report.
+
+    Args:
+        log (logging.Logger): Logger used to log progress.
+        step (Optional[int]): Percentage step between logged messages.
+    """
+
+    def __init__(self, log, step=25):
+        self._log = log
+        self._step = step
+        self._lock = threading.Lock()
+        self._last_progress = 0
+
+    def __call__(self, files_done, files_total, bytes_done, bytes_total):
+        if bytes_total:
+            progress = int(100 * bytes_done / bytes_total)
+        else:
+            progress = int(100 * files_done / files_total)
+
+        # Round down to step
+        progress -= progress % self._step
+        with self._lock:
+            if progress <= self._last_progress:
+                return
+            self._last_progress = progress
+        self._log.debug("Copied {}% of existing frames".format(progress))
+
+
+def copy_extend_frames(instance, representation, max_workers=None):
     """Copy existing frames from latest version.
 
     This will copy all existing frames from subset's latest version back
     to render directory and rename them to what renderer is expecting.
 
+    Frames are transferred in parallel. Frames outside of rendered frame
+    range are hardlinked when published files are on the same volume as
+    render directory. Frames inside of the range are copied, because
+    renderer may overwrite them.
+
     Arguments:
         instance (pyblish.plugin.Instance): instance to get required
             data from
         representation (dict): presentation to operate on
+        max_workers (Optional[int]): Number of concurrent transfers.
 
     """
-    import speedcopy
-
     R_FRAME_NUMBER = re.compile(
         r".+\.(?P<frame>[0-9]+)\..+")
 
@@ -1018,7 +1057,9 @@ def copy_extend_frames(instance, representation):
     subset_resources = get_resources(
         project_name, version, representation.get("ext")
     )
-    r_col, _ = clique.assemble(subset_resources)
+    r_cols, _ = clique.assemble(subset_resources)
+    assert len(r_cols) == 1, "Multiple collections found"
+    r_col = r_cols[0]
 
     # if override remove all frames we are expecting to be rendered,
     # so we'll copy only those missing from current render
@@ -1031,37 +1072,44 @@ def copy_extend_frames(instance, representation):
     # now we need to translate published names from representation
     # back. This is tricky, right now we'll just use same naming
     # and only switch frame numbers
-    resource_files = []
     r_filename = os.path.basename(
         representation.get("files")[0])  # first file
     op = re.search(R_FRAME_NUMBER, r_filename)
-    pre = r_filename[:op.start("frame")]
-    post = r_filename[op.end("frame"):]
     assert op is not None, "padding string wasn't found"
-    for frame in list(r_col):
-        fn = re.search(R_FRAME_NUMBER, frame)
-        # silencing linter as we need to compare to True, not to
-        # type
-        assert fn is not None, "padding string wasn't found"
-        # list of tuples (source, destination)
-        staging = representation.get("stagingDir")
-        staging = anatomy.fill_root(staging)
-        resource_files.append(
-            (frame, os.path.join(
-                staging, "{}{}{}".format(pre, fn["frame"], post)))
+    staging = anatomy.fill_root(representation.get("stagingDir"))
+    dst_template = os.path.join(
+        staging,
+        "{}{{}}{}".format(
+            r_filename[:op.start("frame")], r_filename[op.end("frame"):]
         )
+    )
+    frame_template = "{{:0{}d}}".format(r_col.padding)
 
-    # test if destination dir exists and create it if not
-    output_dir = os.path.dirname(representation.get("files")[0])
-    if not os.path.isdir(output_dir):
-        os.makedirs(output_dir)
+    file_transaction = FileTransaction(
+        log=log,
+        max_workers=max_workers or EXTEND_FRAMES_MAX_WORKERS,
+        progress_callback=_ExtendFramesProgress(log)
+    )
+    # collection iterates over paths in order of frames
+    for frame, src in zip(r_col.indexes, r_col):
+        dst = dst_template.format(frame_template.format(frame))
+        if start is not None and start <= frame <= end:
+            mode = FileTransaction.MODE_COPY
+        else:
+            mode = FileTransaction.MODE_HARDLINK_OR_COPY
+        file_transaction.add(src, dst, mode)
 
-    # copy files
-    for source in resource_files:
-        speedcopy.copy(source[0], source[1])
-        log.info("  > {}".format(source[1]))
+    try:
+        file_transaction.process()
+    except Exception:
+        file_transaction.rollback()
+        raise
+    file_transaction.finalize()
 
-    log.info("Finished copying %i files" % len(resource_files))
+    for strategy, stats in file_transaction.get_transfer_stats().items():
+        log.debug("  > {}: {} files ({})".format(
+            strategy, stats["files"], format_file_size(stats["bytes"])))
+    log.info("Finished copying %i files" % len(r_col.indexes))
 
 
 def attach_instances_to_subset(attach_to, instances):
@@ -1124,3 +1172,41 @@ def create_metadata_path(instance, anatomy):
         rootless_mtdt_p = metadata_path
 
     return metadata_path, rootless_mtdt_p
+
+
+def save_farm_settings_snapshot(instance, metadata_path):
+    """Store settings snapshot for farm publish job.
+
+    Snapshot is stored next to metadata file without local settings of this
+    machine, farm job applies local settings of farm machine on top of it.
+    Farm job resolves settings as usual if the snapshot is not available on
+    farm machine or if any settings overrides changed.
+
+    Args:
+        instance (pyblish.api.Instance): Instance submitted to farm.
+        metadata_path (str): Path to metadata file of the instance.
+
+    Returns:
+        dict[str, str]: Environment variables which should be set for the
+            farm job.
+    """
+
+    log = Logger.get_logger("farm_publishing")
+    snapshot_path = os.path.join(
+        os.path.dirname(metadata_path),
+        "{}_settings.json".format(instance.data["subset"])
+    )
+    try:
+        return save_settings_snapshot(
+            snapshot_path,
+            [instance.context.data["projectName"]],
+            exclude_locals=True
+        )
+    except Exception:
+        log.warning(
+            "Failed to store settings snapshot \"{}\".".format(
+                snapshot_path
+            ),
+            exc_info=True
+        )
+    return {}
@@ -21,7 +21,8 @@ from openpype.client import (
     get_representations,
     get_representation_by_id,
     get_representation_by_name,
-    get_representation_parents
+    get_representation_parents,
+    get_representations_parents,
 )
 from openpype.lib import (
     StringTemplate,
@@ -120,59 +121,42 @@ def get_contexts_for_repre_docs(project_name, repre_docs):
     if not repre_docs:
         return contexts
 
-    repre_docs_by_id = {}
-    version_ids = set()
-    for repre_doc in repre_docs:
-        version_ids.add(repre_doc["parent"])
-        repre_docs_by_id[repre_doc["_id"]] = repre_doc
-
-    version_docs = get_versions(
-        project_name, version_ids, hero=True
+    repre_docs_by_id = {
+        repre_doc["_id"]: repre_doc
+        for repre_doc in repre_docs
+    }
+    parents_by_repre_id = get_representations_parents(
+        project_name, repre_docs_by_id.values()
     )
 
-    version_docs_by_id = {}
-    hero_version_docs = []
-    versions_for_hero = set()
-    subset_ids = set()
-    for version_doc in version_docs:
-        if version_doc["type"] == "hero_version":
-            hero_version_docs.append(version_doc)
-            versions_for_hero.add(version_doc["version_id"])
-        version_docs_by_id[version_doc["_id"]] = version_doc
-        subset_ids.add(version_doc["parent"])
+    hero_version_docs = {}
+    for parents in parents_by_repre_id.values():
+        version_doc = parents[0]
+        if version_doc and version_doc["type"] == "hero_version":
+            hero_version_docs[version_doc["_id"]] = version_doc
 
-    if versions_for_hero:
-        _version_docs = get_versions(project_name, versions_for_hero)
+    if hero_version_docs:
+        versions_for_hero = {
+            version_doc["version_id"]
+            for version_doc in hero_version_docs.values()
+        }
+        _version_docs = get_versions(
+            project_name, versions_for_hero, fields=["_id", "data"]
+        )
         _version_data_by_id = {
             version_doc["_id"]: version_doc["data"]
             for version_doc in _version_docs
         }
 
-        for hero_version_doc in hero_version_docs:
-            hero_version_id = hero_version_doc["_id"]
+        for hero_version_doc in hero_version_docs.values():
             version_id = hero_version_doc["version_id"]
             version_data = copy.deepcopy(_version_data_by_id[version_id])
-            version_docs_by_id[hero_version_id]["data"] = version_data
-
-    subset_docs = get_subsets(project_name, subset_ids)
-    subset_docs_by_id = {}
-    asset_ids = set()
-    for subset_doc in subset_docs:
-        subset_docs_by_id[subset_doc["_id"]] = subset_doc
-        asset_ids.add(subset_doc["parent"])
-
-    asset_docs = get_assets(project_name, asset_ids)
-    asset_docs_by_id = {
-        asset_doc["_id"]: asset_doc
-        for asset_doc in asset_docs
-    }
-
-    project_doc = get_project(project_name)
+            hero_version_doc["data"] = version_data
 
     for repre_id, repre_doc in repre_docs_by_id.items():
-        version_doc = version_docs_by_id[repre_doc["parent"]]
-        subset_doc = subset_docs_by_id[version_doc["parent"]]
-        asset_doc = asset_docs_by_id[subset_doc["parent"]]
+        version_doc, subset_doc, asset_doc, project_doc = (
+            parents_by_repre_id[repre_id]
+        )
         context = {
             "project": {
                 "name": project_doc["name"],
@@ -3,10 +3,7 @@ import inspect
 import traceback
 
 from openpype.lib import Logger
-from openpype.lib.python_module_tools import (
-    modules_from_path,
-    classes_from_module,
-)
+from openpype.lib.python_module_tools import PathModulesCache
 
 log = Logger.get_logger(__name__)
 
@@ -99,9 +96,10 @@ class DiscoverResult:
 class PluginDiscoverContext(object):
     """Store and discover registered types nad registered paths to types.
 
-    Keeps in memory all registered types and their paths. Paths are dynamically
-    loaded on discover so different discover calls won't return the same
-    class objects even if were loaded from same file.
+    Keeps in memory all registered types and their paths. Python files in
+    paths are imported on first discover and kept in memory with their
+    modification time and size. Next discover calls re-import only files
+    that changed, unless reset is forced.
     """
 
     def __init__(self):
@@ -110,6 +108,16 @@ class PluginDiscoverContext(object):
         self._last_discovered_plugins = {}
         # Store the last result to memory
         self._last_discovered_results = {}
+        # Imported files of registered paths
+        self._modules_cache = PathModulesCache()
+
+    def clear_cache(self, path=None):
+        """Forget imported files so they're imported on next discover.
+
+        Args:
+            path (Optional[str]): Clear only files of the path.
+        """
+        self._modules_cache.clear(path)
 
     def get_last_discovered_plugins(self, superclass):
         """Access last discovered plugin by a subperclass.
@@ -126,16 +134,25 @@ class PluginDiscoverContext(object):
         superclass,
         allow_duplicates=True,
         ignore_classes=None,
-        return_report=False
+        return_report=False,
+        force_reset=False
     ):
         """Find and return subclasses of `superclass`
 
+        Plugins from registered paths are new subclasses of classes defined
+        in the files on each call, so they are not identical between calls.
+        Compare them by name, or with 'issubclass' against the class
+        defined in file. Classes in 'ignore_classes' are compared with
+        the classes defined in files.
+
         Args:
             superclass (type): Class which determines discovered subclasses.
             allow_duplicates (bool): Validate class name duplications.
             ignore_classes (list): List of classes that will be ignored
                 and not added to result.
             return_report (bool): Output will be full report if set to 'True'.
+            force_reset (bool): Import all files of registered paths again
+                even if they did not change.
 
         Returns:
             Union[DiscoverResult, list[Any]]: Object holding successfully
@@ -168,15 +185,16 @@ class PluginDiscoverContext(object):
 
         # Include plug-ins from registered paths
         for path in registered_paths:
-            modules, crashed = modules_from_path(path)
+            if force_reset:
+                self.clear_cache(path)
+            file_items, crashed = self._modules_cache.get_file_items(path)
             for item in crashed:
                 filepath, exc_info = item
                 result.crashed_file_paths[filepath] = exc_info
 
-            for item in modules:
-                filepath, module = item
-                result.add_module(module)
-                for cls in classes_from_module(superclass, module):
+            for file_item in file_items:
+                result.add_module(file_item.module)
+                for cls in file_item.get_classes(superclass):
                     if cls is superclass or cls in ignore_classes:
                         result.ignored_plugins.add(cls)
                         continue
@@ -192,7 +210,10 @@ class PluginDiscoverContext(object):
                             continue
                         plugin_names.add(class_name)
 
-                    result.plugins.append(cls)
+                    # New subclasses are returned on each discover so
+                    #   changes of class attributes (e.g. by applied
+                    #   settings) don't leak to next discover
+                    result.plugins.append(file_item.create_subclass(cls))
 
         # Store in memory last result to keep in memory loaded modules
         self._last_discovered_results[superclass] = result
@@ -273,7 +294,8 @@ def discover(
     superclass,
     allow_duplicates=True,
     ignore_classes=None,
-    return_report=False
+    return_report=False,
+    force_reset=False
 ):
     """Find and return subclasses of `superclass`
 
@@ -283,6 +305,8 @@ def discover(
         ignore_classes (list): List of classes that will be ignored
             and not added to result.
         return_report (bool): Output will be full report if set to 'True'.
+        force_reset (bool): Import all files of registered paths again
+            even if they did not change.
 
     Returns:
         Union[DiscoverResult, list[Any]]: Object holding successfully
@@ -295,10 +319,16 @@ def discover(
         superclass,
         allow_duplicates,
         ignore_classes,
-        return_report
+        return_report,
+        force_reset
     )
 
 
+def clear_discover_cache(path=None):
+    context = _GlobalDiscover.get_context()
+    context.clear_cache(path)
+
+
 def get_last_discovered_plugins(superclass):
     context = _GlobalDiscover.get_context()
     return context.get_last_discovered_plugins(superclass)
@@ -13,10 +13,12 @@ from openpype.lib import (
     Logger,
     import_filepath,
     filter_profiles,
+    get_compiled_profiles,
     is_func_signature_supported,
 )
 from openpype.settings import (
     get_project_settings,
+    get_frozen_project_settings,
     get_system_settings,
 )
 from openpype.pipeline import (
@@ -56,7 +58,7 @@ def get_template_name_profiles(
         ))
 
     if not project_settings:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_frozen_project_settings(project_name)
 
     return copy.deepcopy(
         project_settings
@@ -91,7 +93,7 @@ def get_hero_template_name_profiles(
         ))
 
     if not project_settings:
-        project_settings = get_project_settings(project_name)
+        project_settings = get_frozen_project_settings(project_name)
 
     return copy.deepcopy(
         project_settings
@@ -142,19 +144,28 @@ def get_publish_template_name(
         "task_names": task_name,
         "task_types": task_type,
     }
+    if not project_name and not project_settings:
+        raise ValueError((
+            "Both project name and project settings are missing."
+            " At least one must be entered."
+        ))
+
+    if not project_settings:
+        project_settings = get_frozen_project_settings(project_name)
+
+    # Profiles are only read so they don't have to be copied
+    publish_settings = project_settings["global"]["tools"]["publish"]
     if hero:
         default_template = DEFAULT_HERO_PUBLISH_TEMPLATE
-        profiles = get_hero_template_name_profiles(
-            project_name, project_settings, logger
-        )
+        profiles = publish_settings["hero_template_name_profiles"]
 
     else:
-        profiles = get_template_name_profiles(
-            project_name, project_settings, logger
-        )
+        profiles = publish_settings["template_name_profiles"]
         default_template = DEFAULT_PUBLISH_TEMPLATE
 
-    profile = filter_profiles(profiles, filter_criteria, logger=logger)
+    profile = get_compiled_profiles(profiles).filter_profiles(
+        filter_criteria, logger=logger
+    )
     if profile:
         template = profile["template_name"]
     return template or default_template
@@ -1,5 +1,8 @@
 import os
 import copy
+import math
+import concurrent.futures
+
 import clique
 import pyblish.api
 
@@ -12,6 +15,8 @@ from openpype.lib import (
 from openpype.lib.transcoding import (
     convert_colorspace,
     get_transcode_temp_directory,
+    get_convert_workers,
+    get_contiguous_frame_ranges,
 )
 
 from openpype.lib.profiles_filtering import filter_profiles
@@ -63,6 +68,8 @@ class ExtractOIIOTranscode(publish.Extractor):
     # Configurable by Settings
     profiles = None
     options = None
+    # Max number of concurrent oiiotool processes, '0' means automatic
+    max_workers = 0
 
     def process(self, instance):
         if not self.profiles:
@@ -141,15 +148,17 @@ class ExtractOIIOTranscode(publish.Extractor):
                 additional_command_args = (output_def["oiiotool_args"]
                                            ["additional_command_args"])
 
+                max_workers = get_convert_workers(self.max_workers)
                 files_to_convert = self._translate_to_sequence(
-                    files_to_convert)
+                    files_to_convert, max_workers)
+                convert_args = []
                 for file_name in files_to_convert:
                     input_path = os.path.join(original_staging_dir,
                                               file_name)
                     output_path = self._get_output_file_path(input_path,
                                                              new_staging_dir,
                                                              output_extension)
-                    convert_colorspace(
+                    convert_args.append((
                         input_path,
                         output_path,
                         config_path,
@@ -159,7 +168,8 @@ class ExtractOIIOTranscode(publish.Extractor):
                         display,
                         additional_command_args,
                         self.log
-                    )
+                    ))
+                self._convert_files(convert_args, max_workers)
 
                 # cleanup temporary transcoded files
                 for file_name in new_repre["files"]:
@@ -264,16 +274,20 @@ class ExtractOIIOTranscode(publish.Extractor):
             renamed_files.append(file_name)
         new_repre["files"] = renamed_files
 
-    def _translate_to_sequence(self, files_to_convert):
+    def _translate_to_sequence(self, files_to_convert, chunks_count=1):
         """Returns original list or list with filename formatted in single
         sequence format.
 
-        Uses clique to find frame sequence, in this case it merges all frames
-        into sequence format (FRAMESTART-FRAMEEND#) and returns it.
+        Uses clique to find frame sequence, in this case it merges contiguous
+        frames into sequence format (FRAMESTART-FRAMEEND#). Gaps in sequence
+        split the sequence into multiple items, and each contiguous range may
+        be split further so there are at least 'chunks_count' items to be
+        converted in parallel.
         If sequence not found, it returns original list
 
         Args:
             files_to_convert (list): list of file names
+            chunks_count (int): Preferred minimum number of sequence items.
         Returns:
             (list) of [file.1001-1010#.exr] or [fileA.exr, fileB.exr]
         """
@@ -288,15 +302,49 @@ class ExtractOIIOTranscode(publish.Extractor):
                     "Too many collections {}".format(collections))
 
             collection = collections[0]
-            frames = list(collection.indexes)
-            frame_str = "{}-{}#".format(frames[0], frames[-1])
-            file_name = "{}{}{}".format(collection.head, frame_str,
-                                        collection.tail)
-
-            files_to_convert = [file_name]
+            max_frames = int(
+                math.ceil(len(collection.indexes) / float(chunks_count))
+            )
+            files_to_convert = []
+            for start, end in get_contiguous_frame_ranges(
+                collection.indexes, max_frames
+            ):
+                frame_str = "{}-{}#".format(start, end)
+                file_name = "{}{}{}".format(collection.head, frame_str,
+                                            collection.tail)
+                files_to_convert.append(file_name)
 
         return files_to_convert
 
+    def _convert_files(self, convert_args, max_workers):
+        """Convert files with 'convert_colorspace' in pool of workers.
+
+        Args:
+            convert_args (list[tuple]): Arguments for 'convert_colorspace'
+                call per file or sequence chunk.
+            max_workers (int): Max number of concurrent conversions.
+        """
+        max_workers = min(max_workers, len(convert_args))
+        if max_workers <= 1:
+            for args in convert_args:
+                convert_colorspace(*args)
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            futures = [
+                executor.submit(convert_colorspace, *args)
+                for args in convert_args
+            ]
+            done, not_done = concurrent.futures.wait(
+                futures, return_when=concurrent.futures.FIRST_EXCEPTION
+            )
+            for future in not_done:
+                future.cancel()
+
+            for future in futures:
+                if future in done:
+                    future.result()
+
     def _get_output_file_path(self, input_path, output_dir,
                               output_extension):
         """Create output file name path."""
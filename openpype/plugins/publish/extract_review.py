@@ -13,7 +13,7 @@ import pyblish.api
 
 from openpype.lib import (
     get_ffmpeg_tool_args,
-    filter_profiles,
+    get_compiled_profiles,
     path_to_subprocess_arg,
     run_subprocess,
 )
@@ -76,6 +76,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # Max number of concurrent oiiotool processes used for conversion
+    #   of input files for ffmpeg, '0' means automatic
+    max_workers = 0
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -109,8 +112,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
         self.log.debug("Host: \"{}\"".format(host_name))
         self.log.debug("Family: \"{}\"".format(family))
 
-        profile = filter_profiles(
-            self.profiles,
+        profile = get_compiled_profiles(self.profiles).filter_profiles(
             {
                 "hosts": host_name,
                 "families": family,
@@ -289,7 +291,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 convert_input_paths_for_ffmpeg(
                     input_filepaths,
                     new_staging_dir,
-                    self.log
+                    self.log,
+                    max_workers=self.max_workers
                 )
 
             try:
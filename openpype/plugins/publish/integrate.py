@@ -2,6 +2,7 @@ import os
 import logging
 import sys
 import copy
+import threading
 import datetime
 
 import clique
@@ -24,7 +25,11 @@ from openpype.client import (
     get_subset_by_name,
     get_version_by_name,
 )
-from openpype.lib import source_hash
+from openpype.lib import source_hash, format_file_size
+from openpype.lib.path_tools import (
+    COPY_STRATEGY_HARDLINK,
+    COPY_STRATEGY_REFLINK,
+)
 from openpype.lib.file_transaction import (
     FileTransaction,
     DuplicateDestinationError
@@ -57,6 +62,37 @@ def get_frame_padded(frame, padding):
     return "{frame:0{padding}d}".format(padding=padding, frame=frame)
 
 
+class _TransferProgressLogger(object):
+    """Log progress of file transfers in percentage steps.
+
+    Args:
+        log (logging.Logger): Logger used to log progress.
+        step (Optional[int]): Percentage step between logged messages.
+    """
+
+    def __init__(self, log, step=10):
+        self._log = log
+        self._step = step
+        self._lock = threading.Lock()
+        self._last_progress = 0
+
+    def __call__(self, files_done, files_total, bytes_done, bytes_total):
+        if bytes_total:
+            progress = int(100 * bytes_done / bytes_total)
+        else:
+            progress = int(100 * files_done / files_total)
+
+        # Round down to step
+        progress -= progress % self._step
+        with self._lock:
+            if progress <= self._last_progress:
+                return
+            self._last_progress = progress
+        self._log.debug("Transferred {}% ({}/{} files, {})".format(
+            progress, files_done, files_total, format_file_size(bytes_done)
+        ))
+
+
 class IntegrateAsset(pyblish.api.InstancePlugin):
     """Register publish in the database and transfer files to destinations.
 
@@ -146,6 +182,11 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
     default_template_name = "publish"
 
+    # Attributes set by settings
+    transfer_max_workers = 1
+    transfer_max_workers_per_volume = 0
+    transfer_checksum = ""
+
     # Representation context keys that should always be written to
     # the database even if not used by the destination template
     db_representation_context_keys = [
@@ -176,9 +217,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(instance.data["family"]))
             return
 
-        file_transactions = FileTransaction(log=self.log,
-                                            # Enforce unique transfers
-                                            allow_queue_replacements=False)
+        file_transactions = FileTransaction(
+            log=self.log,
+            # Enforce unique transfers
+            allow_queue_replacements=False,
+            max_workers=self.transfer_max_workers,
+            max_workers_per_volume=self.transfer_max_workers_per_volume,
+            progress_callback=_TransferProgressLogger(self.log),
+            checksum_algorithm=self.transfer_checksum or None
+        )
         try:
             self.register(instance, file_transactions, filtered_repres)
         except DuplicateDestinationError as exc:
@@ -319,6 +366,7 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             "Backed up existing files: {}".format(file_transactions.backups))
         self.log.debug(
             "Transferred files: {}".format(file_transactions.transferred))
+        self._log_transfer_stats(file_transactions.get_transfer_stats())
         self.log.debug("Retrieving Representation Site Sync information ...")
 
         # Get the accessible sites for Site Sync
@@ -338,9 +386,11 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # Compute the resource file infos once (files belonging to the
         # version instance instead of an individual representation) so
         # we can re-use those file infos per representation
+        checksums = file_transactions.checksums
         resource_file_infos = self.get_files_info(resource_destinations,
                                                   sites=sites,
-                                                  anatomy=anatomy)
+                                                  anatomy=anatomy,
+                                                  checksums=checksums)
 
         # Finalize the representations now the published files are integrated
         # Get 'files' info for representations and its attached resources
@@ -351,7 +401,8 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             transfers = prepared["transfers"]
             destinations = [dst for src, dst in transfers]
             repre_doc["files"] = self.get_files_info(
-                destinations, sites=sites, anatomy=anatomy
+                destinations, sites=sites, anatomy=anatomy,
+                checksums=checksums
             )
 
             # Add the version resource file infos to each representation
@@ -735,22 +786,18 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             )
 
             # Construct destination collection from template
-            repre_context = None
-            dst_filepaths = []
-            for index in destination_indexes:
-                if is_udim:
-                    template_data["udim"] = index
-                else:
-                    template_data["frame"] = index
-                template_filled = path_template_obj.format_strict(
-                    template_data
-                )
-                dst_filepaths.append(template_filled)
-                if repre_context is None:
-                    self.log.debug(
-                        "Template filled: {}".format(str(template_filled))
-                    )
-                    repre_context = template_filled.used_values
+            # - invariant parts of template are solved only once
+            index_key = "udim" if is_udim else "frame"
+            dst_filepaths = path_template_obj.format_strict_many(
+                template_data, index_key, destination_indexes
+            )
+            # Keep last index in template data as it was when frames were
+            #   filled one by one
+            template_data[index_key] = destination_indexes[-1]
+            self.log.debug(
+                "Template filled: {}".format(str(dst_filepaths[0]))
+            )
+            repre_context = dst_filepaths[0].used_values
 
             # Make sure context contains frame
             # NOTE: Frame would not be available only if template does not
@@ -955,25 +1002,34 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             ).format(path))
         return path
 
-    def get_files_info(self, destinations, sites, anatomy):
+    def get_files_info(self, destinations, sites, anatomy, checksums=None):
         """Prepare 'files' info portion for representations.
 
         Arguments:
             destinations (list): List of transferred file destinations
             sites (list): array of published locations
             anatomy: anatomy part from instance
+            checksums (dict): Checksums of transferred files by destination
         Returns:
             output_resources: array of dictionaries to be added to 'files' key
             in representation
         """
 
+        if checksums is None:
+            checksums = {}
         file_infos = []
         for file_path in destinations:
-            file_info = self.prepare_file_info(file_path, anatomy, sites=sites)
+            file_info = self.prepare_file_info(
+                file_path,
+                anatomy,
+                sites=sites,
+                checksum=checksums.get(os.path.normpath(
+                    os.path.abspath(file_path)))
+            )
             file_infos.append(file_info)
         return file_infos
 
-    def prepare_file_info(self, path, anatomy, sites):
+    def prepare_file_info(self, path, anatomy, sites, checksum=None):
         """ Prepare information for one file (asset or resource)
 
         Arguments:
@@ -982,18 +1038,46 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             sites: array of published locations,
                 [ {'name':'studio', 'created_dt':date} by default
                 keys expected ['studio', 'site1', 'gdrive1']
+            checksum: checksum of file calculated during transfer
 
         Returns:
             dict: file info dictionary
         """
 
-        return {
+        file_info = {
             "_id": ObjectId(),
             "path": self.get_rootless_path(anatomy, path),
             "size": os.path.getsize(path),
             "hash": source_hash(path),
             "sites": sites
         }
+        if checksum:
+            file_info["checksum"] = "{}:{}".format(
+                self.transfer_checksum, checksum)
+        return file_info
+
+    def _log_transfer_stats(self, transfer_stats):
+        """Log how many files and bytes were transferred by each strategy.
+
+        Hardlinks and reflinks don't move any data, so they're not counted
+        to moved bytes.
+        """
+        if not transfer_stats:
+            return
+
+        moved_bytes = 0
+        lines = []
+        for strategy, stats in sorted(transfer_stats.items()):
+            if strategy not in (
+                COPY_STRATEGY_HARDLINK, COPY_STRATEGY_REFLINK
+            ):
+                moved_bytes += stats["bytes"]
+            lines.append("- {}: {} files ({})".format(
+                strategy, stats["files"], format_file_size(stats["bytes"])
+            ))
+        self.log.info("Moved {} of data. Transfers by strategy:\n{}".format(
+            format_file_size(moved_bytes), "\n".join(lines)
+        ))
 
     def _validate_path_in_project_roots(self, anatomy, file_path):
         """Checks if 'file_path' starts with any of the roots.
@@ -18,6 +18,9 @@ class ValidateResources(pyblish.api.InstancePlugin):
 
     order = ValidateContentsOrder
     label = "Validate Resources"
+    # Only reads instance data and checks files on disk so it can be
+    #   processed concurrently with other thread safe validators
+    thread_safe = True
 
     def process(self, instance):
 
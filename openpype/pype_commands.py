@@ -309,3 +309,19 @@ class PypeCommands:
         from openpype.lib.project_backpack import unpack_project
 
         unpack_project(zip_filepath, new_root, database_only)
+
+    def index_last_versions(self, project_name=None):
+        from openpype.client import get_projects
+        from openpype.client.operations import update_last_versions_index
+
+        if project_name:
+            project_names = [project_name]
+        else:
+            project_names = [
+                project_doc["name"]
+                for project_doc in get_projects(inactive=True, fields=["name"])
+            ]
+
+        for name in project_names:
+            count = update_last_versions_index(name)
+            print(">>> Indexed {} subsets of project '{}'".format(count, name))
@@ -26,6 +26,9 @@ SCHEMA_KEY_PROJECT_SETTINGS = "projects_schema"
 
 DEFAULT_PROJECT_KEY = "__default_project__"
 
+# Environment variable with path to resolved settings snapshot file
+SETTINGS_SNAPSHOT_ENV_KEY = "OPENPYPE_SETTINGS_SNAPSHOT"
+
 KEY_ALLOWED_SYMBOLS = "a-zA-Z0-9-_ "
 KEY_REGEX = re.compile(r"^[{}]+$".format(KEY_ALLOWED_SYMBOLS))
 
@@ -46,6 +49,8 @@ __all__ = (
 
     "DEFAULT_PROJECT_KEY",
 
+    "SETTINGS_SNAPSHOT_ENV_KEY",
+
     "KEY_ALLOWED_SYMBOLS",
     "KEY_REGEX"
 )
@@ -1,6 +1,7 @@
 import os
 import json
 import copy
+import itertools
 import collections
 import datetime
 from abc import ABCMeta, abstractmethod
@@ -454,6 +455,22 @@ class SettingsHandler(object):
 
         pass
 
+    def get_settings_revision(self, settings_type, project_name=None):
+        """Revision of overrides which changes when overrides change.
+
+        Resolved settings are not cached by settings lib when handler does
+        not provide revisions.
+
+        Args:
+            settings_type (str): System or project settings key.
+            project_name (Optional[str]): Project name for project settings.
+
+        Returns:
+            Union[Hashable, None]: Revision of overrides or None.
+        """
+
+        return None
+
     @abstractmethod
     def get_system_last_saved_info(self):
         """State of last system settings overrides at the moment when called.
@@ -554,8 +571,27 @@ class LocalSettingsHandler:
         """Studio overrides of system settings."""
         pass
 
+    def get_local_settings_revision(self):
+        """Revision of local settings which changes when they change.
+
+        Returns:
+            Union[Hashable, None]: Revision of local settings or None.
+        """
+
+        return None
+
+
+_CACHE_REVISIONS = itertools.count(1)
+
 
 class CacheValues:
+    """Cached overrides data.
+
+    Cache has 'revision' which is changed only when cached data changed.
+    It can be used to find out if values resolved from the cached data
+    must be resolved again.
+    """
+
     cache_lifetime = 10
 
     def __init__(self):
@@ -563,21 +599,52 @@ class CacheValues:
         self.creation_time = None
         self.version = None
         self.last_saved_info = None
+        self.revision = None
 
     def data_copy(self):
         if not self.data:
             return {}
         return copy.deepcopy(self.data)
 
-    def update_data(self, data, version):
+    def _set_data(self, data, version):
+        if (
+            self.revision is None
+            or version != self.version
+            or data != self.data
+        ):
+            self.revision = next(_CACHE_REVISIONS)
         self.data = data
         self.creation_time = datetime.datetime.now()
         self.version = version
 
+    def update_data(self, data, version):
+        self._set_data(data, version)
+
     def update_last_saved_info(self, last_saved_info):
         self.last_saved_info = last_saved_info
 
-    def update_from_document(self, document, version):
+    def update_from_document(self, document, version, last_saved_info=None):
+        """Update data from settings document.
+
+        Args:
+            document (Union[dict[str, Any], None]): Settings document.
+            version (Union[str, None]): Version of settings.
+            last_saved_info (Optional[SettingsStateInfo]): Last saved info
+                of the document. Data of document are not parsed if last
+                saved info did not change.
+        """
+
+        if (
+            last_saved_info is not None
+            and last_saved_info.timestamp
+            and self.revision is not None
+            and version == self.version
+            and last_saved_info == self.last_saved_info
+        ):
+            # Nothing was saved since last update
+            self.creation_time = datetime.datetime.now()
+            return
+
         data = {}
         if document:
             if "data" in document:
@@ -587,8 +654,9 @@ class CacheValues:
                 if value:
                     data = json.loads(value)
 
-        self.data = data
-        self.version = version
+        self._set_data(data, version)
+        if last_saved_info is not None:
+            self.last_saved_info = last_saved_info
 
     def to_json_string(self):
         return json.dumps(self.data or {})
@@ -601,7 +669,7 @@ class CacheValues:
         return delta > self.cache_lifetime
 
     def set_outdated(self):
-        self.create_time = None
+        self.creation_time = None
 
 
 class MongoSettingsHandler(SettingsHandler):
@@ -1346,6 +1414,15 @@ class MongoSettingsHandler(SettingsHandler):
 
     def get_studio_system_settings_overrides(self, return_version):
         """Studio overrides of system settings."""
+        self._update_system_settings_cache()
+
+        cache = self.system_settings_cache
+        data = cache.data_copy()
+        if return_version:
+            return data, cache.version
+        return data
+
+    def _update_system_settings_cache(self):
         if self.system_settings_cache.is_outdated:
             globals_document = self.get_global_settings_doc()
             document, version = self._get_system_settings_overrides_doc()
@@ -1364,12 +1441,6 @@ class MongoSettingsHandler(SettingsHandler):
                 last_saved_info
             )
 
-        cache = self.system_settings_cache
-        data = cache.data_copy()
-        if return_version:
-            return data, cache.version
-        return data
-
     def _get_system_settings_overrides_doc(self):
         document = (
             self._get_studio_system_settings_overrides_for_version()
@@ -1389,25 +1460,25 @@ class MongoSettingsHandler(SettingsHandler):
     def get_system_last_saved_info(self):
         # Make sure settings are recaches
         self.system_settings_cache.set_outdated()
-        self.get_studio_system_settings_overrides(False)
+        self._update_system_settings_cache()
 
         return self.system_settings_cache.last_saved_info.copy()
 
-    def _get_project_settings_overrides(self, project_name, return_version):
+    def _update_project_settings_cache(self, project_name):
         if self.project_settings_cache[project_name].is_outdated:
             document, version = self._get_project_settings_overrides_doc(
                 project_name
             )
-            self.project_settings_cache[project_name].update_from_document(
-                document, version
-            )
             last_saved_info = SettingsStateInfo.from_document(
                 version, PROJECT_SETTINGS_KEY, document
             )
-            self.project_settings_cache[project_name].update_last_saved_info(
-                last_saved_info
+            self.project_settings_cache[project_name].update_from_document(
+                document, version, last_saved_info
             )
 
+    def _get_project_settings_overrides(self, project_name, return_version):
+        self._update_project_settings_cache(project_name)
+
         cache = self.project_settings_cache[project_name]
         data = cache.data_copy()
         if return_version:
@@ -1433,7 +1504,7 @@ class MongoSettingsHandler(SettingsHandler):
     def get_project_last_saved_info(self, project_name):
         # Make sure settings are recaches
         self.project_settings_cache[project_name].set_outdated()
-        self._get_project_settings_overrides(project_name, False)
+        self._update_project_settings_cache(project_name)
 
         return self.project_settings_cache[project_name].last_saved_info.copy()
 
@@ -1441,6 +1512,29 @@ class MongoSettingsHandler(SettingsHandler):
         """Studio overrides of default project settings."""
         return self._get_project_settings_overrides(None, return_version)
 
+    def get_settings_revision(self, settings_type, project_name=None):
+        """Revision of cached overrides.
+
+        Cache of overrides is updated if is outdated.
+
+        Args:
+            settings_type (str): System or project settings key.
+            project_name (Optional[str]): Project name for project settings.
+                Studio overrides of project settings are used if not passed.
+
+        Returns:
+            int: Revision of overrides.
+        """
+
+        if settings_type == SYSTEM_SETTINGS_KEY:
+            self._update_system_settings_cache()
+            return self.system_settings_cache.revision
+
+        if settings_type == PROJECT_SETTINGS_KEY:
+            self._update_project_settings_cache(project_name)
+            return self.project_settings_cache[project_name].revision
+        return None
+
     def get_project_settings_overrides(self, project_name, return_version):
         """Studio overrides of project settings for specific project.
 
@@ -1850,8 +1944,7 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
             upsert=True
         )
 
-    def get_local_settings(self):
-        """Local settings for local site id."""
+    def _update_local_settings_cache(self):
         if self.local_settings_cache.is_outdated:
             document = self.collection.find_one({
                 "type": LOCAL_SETTING_KEY,
@@ -1860,4 +1953,12 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
 
             self.local_settings_cache.update_from_document(document, None)
 
+    def get_local_settings(self):
+        """Local settings for local site id."""
+        self._update_local_settings_cache()
         return self.local_settings_cache.data_copy()
+
+    def get_local_settings_revision(self):
+        """Revision of cached local settings."""
+        self._update_local_settings_cache()
+        return self.local_settings_cache.revision
@@ -1,10 +1,13 @@
 import os
 import json
+import time
+import hashlib
 import functools
 import logging
 import platform
 import copy
 
+import openpype.version
 from openpype import AYON_SERVER_ENABLED
 
 from .exceptions import (
@@ -18,7 +21,8 @@ from .constants import (
     SYSTEM_SETTINGS_KEY,
     PROJECT_SETTINGS_KEY,
     PROJECT_ANATOMY_KEY,
-    DEFAULT_PROJECT_KEY
+    DEFAULT_PROJECT_KEY,
+    SETTINGS_SNAPSHOT_ENV_KEY
 )
 
 from .ayon_settings import (
@@ -38,6 +42,13 @@ DEFAULTS_DIR = os.path.join(
     "defaults"
 )
 
+# Path to precompiled bundle of default settings
+# - bundle is created during build with 'create_default_settings_bundle'
+DEFAULTS_BUNDLE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "defaults_bundle.json"
+)
+
 # Variable where cache of default settings are stored
 _DEFAULT_SETTINGS = None
 
@@ -47,6 +58,101 @@ _SETTINGS_HANDLER = None
 # Handler of local settings
 _LOCAL_SETTINGS_HANDLER = None
 
+# Resolved settings with revisions of overrides used to resolve them
+_RESOLVED_SETTINGS_CACHE = {}
+
+# Resolved settings loaded from snapshot file
+_SETTINGS_SNAPSHOT = None
+# Keys of snapshot file with information about the snapshot
+SNAPSHOT_STATE_KEY = "__state__"
+SNAPSHOT_EXCLUDE_LOCALS_KEY = "__exclude_locals__"
+SNAPSHOT_REMOVE_KEY = "__remove_after_load__"
+# Seconds after which state of snapshot overrides is checked again
+# - same as lifetime of cached overrides in settings handlers
+SNAPSHOT_CHECK_INTERVAL = 10
+
+
+class FrozenSettingsDict(dict):
+    """Read-only dictionary of resolved settings.
+
+    Deep copy of the object is mutable dictionary.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Frozen settings can't be modified.")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {
+            key: copy.deepcopy(value, memo)
+            for key, value in self.items()
+        }
+
+    def __reduce__(self):
+        return (dict, (dict(self), ))
+
+
+class FrozenSettingsList(list):
+    """Read-only list of resolved settings.
+
+    Deep copy of the object is mutable list.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Frozen settings can't be modified.")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    clear = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    reverse = _readonly
+    sort = _readonly
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(item, memo) for item in self]
+
+    def __reduce__(self):
+        return (list, (list(self), ))
+
+
+def freeze_settings(value):
+    """Convert settings value to read-only objects.
+
+    Args:
+        value (Any): Settings value.
+
+    Returns:
+        Any: Value where dictionaries and lists are read-only.
+    """
+
+    if isinstance(value, dict):
+        return FrozenSettingsDict(
+            (key, freeze_settings(item))
+            for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return FrozenSettingsList(freeze_settings(item) for item in value)
+    return value
+
 
 def clear_metadata_from_settings(values):
     """Remove all metadata keys from loaded settings."""
@@ -309,6 +415,15 @@ def save_project_anatomy(project_name, anatomy_data):
     _SETTINGS_HANDLER.save_change_log(project_name, changes, "anatomy")
     _SETTINGS_HANDLER.save_project_anatomy(project_name, anatomy_data)
 
+    # Let anatomy objects in this process know about the change
+    from openpype.lib.events import emit_event
+
+    emit_event(
+        "project.anatomy.changed",
+        {"project_name": project_name},
+        "settings"
+    )
+
     if warnings:
         raise SaveWarningExc(warnings)
 
@@ -530,15 +645,191 @@ def get_local_settings():
     return {}
 
 
+def get_local_settings_revision():
+    """Revision of local settings which changes when they change.
+
+    Cheaper than 'get_local_settings' as local settings are not copied.
+
+    Returns:
+        Union[Hashable, None]: Revision of local settings or None if
+            revision is not available.
+    """
+
+    if not AYON_SERVER_ENABLED:
+        return _get_local_settings_revision()
+    # Local settings are not implemented in AYON mode
+    return 0
+
+
 def load_openpype_default_settings():
-    """Load openpype default settings."""
-    return load_jsons_from_dir(DEFAULTS_DIR)
+    """Load openpype default settings.
+
+    Precompiled bundle of default settings is used if is available and
+    is up to date with default settings files. Otherwise are default
+    settings loaded from json files.
+    """
+    output = _load_default_settings_bundle()
+    if output is None:
+        output = load_jsons_from_dir(DEFAULTS_DIR)
+    return output
+
+
+def _get_file_hash(filepath):
+    with open(filepath, "rb") as stream:
+        return hashlib.sha1(stream.read()).hexdigest()
+
+
+def _get_default_settings_manifest(with_hashes=False):
+    """Information about default settings json files.
+
+    Args:
+        with_hashes (bool): Add hash of file content.
+
+    Returns:
+        dict[str, list]: Modification time and size of files by relative
+            path. Hash of content is added if 'with_hashes' is True.
+    """
+
+    output = {}
+    base_len = len(DEFAULTS_DIR) + 1
+    for base, _directories, filenames in os.walk(DEFAULTS_DIR):
+        for filename in filenames:
+            if not filename.endswith(".json"):
+                continue
+            filepath = os.path.join(base, filename)
+            relpath = filepath[base_len:].replace("\\", "/")
+            stat = os.stat(filepath)
+            item = [stat.st_mtime, stat.st_size]
+            if with_hashes:
+                item.append(_get_file_hash(filepath))
+            output[relpath] = item
+    return output
+
+
+def _is_default_settings_manifest_valid(bundle_manifest):
+    current_manifest = _get_default_settings_manifest()
+    if set(current_manifest) != set(bundle_manifest):
+        return False
+
+    for relpath, (mtime, size) in current_manifest.items():
+        bundle_mtime, bundle_size, bundle_hash = bundle_manifest[relpath]
+        if size != bundle_size:
+            return False
+
+        # Modification time can change when files are extracted or copied
+        #   so validate content hash in that case
+        if mtime != bundle_mtime:
+            filepath = os.path.join(DEFAULTS_DIR, *relpath.split("/"))
+            if _get_file_hash(filepath) != bundle_hash:
+                return False
+    return True
+
+
+def _get_default_settings_stamp(manifest):
+    """Stamp of default settings bundle.
+
+    Stamp contains OpenPype version and hash of default settings files.
+
+    Args:
+        manifest (dict[str, list]): Manifest with hashes of files.
+
+    Returns:
+        dict[str, str]: Version and tree hash.
+    """
+
+    tree_hash = hashlib.sha1()
+    for relpath in sorted(manifest):
+        tree_hash.update(relpath.encode("utf-8"))
+        tree_hash.update(manifest[relpath][2].encode("utf-8"))
+
+    return {
+        "version": openpype.version.__version__,
+        "tree_hash": tree_hash.hexdigest(),
+    }
+
+
+def _is_default_settings_bundle_valid(bundle):
+    # Bundle was created for different version of code
+    if bundle["stamp"]["version"] != openpype.version.__version__:
+        return False
+
+    # Files are checked also in builds, default settings of build can be
+    #   changed without change of version
+    return _is_default_settings_manifest_valid(bundle["manifest"])
+
+
+def _load_default_settings_bundle():
+    """Load default settings from precompiled bundle.
+
+    Bundle is validated by version in its stamp and default settings files
+    are checked against manifest of the bundle. Content of files is hashed
+    only if their modification time changed.
+
+    Returns:
+        Union[dict[str, Any], None]: Default settings or None if bundle is
+            not available or is outdated.
+    """
+
+    if not os.path.exists(DEFAULTS_BUNDLE_PATH):
+        return None
+
+    try:
+        with open(DEFAULTS_BUNDLE_PATH, "r") as stream:
+            bundle = json.load(stream)
+        data = bundle["data"]
+        is_valid = _is_default_settings_bundle_valid(bundle)
+
+    except Exception:
+        log.warning(
+            "Failed to load default settings bundle \"{}\"".format(
+                DEFAULTS_BUNDLE_PATH
+            ),
+            exc_info=True
+        )
+        return None
+
+    if not is_valid:
+        log.debug("Default settings bundle is outdated. Skipping.")
+        return None
+    return data
+
+
+def create_default_settings_bundle(output_path=None):
+    """Create precompiled bundle of default settings.
+
+    Bundle contains default settings from all json files in one file,
+    stamp with version and hash of the files and manifest of the files used
+    to validate that bundle is up to date.
+
+    Args:
+        output_path (Optional[str]): Path to output file. Bundle is stored
+            next to default settings by default.
+
+    Returns:
+        str: Path to created bundle.
+    """
+
+    if output_path is None:
+        output_path = DEFAULTS_BUNDLE_PATH
+
+    manifest = _get_default_settings_manifest(True)
+    bundle = {
+        "stamp": _get_default_settings_stamp(manifest),
+        "manifest": manifest,
+        "data": load_jsons_from_dir(DEFAULTS_DIR),
+    }
+    tmp_path = "{}.{}.tmp".format(output_path, os.getpid())
+    with open(tmp_path, "w") as stream:
+        json.dump(bundle, stream, separators=(",", ":"))
+    os.replace(tmp_path, output_path)
+    return output_path
 
 
 def reset_default_settings():
     """Reset cache of default settings. Can't be used now."""
     global _DEFAULT_SETTINGS
     _DEFAULT_SETTINGS = None
+    _RESOLVED_SETTINGS_CACHE.clear()
 
 
 def _get_default_settings():
@@ -922,8 +1213,84 @@ def apply_local_settings_on_project_settings(
         sync_server_config["remote_site"] = remote_site
 
 
+@require_local_handler
+def _get_local_settings_revision():
+    return _LOCAL_SETTINGS_HANDLER.get_local_settings_revision()
+
+
+@require_handler
+def _get_settings_revisions(settings_type, project_name, exclude_locals):
+    """Revisions of overrides used to resolve settings.
+
+    Returns:
+        Union[tuple, None]: Revisions or None if any revision is not
+            available.
+    """
+
+    revisions = [_SETTINGS_HANDLER.get_settings_revision(settings_type)]
+    if project_name:
+        revisions.append(
+            _SETTINGS_HANDLER.get_settings_revision(
+                settings_type, project_name
+            )
+        )
+
+    if not exclude_locals:
+        revisions.append(_get_local_settings_revision())
+
+    if None in revisions:
+        return None
+    return tuple(revisions)
+
+
+def _get_resolved_settings(
+    settings_type, project_name, clear_metadata, exclude_locals, resolve_func
+):
+    """Resolved settings cached by revisions of used overrides.
+
+    Settings are resolved again only if any of used overrides changed.
+
+    Returns:
+        FrozenSettingsDict: Resolved settings.
+    """
+
+    if exclude_locals is None:
+        exclude_locals = not clear_metadata
+
+    revisions = _get_settings_revisions(
+        settings_type, project_name, exclude_locals
+    )
+    if revisions is None:
+        return freeze_settings(resolve_func(clear_metadata, exclude_locals))
+
+    cache_key = (settings_type, project_name, clear_metadata, exclude_locals)
+    cached = _RESOLVED_SETTINGS_CACHE.get(cache_key)
+    if cached is not None and cached[0] == revisions:
+        return cached[1]
+
+    value = freeze_settings(resolve_func(clear_metadata, exclude_locals))
+    _RESOLVED_SETTINGS_CACHE[cache_key] = (revisions, value)
+    return value
+
+
+def _get_frozen_system_settings(clear_metadata=True, exclude_locals=None):
+    return _get_resolved_settings(
+        SYSTEM_SETTINGS_KEY,
+        None,
+        clear_metadata,
+        exclude_locals,
+        _resolve_system_settings
+    )
+
+
 def _get_system_settings(clear_metadata=True, exclude_locals=None):
     """System settings with applied studio overrides."""
+    return copy.deepcopy(
+        _get_frozen_system_settings(clear_metadata, exclude_locals)
+    )
+
+
+def _resolve_system_settings(clear_metadata, exclude_locals):
     default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
     studio_values = get_studio_system_settings_overrides()
     result = apply_overrides(default_values, studio_values)
@@ -1024,16 +1391,39 @@ def get_anatomy_settings(
     return result
 
 
-def _get_project_settings(
+def _get_frozen_project_settings(
     project_name, clear_metadata=True, exclude_locals=None
 ):
-    """Project settings with applied studio and project overrides."""
     if not project_name:
         raise ValueError(
             "Must enter project name."
             " Call `get_default_project_settings` to get project defaults."
         )
 
+    def _resolve(_clear_metadata, _exclude_locals):
+        return _resolve_project_settings(
+            project_name, _clear_metadata, _exclude_locals
+        )
+
+    return _get_resolved_settings(
+        PROJECT_SETTINGS_KEY,
+        project_name,
+        clear_metadata,
+        exclude_locals,
+        _resolve
+    )
+
+
+def _get_project_settings(
+    project_name, clear_metadata=True, exclude_locals=None
+):
+    """Project settings with applied studio and project overrides."""
+    return copy.deepcopy(_get_frozen_project_settings(
+        project_name, clear_metadata, exclude_locals
+    ))
+
+
+def _resolve_project_settings(project_name, clear_metadata, exclude_locals):
     studio_overrides = get_default_project_settings(False)
     project_overrides = get_project_settings_overrides(
         project_name
@@ -1128,7 +1518,358 @@ def get_general_environments():
     return value["general"]["environment"]
 
 
+def _get_settings_state(project_names, exclude_locals):
+    """State of overrides used to resolve settings of a snapshot.
+
+    State contains version and last saved timestamp of studio and project
+    overrides and hash of local settings. Overrides are stored by a
+    version so a snapshot created with different version is outdated too.
+
+    Args:
+        project_names (Iterable[str]): Names of projects in snapshot.
+        exclude_locals (bool): Local settings are not applied.
+
+    Returns:
+        Union[dict[str, Any], None]: State of overrides or None if state
+            is not available.
+    """
+
+    if AYON_SERVER_ENABLED:
+        return None
+
+    def _get_info_state(last_saved_info):
+        return [last_saved_info.openpype_version, last_saved_info.timestamp]
+
+    locals_hash = None
+    if not exclude_locals:
+        content = json.dumps(get_local_settings(), sort_keys=True)
+        locals_hash = hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    return {
+        "system": _get_info_state(get_system_last_saved_info()),
+        "studio_project": _get_info_state(get_project_last_saved_info(None)),
+        "projects": {
+            project_name: _get_info_state(
+                get_project_last_saved_info(project_name)
+            )
+            for project_name in project_names
+        },
+        "locals": locals_hash,
+    }
+
+
+class _SettingsSnapshot(object):
+    """Resolved settings loaded from snapshot file.
+
+    State of overrides used to create the snapshot is checked again after
+    'SNAPSHOT_CHECK_INTERVAL' seconds and the snapshot is dropped once any
+    of them changed.
+
+    Snapshot created without local settings is used for queries with local
+    settings too, current local settings are applied on its values.
+
+    Args:
+        data (dict[str, Any]): Frozen settings by settings type.
+        state (dict[str, Any]): State of overrides used to create snapshot.
+        exclude_locals (bool): Local settings are not applied on values.
+    """
+
+    def __init__(self, data, state, exclude_locals):
+        self._data = data
+        self._state = state
+        self._exclude_locals = exclude_locals
+        self._project_names = list(
+            (data.get(PROJECT_SETTINGS_KEY) or {}).keys()
+        )
+        self._checked_at = None
+        self._values_with_locals = {}
+
+    def is_valid(self):
+        """Overrides used to create the snapshot did not change.
+
+        Returns:
+            bool: Snapshot can be used.
+        """
+
+        if self._state is None:
+            return False
+
+        if (
+            self._checked_at is not None
+            and (time.time() - self._checked_at) < SNAPSHOT_CHECK_INTERVAL
+        ):
+            return True
+
+        self._checked_at = time.time()
+        if self._state != _get_settings_state(
+            self._project_names, self._exclude_locals
+        ):
+            log.debug("Settings snapshot is outdated")
+            self._state = None
+            self._data = {}
+            self._values_with_locals = {}
+            return False
+        return True
+
+    def get_value(self, settings_type, project_name, exclude_locals):
+        """Frozen settings from snapshot.
+
+        Args:
+            settings_type (str): System or project settings key.
+            project_name (Union[str, None]): Project name.
+            exclude_locals (bool): Query is without local settings.
+
+        Returns:
+            Union[FrozenSettingsDict, None]: Settings or None if snapshot
+                can't be used.
+        """
+
+        if not self.is_valid():
+            return None
+
+        if settings_type == SYSTEM_SETTINGS_KEY:
+            value = self._data.get(SYSTEM_SETTINGS_KEY)
+        else:
+            value = (
+                self._data.get(PROJECT_SETTINGS_KEY) or {}
+            ).get(project_name)
+
+        if value is None or exclude_locals == self._exclude_locals:
+            return value
+
+        # Local settings can't be removed from values
+        if exclude_locals:
+            return None
+        return self._get_value_with_locals(settings_type, project_name, value)
+
+    def _get_value_with_locals(self, settings_type, project_name, value):
+        revision = _get_local_settings_revision()
+        key = (settings_type, project_name)
+        cached = self._values_with_locals.get(key)
+        if (
+            revision is not None
+            and cached is not None
+            and cached[0] == revision
+        ):
+            return cached[1]
+
+        value = copy.deepcopy(value)
+        local_settings = get_local_settings()
+        if settings_type == SYSTEM_SETTINGS_KEY:
+            apply_local_settings_on_system_settings(value, local_settings)
+        else:
+            apply_local_settings_on_project_settings(
+                value, local_settings, project_name
+            )
+        value = freeze_settings(value)
+        if revision is not None:
+            self._values_with_locals[key] = (revision, value)
+        return value
+
+
+def _load_settings_snapshot(filepath):
+    try:
+        with open(filepath, "r") as stream:
+            data = json.load(stream)
+    except (IOError, OSError, JSON_EXC):
+        log.warning(
+            "Failed to load settings snapshot \"{}\"".format(filepath),
+            exc_info=True
+        )
+        return None
+
+    if data.pop(SNAPSHOT_REMOVE_KEY, False):
+        try:
+            os.remove(filepath)
+        except OSError:
+            pass
+
+    state = data.pop(SNAPSHOT_STATE_KEY, None)
+    exclude_locals = data.pop(SNAPSHOT_EXCLUDE_LOCALS_KEY, False)
+    snapshot = _SettingsSnapshot(freeze_settings(data), state, exclude_locals)
+    if not snapshot.is_valid():
+        log.debug("Settings snapshot \"{}\" is outdated".format(filepath))
+        return None
+    return snapshot
+
+
+def _get_settings_snapshot():
+    """Resolved settings from snapshot file.
+
+    Path to snapshot file is defined by environment variable
+    'OPENPYPE_SETTINGS_SNAPSHOT'. The file is loaded only once per process
+    and the variable is removed from environment, so processes started
+    from this process don't use the snapshot.
+
+    Returns:
+        Union[_SettingsSnapshot, None]: Snapshot or None if is not
+            available or is outdated.
+    """
+
+    global _SETTINGS_SNAPSHOT
+    if _SETTINGS_SNAPSHOT is None:
+        snapshot = None
+        filepath = os.environ.pop(SETTINGS_SNAPSHOT_ENV_KEY, None)
+        if filepath and os.path.exists(filepath):
+            snapshot = _load_settings_snapshot(filepath)
+        # Use 'False' to mark that snapshot was already loaded
+        _SETTINGS_SNAPSHOT = snapshot or False
+    return _SETTINGS_SNAPSHOT or None
+
+
+def _get_snapshot_value(settings_type, project_name, args, kwargs):
+    """Settings from snapshot for query with passed arguments.
+
+    Snapshot is used only for settings without metadata.
+
+    Returns:
+        Union[FrozenSettingsDict, None]: Settings or None if snapshot can't
+            be used.
+    """
+
+    if args or set(kwargs) - {"clear_metadata", "exclude_locals"}:
+        return None
+
+    if not kwargs.get("clear_metadata", True):
+        return None
+
+    snapshot = _get_settings_snapshot()
+    if snapshot is None:
+        return None
+    return snapshot.get_value(
+        settings_type, project_name, bool(kwargs.get("exclude_locals"))
+    )
+
+
+def save_settings_snapshot(
+    filepath, project_names=None, exclude_locals=False, remove_after_load=False
+):
+    """Store resolved settings to a file for child processes.
+
+    Child processes with environment variable 'OPENPYPE_SETTINGS_SNAPSHOT'
+    set to the file path use the snapshot instead of resolving settings
+    again, until any of used overrides change. Only settings without
+    metadata are used from the snapshot. Snapshot without local settings
+    is used for queries with local settings too, current local settings
+    are applied on its values.
+
+    Snapshot is not created in AYON mode as there is no information about
+    changes of settings.
+
+    Args:
+        filepath (str): Path to output json file.
+        project_names (Optional[Iterable[str]]): Names of projects which
+            should be stored to the snapshot.
+        exclude_locals (Optional[bool]): Don't apply local settings. Should
+            be used for processes running on a different machine, e.g. farm
+            jobs.
+        remove_after_load (Optional[bool]): Child process removes the file
+            after it is loaded.
+
+    Returns:
+        dict[str, str]: Environment variables which should be set for
+            child processes. Empty if snapshot was not created.
+    """
+
+    project_names = list(project_names or [])
+    # Get state before settings are resolved, snapshot is outdated if
+    #   overrides change in meantime
+    state = _get_settings_state(project_names, exclude_locals)
+    if state is None:
+        return {}
+
+    data = {
+        SNAPSHOT_STATE_KEY: state,
+        SNAPSHOT_EXCLUDE_LOCALS_KEY: exclude_locals,
+        SNAPSHOT_REMOVE_KEY: remove_after_load,
+        SYSTEM_SETTINGS_KEY: _get_frozen_settings(
+            SYSTEM_SETTINGS_KEY, exclude_locals=exclude_locals
+        ),
+        PROJECT_SETTINGS_KEY: {
+            project_name: _get_frozen_settings(
+                PROJECT_SETTINGS_KEY, project_name,
+                exclude_locals=exclude_locals
+            )
+            for project_name in project_names
+        }
+    }
+    dirpath = os.path.dirname(filepath)
+    if dirpath and not os.path.exists(dirpath):
+        os.makedirs(dirpath)
+
+    # Write to temp file first so readers never see partial content
+    tmp_path = "{}.{}.tmp".format(filepath, os.getpid())
+    with open(tmp_path, "w") as stream:
+        json.dump(data, stream)
+    os.replace(tmp_path, filepath)
+    return {SETTINGS_SNAPSHOT_ENV_KEY: filepath}
+
+
+def _get_frozen_settings(
+    settings_type, project_name=None, exclude_locals=False
+):
+    # Settings are always resolved, not taken from loaded snapshot
+    if settings_type == SYSTEM_SETTINGS_KEY:
+        return _get_frozen_system_settings(exclude_locals=exclude_locals)
+    return _get_frozen_project_settings(
+        project_name, exclude_locals=exclude_locals
+    )
+
+
+def get_frozen_system_settings(*args, **kwargs):
+    """Read-only system settings.
+
+    Resolved settings are cached so the function is cheaper than
+    'get_system_settings' which returns a mutable copy. Use
+    'copy.deepcopy' to get mutable settings.
+
+    Returns:
+        FrozenSettingsDict: System settings.
+    """
+
+    snapshot_value = _get_snapshot_value(
+        SYSTEM_SETTINGS_KEY, None, args, kwargs
+    )
+    if snapshot_value is not None:
+        return snapshot_value
+
+    if not AYON_SERVER_ENABLED:
+        return _get_frozen_system_settings(*args, **kwargs)
+    return freeze_settings(get_system_settings(*args, **kwargs))
+
+
+def get_frozen_project_settings(project_name, *args, **kwargs):
+    """Read-only project settings.
+
+    Resolved settings are cached so the function is cheaper than
+    'get_project_settings' which returns a mutable copy. Use
+    'copy.deepcopy' to get mutable settings.
+
+    Args:
+        project_name (str): Project name.
+
+    Returns:
+        FrozenSettingsDict: Project settings.
+    """
+
+    snapshot_value = _get_snapshot_value(
+        PROJECT_SETTINGS_KEY, project_name, args, kwargs
+    )
+    if snapshot_value is not None:
+        return snapshot_value
+
+    if not AYON_SERVER_ENABLED:
+        return _get_frozen_project_settings(project_name, *args, **kwargs)
+    return freeze_settings(get_project_settings(project_name, *args, **kwargs))
+
+
 def get_system_settings(*args, **kwargs):
+    snapshot_value = _get_snapshot_value(
+        SYSTEM_SETTINGS_KEY, None, args, kwargs
+    )
+    if snapshot_value is not None:
+        return copy.deepcopy(snapshot_value)
+
     if not AYON_SERVER_ENABLED:
         return _get_system_settings(*args, **kwargs)
 
@@ -1137,6 +1878,12 @@ def get_system_settings(*args, **kwargs):
 
 
 def get_project_settings(project_name, *args, **kwargs):
+    snapshot_value = _get_snapshot_value(
+        PROJECT_SETTINGS_KEY, project_name, args, kwargs
+    )
+    if snapshot_value is not None:
+        return copy.deepcopy(snapshot_value)
+
     if not AYON_SERVER_ENABLED:
         return _get_project_settings(project_name, *args, **kwargs)
 
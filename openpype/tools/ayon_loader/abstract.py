@@ -627,6 +627,20 @@ class FrontendLoaderController(_BaseLoaderController):
 
         pass
 
+    @abstractmethod
+    def prefetch_thumbnails(self, project_name, thumbnail_ids):
+        """Download thumbnails in background.
+
+        Used to prepare thumbnails of items visible in UI before they
+        are requested by 'get_thumbnail_path'.
+
+        Args:
+            project_name (str): Project name.
+            thumbnail_ids (Iterable[str]): Thumbnail ids.
+        """
+
+        pass
+
     # Selection model wrapper calls
     @abstractmethod
     def get_selected_project_name(self):
@@ -224,6 +224,11 @@ class LoaderController(BackendLoaderController, FrontendLoaderController):
             project_name, thumbnail_id
         )
 
+    def prefetch_thumbnails(self, project_name, thumbnail_ids):
+        self._thumbnails_model.prefetch_thumbnails(
+            project_name, thumbnail_ids
+        )
+
     def change_products_group(self, project_name, product_ids, group_name):
         self._products_model.change_products_group(
             project_name, product_ids, group_name
@@ -155,6 +155,15 @@ class ProductsWidget(QtWidgets.QWidget):
         products_view.selectionModel().selectionChanged.connect(
             self._on_selection_change)
         products_model.version_changed.connect(self._on_version_change)
+        products_view.verticalScrollBar().valueChanged.connect(
+            self._on_view_change)
+        products_view.expanded.connect(self._on_view_change)
+
+        # Prefetch thumbnails of visible rows when view stops changing
+        prefetch_timer = QtCore.QTimer(self)
+        prefetch_timer.setSingleShot(True)
+        prefetch_timer.setInterval(200)
+        prefetch_timer.timeout.connect(self._on_prefetch_timer)
 
         controller.register_event_callback(
             "selection.folders.changed",
@@ -178,6 +187,8 @@ class ProductsWidget(QtWidgets.QWidget):
         self._in_scene_delegate = in_scene_delegate
         self._site_sync_delegate = site_sync_delegate
 
+        self._prefetch_timer = prefetch_timer
+
         self._selected_project_name = None
         self._selected_folder_ids = set()
 
@@ -260,8 +271,31 @@ class ProductsWidget(QtWidgets.QWidget):
 
     def _on_refresh(self):
         self._fill_version_editor()
+        self._prefetch_timer.start()
         self.refreshed.emit()
 
+    def _on_view_change(self):
+        self._prefetch_timer.start()
+
+    def _on_prefetch_timer(self):
+        project_name = self._products_model.get_last_project_name()
+        if not project_name:
+            return
+
+        view = self._products_view
+        model = view.model()
+        viewport_height = view.viewport().height()
+        thumbnail_ids = set()
+        index = view.indexAt(QtCore.QPoint(0, 0))
+        while (
+            index.isValid()
+            and view.visualRect(index).top() < viewport_height
+        ):
+            thumbnail_ids.add(model.data(index, VERSION_THUMBNAIL_ID_ROLE))
+            index = view.indexBelow(index)
+
+        self._controller.prefetch_thumbnails(project_name, thumbnail_ids)
+
     def _on_rows_inserted(self):
         self._fill_version_editor()
 
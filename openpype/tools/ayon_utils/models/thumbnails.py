@@ -1,11 +1,15 @@
+import threading
 import collections
 
 import ayon_api
 
+from openpype.lib import Logger
 from openpype.client.server.thumbnails import AYONThumbnailCache
 
 from .cache import NestedCacheItem
 
+log = Logger.get_logger(__name__)
+
 
 class ThumbnailsModel:
     entity_cache_lifetime = 240  # In seconds
@@ -18,6 +22,10 @@ class ThumbnailsModel:
         self._versions_cache = NestedCacheItem(
             levels=2, lifetime=self.entity_cache_lifetime)
 
+        self._prefetch_lock = threading.Lock()
+        self._prefetch_request = None
+        self._prefetch_thread = None
+
     def reset(self):
         self._paths_cache = collections.defaultdict(dict)
         self._folders_cache.reset()
@@ -26,6 +34,58 @@ class ThumbnailsModel:
     def get_thumbnail_path(self, project_name, thumbnail_id):
         return self._get_thumbnail_path(project_name, thumbnail_id)
 
+    def prefetch_thumbnails(self, project_name, thumbnail_ids):
+        """Download thumbnails in background thread.
+
+        Only last request is processed if previous did not start yet,
+        e.g. when visible items change during scrolling.
+
+        Args:
+            project_name (str): Project name.
+            thumbnail_ids (Iterable[str]): Thumbnail ids.
+        """
+
+        thumbnail_ids = set(thumbnail_ids)
+        thumbnail_ids.discard(None)
+        if not project_name or not thumbnail_ids:
+            return
+
+        with self._prefetch_lock:
+            self._prefetch_request = (project_name, thumbnail_ids)
+            if (
+                self._prefetch_thread is not None
+                and self._prefetch_thread.is_alive()
+            ):
+                return
+            thread = threading.Thread(
+                target=self._prefetch_thumbnails,
+                name="ThumbnailsPrefetch",
+                daemon=True
+            )
+            self._prefetch_thread = thread
+        thread.start()
+
+    def _prefetch_thumbnails(self):
+        while True:
+            with self._prefetch_lock:
+                request = self._prefetch_request
+                self._prefetch_request = None
+                if request is None:
+                    self._prefetch_thread = None
+                    break
+
+            project_name, thumbnail_ids = request
+            for thumbnail_id in thumbnail_ids:
+                try:
+                    self._get_thumbnail_path(project_name, thumbnail_id)
+                except Exception:
+                    log.warning(
+                        "Failed to prefetch thumbnail {}".format(
+                            thumbnail_id),
+                        exc_info=True
+                    )
+        self._thumbnail_cache.flush()
+
     def get_folder_thumbnail_ids(self, project_name, folder_ids):
         project_cache = self._folders_cache[project_name]
         output = {}
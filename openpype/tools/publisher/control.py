@@ -1,24 +1,24 @@
 import os
 import copy
+import time
 import logging
 import traceback
 import collections
+import threading
 import uuid
 import tempfile
 import shutil
 import inspect
 from abc import ABCMeta, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 import six
 import arrow
 import pyblish.api
 
-from openpype import AYON_SERVER_ENABLED
 from openpype.client import (
-    get_assets,
     get_asset_by_id,
     get_subsets,
-    get_asset_name_identifier,
 )
 from openpype.lib.events import EventSystem
 from openpype.lib.attribute_definitions import (
@@ -35,6 +35,7 @@ from openpype.pipeline import (
 )
 from openpype.pipeline.create import (
     CreateContext,
+    get_asset_hierarchy_index,
     AutoCreator,
     HiddenCreator,
     Creator,
@@ -45,6 +46,8 @@ from openpype.pipeline.create.context import (
 )
 from openpype.pipeline.publish import get_publish_instance_label
 
+from .report_store import PublishReportStore
+
 # Define constant for plugin orders offset
 PLUGIN_ORDER_OFFSET = 0.5
 
@@ -67,61 +70,65 @@ class MainThreadItem:
         self.callback(*self.args, **self.kwargs)
 
 
+class ThreadRecordsHandler(logging.Handler):
+    """Collect pyblish log records separately for each thread.
+
+    Replacement of 'pyblish.lib.MessageHandler' used when plugins are
+    processed concurrently. Records are stored only for threads which
+    called 'start', records of other threads are ignored.
+    """
+
+    def __init__(self):
+        super(ThreadRecordsHandler, self).__init__()
+        self._records_by_thread = {}
+
+    def start(self):
+        """Start collecting records of current thread.
+
+        Returns:
+            list[logging.LogRecord]: List where records are collected.
+        """
+
+        records = []
+        self._records_by_thread[threading.get_ident()] = records
+        return records
+
+    def finish(self):
+        """Stop collecting records of current thread."""
+
+        self._records_by_thread.pop(threading.get_ident(), None)
+
+    def emit(self, record):
+        records = self._records_by_thread.get(record.thread)
+        if records is not None and record.name.startswith("pyblish"):
+            records.append(record)
+
+
 class AssetDocsCache:
-    """Cache asset documents for creation part."""
+    """Cache asset documents for creation part.
 
-    projection = {
-        "_id": True,
-        "name": True,
-        "data.visualParent": True,
-        "data.tasks": True
-    }
-    if AYON_SERVER_ENABLED:
-        projection["data.parents"] = True
+    Uses shared asset hierarchy index of project. Returned documents are
+    shared and must not be modified.
+    """
 
     def __init__(self, controller):
         self._controller = controller
-        self._asset_docs = None
-        self._asset_docs_hierarchy = None
-        self._task_names_by_asset_name = {}
-        self._asset_docs_by_name = {}
+        self._asset_index = None
         self._full_asset_docs_by_name = {}
 
     def reset(self):
-        self._asset_docs = None
-        self._asset_docs_hierarchy = None
-        self._task_names_by_asset_name = {}
-        self._asset_docs_by_name = {}
+        self._asset_index = None
         self._full_asset_docs_by_name = {}
 
-    def _query(self):
-        if self._asset_docs is not None:
-            return
-
-        project_name = self._controller.project_name
-        asset_docs = list(get_assets(
-            project_name, fields=self.projection.keys()
-        ))
-        asset_docs_by_name = {}
-        task_names_by_asset_name = {}
-        for asset_doc in asset_docs:
-            if "data" not in asset_doc:
-                asset_doc["data"] = {"tasks": {}, "visualParent": None}
-            elif "tasks" not in asset_doc["data"]:
-                asset_doc["data"]["tasks"] = {}
-
-            asset_name = get_asset_name_identifier(asset_doc)
-            asset_tasks = asset_doc["data"]["tasks"]
-            task_names_by_asset_name[asset_name] = list(asset_tasks.keys())
-            asset_docs_by_name[asset_name] = asset_doc
-
-        self._asset_docs = asset_docs
-        self._asset_docs_by_name = asset_docs_by_name
-        self._task_names_by_asset_name = task_names_by_asset_name
+    def _get_asset_index(self):
+        if self._asset_index is None:
+            self._asset_index = get_asset_hierarchy_index(
+                self._controller.project_name, refresh=True
+            )
+        return self._asset_index
 
     def get_asset_docs(self):
-        self._query()
-        return copy.deepcopy(self._asset_docs)
+        return self._get_asset_index().asset_docs
 
     def get_asset_hierarchy(self):
         """Prepare asset documents into hierarchy.
@@ -134,36 +141,17 @@ class AssetDocsCache:
                 Top level assets have parent id 'None'.
         """
 
-        if self._asset_docs_hierarchy is None:
-            _queue = collections.deque(self.get_asset_docs())
-
-            output = collections.defaultdict(list)
-            while _queue:
-                asset_doc = _queue.popleft()
-                asset_doc["_id"] = str(asset_doc["_id"])
-                parent_id = asset_doc["data"]["visualParent"]
-                if parent_id is not None:
-                    parent_id = str(parent_id)
-                    asset_doc["data"]["visualParent"] = parent_id
-                output[parent_id].append(asset_doc)
-            self._asset_docs_hierarchy = output
-        return copy.deepcopy(self._asset_docs_hierarchy)
+        return self._get_asset_index().get_hierarchy()
 
     def get_task_names_by_asset_name(self):
-        self._query()
-        return copy.deepcopy(self._task_names_by_asset_name)
+        return self._get_asset_index().get_task_names_by_asset_name()
 
     def get_asset_by_name(self, asset_name):
-        self._query()
-        asset_doc = self._asset_docs_by_name.get(asset_name)
-        if asset_doc is None:
-            return None
-        return copy.deepcopy(asset_doc)
+        return self._get_asset_index().get_asset_by_name(asset_name)
 
     def get_full_asset_by_name(self, asset_name):
-        self._query()
         if asset_name not in self._full_asset_docs_by_name:
-            asset_doc = self._asset_docs_by_name.get(asset_name)
+            asset_doc = self.get_asset_by_name(asset_name)
             project_name = self._controller.project_name
             full_asset_doc = get_asset_by_id(project_name, asset_doc["_id"])
             self._full_asset_docs_by_name[asset_name] = full_asset_doc
@@ -174,20 +162,37 @@ class PublishReportMaker:
     """Report for single publishing process.
 
     Report keeps current state of publishing and currently processed plugin.
+    Results with log items are written to 'PublishReportStore' and only
+    their indexes are kept in memory.
     """
 
+    # Count of report store items read at once
+    logs_page_size = 100
+
     def __init__(self, controller):
         self.controller = controller
         self._create_discover_result = None
         self._convert_discover_result = None
         self._publish_discover_result = None
+        self._crashed_file_paths = None
 
+        self._report_store = PublishReportStore()
         self._plugin_data_by_id = {}
         self._current_plugin = None
         self._current_plugin_data = {}
         self._all_instances_by_id = {}
         self._current_context = None
 
+    @property
+    def report_store(self):
+        """Storage of results and their log items.
+
+        Returns:
+            PublishReportStore: Report store.
+        """
+
+        return self._report_store
+
     def reset(self, context, create_context):
         """Reset report and clear all data."""
 
@@ -196,7 +201,9 @@ class PublishReportMaker:
             create_context.convertor_discover_result
         )
         self._publish_discover_result = create_context.publish_discover_result
+        self._crashed_file_paths = None
 
+        self._report_store.reset()
         self._plugin_data_by_id = {}
         self._current_plugin = None
         self._current_plugin_data = {}
@@ -245,6 +252,7 @@ class PublishReportMaker:
             "targets": list(plugin.targets),
             "instances_data": [],
             "actions_data": [],
+            "logs_overflow": 0,
             "skipped": False,
             "passed": False
         }
@@ -260,11 +268,16 @@ class PublishReportMaker:
         instance_id = None
         if instance is not None:
             instance_id = instance.id
-        self._current_plugin_data["instances_data"].append({
-            "id": instance_id,
-            "logs": self._extract_instance_log_items(result),
-            "process_time": result["duration"]
-        })
+        index = self._report_store.add_item(
+            self._current_plugin_data["id"],
+            {
+                "type": "result",
+                "id": instance_id,
+                "logs": self._extract_instance_log_items(result),
+                "process_time": result["duration"]
+            }
+        )
+        self._current_plugin_data["instances_data"].append(index)
 
     def add_action_result(self, action, result):
         """Add result of single action."""
@@ -277,12 +290,17 @@ class PublishReportMaker:
         action_name = action.__name__
         action_label = action.label or action_name
         log_items = self._extract_log_items(result)
-        store_item["actions_data"].append({
-            "success": result["success"],
-            "name": action_name,
-            "label": action_label,
-            "logs": log_items
-        })
+        index = self._report_store.add_item(
+            plugin.id,
+            {
+                "type": "action",
+                "success": result["success"],
+                "name": action_name,
+                "label": action_label,
+                "logs": log_items
+            }
+        )
+        store_item["actions_data"].append(index)
 
     def get_report(self, publish_plugins=None):
         """Report data with all details of current state."""
@@ -294,9 +312,7 @@ class PublishReportMaker:
                 instance, instance in self._current_context
             )
 
-        plugins_data_by_id = copy.deepcopy(
-            self._plugin_data_by_id
-        )
+        plugins_data_by_id = self._get_plugins_data_by_id()
 
         # Ensure the current plug-in is marked as `passed` in the result
         # so that it shows on reports for paused publishes
@@ -313,6 +329,109 @@ class PublishReportMaker:
                     plugins_data_by_id[plugin.id] = \
                         self._create_plugin_data_item(plugin)
 
+        return {
+            "plugins_data": list(plugins_data_by_id.values()),
+            "instances": instances_details,
+            "context": self._extract_context_data(self._current_context),
+            "crashed_file_paths": dict(self._get_crashed_file_paths()),
+            "id": uuid.uuid4().hex,
+            "created_at": now.isoformat(),
+            "report_version": "1.0.1",
+        }
+
+    def get_instances_logs(self):
+        """Log items of instances used by report page.
+
+        Only results of plugins which have any stored log items are read
+        from report store, page by page. Actions and plugin data are not
+        read.
+
+        Returns:
+            dict[str, Any]: Context label, instances details and log items
+                by instance id. Logs of context are under 'None'.
+        """
+
+        instances_details = {}
+        for instance in self._all_instances_by_id.values():
+            instances_details[instance.id] = self._extract_instance_data(
+                instance, instance in self._current_context
+            )
+
+        logs_by_instance_id = collections.defaultdict(list)
+        for summary in self._report_store.get_summary():
+            if not summary["logs_count"] and not summary["errors_count"]:
+                continue
+
+            plugin_id = summary["plugin_id"]
+            start = 0
+            while True:
+                items = self._report_store.get_page(
+                    start, self.logs_page_size, plugin_id
+                )
+                if not items:
+                    break
+                start += len(items)
+                for item in items:
+                    if item["type"] != "result":
+                        continue
+                    for log_item in item["logs"]:
+                        log_item["plugin_id"] = plugin_id
+                    logs_by_instance_id[item["id"]].extend(item["logs"])
+
+        return {
+            "context_label": self._extract_context_data(
+                self._current_context)["label"],
+            "instances": instances_details,
+            "logs_by_instance_id": dict(logs_by_instance_id),
+        }
+
+    def _get_plugins_data_by_id(self):
+        """Plugins data with results read from report store."""
+
+        indexes = []
+        for plugin_data in self._plugin_data_by_id.values():
+            indexes.extend(plugin_data["instances_data"])
+            indexes.extend(plugin_data["actions_data"])
+        items_by_index = dict(zip(
+            indexes, self._report_store.get_items(indexes)
+        ))
+
+        plugins_data_by_id = {}
+        for plugin_id, plugin_data in self._plugin_data_by_id.items():
+            summary = self._report_store.get_summary(plugin_id) or {}
+            plugin_data = dict(plugin_data)
+            plugin_data["logs_overflow"] = summary.get("logs_overflow", 0)
+            plugin_data["instances_data"] = [
+                {
+                    "id": item["id"],
+                    "logs": item["logs"],
+                    "process_time": item["process_time"],
+                }
+                for item in (
+                    items_by_index[index]
+                    for index in plugin_data["instances_data"]
+                )
+            ]
+            plugin_data["actions_data"] = [
+                {
+                    "success": item["success"],
+                    "name": item["name"],
+                    "label": item["label"],
+                    "logs": item["logs"],
+                }
+                for item in (
+                    items_by_index[index]
+                    for index in plugin_data["actions_data"]
+                )
+            ]
+            plugins_data_by_id[plugin_id] = plugin_data
+        return plugins_data_by_id
+
+    def _get_crashed_file_paths(self):
+        # Discover results don't change during publishing
+        if self._crashed_file_paths is not None:
+            return self._crashed_file_paths
+
         reports = []
         if self._create_discover_result is not None:
             reports.append(self._create_discover_result)
@@ -330,16 +449,8 @@ class PublishReportMaker:
                 crashed_file_paths[filepath] = "".join(
                     traceback.format_exception(*exc_info)
                 )
-
-        return {
-            "plugins_data": list(plugins_data_by_id.values()),
-            "instances": instances_details,
-            "context": self._extract_context_data(self._current_context),
-            "crashed_file_paths": crashed_file_paths,
-            "id": uuid.uuid4().hex,
-            "created_at": now.isoformat(),
-            "report_version": "1.0.1",
-        }
+        self._crashed_file_paths = crashed_file_paths
+        return crashed_file_paths
 
     def _extract_context_data(self, context):
         context_label = "Context"
@@ -1317,6 +1428,18 @@ class AbstractPublisherController(object):
     def get_publish_report(self):
         pass
 
+    @abstractmethod
+    def get_publish_instances_logs(self):
+        """Log items of instances shown in report page.
+
+        Returns:
+            dict[str, Any]: Data with 'context_label', 'instances' details
+                and 'logs_by_instance_id' keys. Logs of context are under
+                'None' key.
+        """
+
+        pass
+
     @abstractmethod
     def get_validation_errors(self):
         pass
@@ -1735,6 +1858,12 @@ class PublisherController(BasePublisherController):
         # Plugin iterator
         self._main_thread_iter = None
 
+        # Count of threads used to process thread safe validators
+        # - concurrent validation is disabled if is lower than 2
+        self._validation_workers = self._get_validation_workers()
+        # Concurrently processed validators did not finish yet
+        self._concurrent_validation_running = False
+
         # State flags to prevent executing method which is already in progress
         self._resetting_plugins = False
         self._resetting_instances = False
@@ -2233,6 +2362,9 @@ class PublisherController(BasePublisherController):
     def get_publish_report(self):
         return self._publish_report.get_report(self._publish_plugins)
 
+    def get_publish_instances_logs(self):
+        return self._publish_report.get_instances_logs()
+
     def get_validation_errors(self):
         return self._publish_validation_errors.create_report()
 
@@ -2241,6 +2373,7 @@ class PublisherController(BasePublisherController):
 
         self._publish_up_validation = False
         self._publish_comment_is_set = False
+        self._concurrent_validation_running = False
 
         self._main_thread_iter = self._publish_iterator()
         self._publish_context = pyblish.api.Context()
@@ -2353,6 +2486,10 @@ class PublisherController(BasePublisherController):
         self.emit_card_message("Action finished.")
 
     def _publish_next_process(self):
+        # Concurrent validators will continue in publishing when finished
+        if self._concurrent_validation_running:
+            return
+
         # Validations of progress before using iterator
         # - same conditions may be inside iterator but they may be used
         #   only in specific cases (e.g. when it happens for a first time)
@@ -2377,7 +2514,7 @@ class PublisherController(BasePublisherController):
         self._process_main_thread_item(item)
 
     def _process_main_thread_item(self, item):
-        item()
+        item.process()
 
     def _is_publish_plugin_active(self, plugin):
         """Decide if publish plugin is active.
@@ -2419,11 +2556,25 @@ class PublisherController(BasePublisherController):
         change state of processed orders like validation order has passed etc.
 
         Also stops publishing, if should stop on validation.
+
+        Consecutive thread safe validators are processed together in worker
+        threads when concurrent validation is enabled.
         """
 
+        concurrent_plugins = []
         for idx, plugin in enumerate(self._publish_plugins):
             self._publish_progress = idx
 
+            if self._is_concurrent_validator(plugin):
+                concurrent_plugins.append((idx, plugin))
+                continue
+
+            if concurrent_plugins:
+                yield MainThreadItem(
+                    self._process_concurrent_validators, concurrent_plugins
+                )
+                concurrent_plugins = []
+
             # Check if plugin is over validation order
             if not self.publish_has_validated:
                 self.publish_has_validated = (
@@ -2508,6 +2659,11 @@ class PublisherController(BasePublisherController):
                 else:
                     self._publish_report.set_plugin_skipped()
 
+        if concurrent_plugins:
+            yield MainThreadItem(
+                self._process_concurrent_validators, concurrent_plugins
+            )
+
         # Cleanup of publishing process
         self.publish_has_finished = True
         self.publish_progress = self.publish_max_progress
@@ -2526,6 +2682,11 @@ class PublisherController(BasePublisherController):
             plugin, self._publish_context, instance
         )
 
+        self._handle_process_result(result)
+
+        self._publish_next_process()
+
+    def _handle_process_result(self, result):
         exception = result.get("error")
         if exception:
             has_validation_error = False
@@ -2551,6 +2712,231 @@ class PublisherController(BasePublisherController):
 
         self._publish_report.add_result(result)
 
+    @staticmethod
+    def _get_validation_workers():
+        """Count of threads used to process thread safe validators.
+
+        Concurrent validation is opt-in using environment variable
+        'OPENPYPE_PUBLISH_VALIDATION_WORKERS'.
+
+        Returns:
+            int: Count of worker threads.
+        """
+
+        value = os.environ.get("OPENPYPE_PUBLISH_VALIDATION_WORKERS")
+        try:
+            return max(int(value), 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def _is_concurrent_validator(self, plugin):
+        """Plugin can be processed concurrently with other validators.
+
+        Plugin must declare that it is thread safe with class attribute
+        'thread_safe' and must be in validation order. Only validators which
+        don't change context or instances data and don't touch host scene
+        should opt in (e.g. 'ValidateResources').
+
+        Args:
+            plugin (pyblish.Plugin): Publish plugin.
+
+        Returns:
+            bool: Plugin can be processed in worker thread.
+        """
+
+        if self._validation_workers < 2:
+            return False
+
+        if not getattr(plugin, "thread_safe", False):
+            return False
+
+        if not issubclass(
+            plugin, (pyblish.api.ContextPlugin, pyblish.api.InstancePlugin)
+        ):
+            return False
+
+        return (
+            pyblish.api.ValidatorOrder - PLUGIN_ORDER_OFFSET
+            <= plugin.order
+            < self._validation_order
+        )
+
+    def _process_concurrent_validators(self, plugin_items):
+        """Process thread safe validators in worker threads.
+
+        Instances of plugins are collected in main thread and then all
+        plugin and instance pairs are processed in threads. Results are
+        merged to report in main thread in order of plugins and instances
+        as if they were processed one by one.
+
+        Args:
+            plugin_items (list[tuple[int, pyblish.Plugin]]): Plugins with
+                their index in publish plugins.
+        """
+
+        context = self._publish_context
+        families = None
+        jobs = []
+        plugin_jobs = []
+        for idx, plugin in plugin_items:
+            # 'None' means that plugin is skipped
+            instances = None
+            if not self._is_publish_plugin_active(plugin):
+                pass
+
+            elif plugin.__instanceEnabled__:
+                instances = [
+                    instance
+                    for instance in pyblish.logic.instances_by_plugin(
+                        context, plugin
+                    )
+                    if instance.data.get("publish") is not False
+                ] or None
+
+            else:
+                if families is None:
+                    families = collect_families_from_instances(
+                        context, only_active=True
+                    )
+                if pyblish.logic.plugins_by_families([plugin], families):
+                    instances = [None]
+
+            plugin_jobs.append((idx, plugin, instances))
+            for instance in instances or []:
+                jobs.append((plugin, instance))
+
+        plugin_label = "Validators ({})".format(len(plugin_items))
+        self._emit_event(
+            "publish.process.plugin.changed",
+            {"plugin_label": plugin_label}
+        )
+        self._emit_event(
+            "publish.process.instance.changed",
+            {"instance_label": "{} items".format(len(jobs))}
+        )
+
+        self._concurrent_validation_running = True
+
+        def callback(results):
+            self._process_main_thread_item(MainThreadItem(
+                self._finish_concurrent_validators,
+                context,
+                plugin_jobs,
+                results
+            ))
+
+        self._run_concurrent_jobs(context, jobs, callback)
+
+    def _run_concurrent_jobs(self, context, jobs, callback):
+        """Process jobs and pass results to callback.
+
+        Jobs are processed in the current thread which waits for result.
+        Controllers with event loop should process them in background to
+        keep UI responsive.
+
+        Args:
+            context (pyblish.api.Context): Publish context.
+            jobs (list[tuple[pyblish.Plugin, pyblish.api.Instance]]): Plugin
+                and instance pairs to process.
+            callback (Callable[[list[dict]], None]): Callback called with
+                results in order of jobs.
+        """
+
+        callback(self._process_concurrent_jobs(context, jobs))
+
+    def _process_concurrent_jobs(self, context, jobs):
+        if not jobs:
+            return []
+
+        # Root logger is changed only once for all jobs as changing it
+        #   in each thread would not be thread safe
+        handler = ThreadRecordsHandler()
+        root_logger = logging.getLogger()
+        old_level = root_logger.level
+        root_logger.addHandler(handler)
+        root_logger.setLevel(logging.DEBUG)
+        try:
+            workers = min(self._validation_workers, len(jobs))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(
+                    lambda job: self._process_concurrent_job(
+                        handler, context, *job
+                    ),
+                    jobs
+                ))
+        finally:
+            root_logger.removeHandler(handler)
+            root_logger.setLevel(old_level)
+
+    @staticmethod
+    def _process_concurrent_job(handler, context, plugin, instance):
+        """Process plugin in worker thread.
+
+        Mimics 'pyblish.plugin.process' without changes of root logger and
+        of context data which are handled in main thread.
+        """
+
+        result = {
+            "success": False,
+            "plugin": plugin,
+            "instance": instance,
+            "action": None,
+            "error": None,
+            "records": [],
+            "duration": None,
+            "progress": 0,
+            "context": context,
+        }
+        if issubclass(plugin, pyblish.api.ContextPlugin):
+            arg = context
+        else:
+            arg = instance
+
+        records = handler.start()
+        start = time.time()
+        try:
+            plugin().process(arg)
+            result["success"] = True
+        except Exception as exc:
+            pyblish.lib.extract_traceback(exc, plugin.__module__)
+            result["error"] = exc
+        finally:
+            handler.finish()
+
+        result["duration"] = (time.time() - start) * 1000
+        result["records"] = records
+        return result
+
+    def _finish_concurrent_validators(self, context, plugin_jobs, results):
+        # Publishing was reset meanwhile validators were processed
+        if context is not self._publish_context:
+            return
+
+        self._concurrent_validation_running = False
+        results_iter = iter(results)
+        for idx, plugin, instances in plugin_jobs:
+            self._publish_progress = idx
+            self._publish_report.add_plugin_iter(plugin, context)
+            if not instances:
+                self._publish_report.set_plugin_skipped()
+                continue
+
+            for _ in instances:
+                result = next(results_iter)
+                context.data.setdefault("results", []).append(result)
+                exception = result["error"]
+                if exception:
+                    pyblish.lib.emit(
+                        "pluginFailed",
+                        plugin=plugin,
+                        context=context,
+                        instance=result["instance"],
+                        error=exception
+                    )
+                    self.log.error(exception.formatted_traceback)
+                pyblish.lib.emit("pluginProcessed", result=result)
+                self._handle_process_result(result)
+
         self._publish_next_process()
 
 
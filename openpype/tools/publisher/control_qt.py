@@ -1,4 +1,5 @@
 import collections
+import threading
 from abc import abstractmethod, abstractproperty
 
 from qtpy import QtCore
@@ -89,6 +90,18 @@ class QtPublisherController(PublisherController):
     def _process_main_thread_item(self, item):
         self._main_thread_processor.add_item(item)
 
+    def _run_concurrent_jobs(self, context, jobs, callback):
+        # Process in background so UI is not blocked, callback only adds
+        #   item to main thread processor
+        thread = threading.Thread(
+            target=lambda: callback(
+                self._process_concurrent_jobs(context, jobs)
+            ),
+            name="PublishValidators"
+        )
+        thread.daemon = True
+        thread.start()
+
     def _qt_on_publish_start(self):
         self._main_thread_processor.start()
 
@@ -372,6 +385,26 @@ class QtRemotePublishController(BasePublisherController):
     def get_publish_report(self):
         pass
 
+    def get_publish_instances_logs(self):
+        """Log items of instances collected from full publish report."""
+
+        report = self.get_publish_report()
+        logs_by_instance_id = collections.defaultdict(list)
+        for plugin_info in report["plugins_data"]:
+            plugin_id = plugin_info["id"]
+            for instance_info in plugin_info["instances_data"]:
+                for log_item in instance_info["logs"]:
+                    log_item["plugin_id"] = plugin_id
+                logs_by_instance_id[instance_info["id"]].extend(
+                    instance_info["logs"]
+                )
+
+        return {
+            "context_label": report["context"]["label"],
+            "instances": report["instances"],
+            "logs_by_instance_id": dict(logs_by_instance_id),
+        }
+
     @abstractmethod
     def get_validation_errors(self):
         pass
@@ -0,0 +1,193 @@
+import json
+import tempfile
+import threading
+import collections
+
+
+class PublishReportStore(object):
+    """Append-only storage of publish report items in JSON lines file.
+
+    Results of plugins and actions with their log items are written to
+    temporary file when they happen and only position of each line is kept
+    in memory. Items can be read back by index, in pages or filtered by
+    plugin without loading whole file.
+
+    Count of log records stored for a plugin is limited by
+    'max_logs_per_plugin'. Records over the limit are only counted, error
+    items are always stored.
+
+    Args:
+        max_logs_per_plugin (Optional[int]): Max count of log records
+            stored per plugin.
+    """
+
+    default_max_logs_per_plugin = 1000
+
+    def __init__(self, max_logs_per_plugin=None):
+        if max_logs_per_plugin is None:
+            max_logs_per_plugin = self.default_max_logs_per_plugin
+        self._max_logs_per_plugin = max_logs_per_plugin
+
+        self._lock = threading.Lock()
+        self._stream = None
+        self._offsets = []
+        self._plugin_ids = []
+        self._summary_by_plugin_id = collections.OrderedDict()
+
+    def reset(self):
+        """Remove all items and start new file."""
+
+        with self._lock:
+            self._close()
+            self._offsets = []
+            self._plugin_ids = []
+            self._summary_by_plugin_id = collections.OrderedDict()
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def _close(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _get_stream(self):
+        if self._stream is None:
+            # File is removed automatically when is closed
+            self._stream = tempfile.TemporaryFile(
+                mode="w+b", prefix="publish_report_", suffix=".jsonl"
+            )
+        return self._stream
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def _get_plugin_summary(self, plugin_id):
+        summary = self._summary_by_plugin_id.get(plugin_id)
+        if summary is None:
+            summary = {
+                "plugin_id": plugin_id,
+                "items_count": 0,
+                "logs_count": 0,
+                "logs_overflow": 0,
+                "errors_count": 0,
+                "process_time": 0.0,
+            }
+            self._summary_by_plugin_id[plugin_id] = summary
+        return summary
+
+    def add_item(self, plugin_id, item):
+        """Append item related to a plugin.
+
+        Log records in 'logs' of item over limit of plugin are not stored.
+
+        Args:
+            plugin_id (str): Id of plugin.
+            item (dict[str, Any]): Json serializable data with 'logs' key.
+
+        Returns:
+            int: Index of item.
+        """
+
+        with self._lock:
+            summary = self._get_plugin_summary(plugin_id)
+            logs = []
+            for log_item in item.get("logs") or []:
+                if log_item["type"] == "error":
+                    summary["errors_count"] += 1
+                elif summary["logs_count"] >= self._max_logs_per_plugin:
+                    summary["logs_overflow"] += 1
+                    continue
+                else:
+                    summary["logs_count"] += 1
+                logs.append(log_item)
+
+            item = dict(item)
+            item["plugin_id"] = plugin_id
+            item["logs"] = logs
+            summary["items_count"] += 1
+            summary["process_time"] += item.get("process_time") or 0.0
+
+            line = json.dumps(item, default=str).encode("utf-8")
+            stream = self._get_stream()
+            stream.seek(0, 2)
+            self._offsets.append(stream.tell())
+            self._plugin_ids.append(plugin_id)
+            stream.write(line + b"\n")
+            return len(self._offsets) - 1
+
+    def get_items(self, indexes):
+        """Read items by their indexes.
+
+        Args:
+            indexes (Iterable[int]): Indexes of items.
+
+        Returns:
+            list[dict[str, Any]]: Items in order of passed indexes.
+        """
+
+        indexes = list(indexes)
+        if not indexes:
+            return []
+
+        with self._lock:
+            stream = self._get_stream()
+            stream.flush()
+            items_by_index = {}
+            # Read in order of lines in file
+            for index in sorted(set(indexes)):
+                stream.seek(self._offsets[index])
+                items_by_index[index] = json.loads(
+                    stream.readline().decode("utf-8")
+                )
+        return [items_by_index[index] for index in indexes]
+
+    def get_item(self, index):
+        return self.get_items([index])[0]
+
+    def get_page(self, start=0, limit=None, plugin_id=None):
+        """Read page of items.
+
+        Args:
+            start (int): Index of first item on page (after filtering).
+            limit (Optional[int]): Max count of items.
+            plugin_id (Optional[str]): Return only items of a plugin.
+
+        Returns:
+            list[dict[str, Any]]: Items on page.
+        """
+
+        indexes = [
+            index
+            for index, item_plugin_id in enumerate(self._plugin_ids)
+            if plugin_id is None or item_plugin_id == plugin_id
+        ]
+        if limit is None:
+            indexes = indexes[start:]
+        else:
+            indexes = indexes[start:start + limit]
+        return self.get_items(indexes)
+
+    def get_summary(self, plugin_id=None):
+        """Summary of stored items without reading the file.
+
+        Args:
+            plugin_id (Optional[str]): Summary of a plugin.
+
+        Returns:
+            Union[list[dict[str, Any]], dict[str, Any], None]: Summaries of
+                all plugins in order of their first item or summary of
+                passed plugin.
+        """
+
+        with self._lock:
+            if plugin_id is not None:
+                summary = self._summary_by_plugin_id.get(plugin_id)
+                if summary is None:
+                    return None
+                return dict(summary)
+            return [
+                dict(summary)
+                for summary in self._summary_by_plugin_id.values()
+            ]
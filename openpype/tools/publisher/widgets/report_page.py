@@ -1710,24 +1710,19 @@ class ReportsWidget(QtWidgets.QWidget):
         self._validation_errors_by_id = {}
 
     def _get_instance_items(self):
-        report = self._controller.get_publish_report()
-        context_label = report["context"]["label"] or CONTEXT_LABEL
-        instances_by_id = report["instances"]
-        plugins_info = report["plugins_data"]
-        logs_by_instance_id = collections.defaultdict(list)
-        for plugin_info in plugins_info:
-            plugin_id = plugin_info["id"]
-            for instance_info in plugin_info["instances_data"]:
-                instance_id = instance_info["id"] or CONTEXT_ID
-                for log in instance_info["logs"]:
-                    log["plugin_id"] = plugin_id
-                logs_by_instance_id[instance_id].extend(instance_info["logs"])
+        # Only logs are read, full report would read all stored results
+        logs_report = self._controller.get_publish_instances_logs()
+        context_label = logs_report["context_label"] or CONTEXT_LABEL
+        instances_by_id = logs_report["instances"]
+        logs_by_instance_id = logs_report["logs_by_instance_id"]
 
         context_item = _InstanceItem.create_context_item(
-            context_label, logs_by_instance_id[CONTEXT_ID])
+            context_label, logs_by_instance_id.get(None) or [])
         instance_items = [
             _InstanceItem.from_report(
-                instance_id, instance, logs_by_instance_id[instance_id]
+                instance_id,
+                instance,
+                logs_by_instance_id.get(instance_id) or []
             )
             for instance_id, instance in instances_by_id.items()
             if instance["exists"]
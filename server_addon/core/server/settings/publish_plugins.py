@@ -280,6 +280,12 @@ class ExtractOIIOTranscodeProfileModel(BaseSettingsModel):
 
 class ExtractOIIOTranscodeModel(BaseSettingsModel):
     enabled: bool = SettingsField(True)
+    max_workers: int = SettingsField(
+        0,
+        ge=0,
+        le=64,
+        title="Max concurrent oiiotool processes (0 = automatic)"
+    )
     profiles: list[ExtractOIIOTranscodeProfileModel] = SettingsField(
         default_factory=list, title="Profiles"
     )
@@ -460,6 +466,12 @@ class ExtractReviewProfileModel(BaseSettingsModel):
 class ExtractReviewModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
+    max_workers: int = SettingsField(
+        0,
+        ge=0,
+        le=64,
+        title="Max concurrent oiiotool processes (0 = automatic)"
+    )
     profiles: list[ExtractReviewProfileModel] = SettingsField(
         default_factory=list,
         title="Profiles"
@@ -702,6 +714,32 @@ class IntegrateHeroTemplateNameProfileModel(BaseSettingsModel):
     template_name: str = SettingsField("", title="Template name")
 
 
+_transfer_checksum_enum = [
+    {"value": "", "label": "Disabled"},
+    {"value": "md5", "label": "MD5"},
+    {"value": "sha1", "label": "SHA-1"},
+    {"value": "sha256", "label": "SHA-256"}
+]
+
+
+class IntegrateProductModel(BaseSettingsModel):
+    _isGroup = True
+    transfer_max_workers: int = SettingsField(
+        1, ge=1, le=64, title="Concurrent file transfers"
+    )
+    transfer_max_workers_per_volume: int = SettingsField(
+        0,
+        ge=0,
+        le=64,
+        title="Concurrent file transfers per volume (0 = unlimited)"
+    )
+    transfer_checksum: str = SettingsField(
+        "",
+        title="Checksum of copied files",
+        enum_resolver=lambda: _transfer_checksum_enum
+    )
+
+
 class IntegrateHeroVersionModel(BaseSettingsModel):
     _isGroup = True
     enabled: bool = SettingsField(True)
@@ -785,6 +823,10 @@ class PublishPuginsModel(BaseSettingsModel):
         default_factory=IntegrateProductGroupModel,
         title="Integrate Product Group"
     )
+    IntegrateAsset: IntegrateProductModel = SettingsField(
+        default_factory=IntegrateProductModel,
+        title="Integrate Product"
+    )
     IntegrateHeroVersion: IntegrateHeroVersionModel = SettingsField(
         default_factory=IntegrateHeroVersionModel,
         title="Integrate Hero Version"
@@ -867,10 +909,12 @@ DEFAULT_PUBLISH_VALUES = {
     },
     "ExtractOIIOTranscode": {
         "enabled": True,
+        "max_workers": 0,
         "profiles": []
     },
     "ExtractReview": {
         "enabled": True,
+        "max_workers": 0,
         "profiles": [
             {
                 "product_types": [],
@@ -1044,6 +1088,11 @@ DEFAULT_PUBLISH_VALUES = {
             }
         ]
     },
+    "IntegrateAsset": {
+        "transfer_max_workers": 1,
+        "transfer_max_workers_per_volume": 0,
+        "transfer_checksum": ""
+    },
     "IntegrateHeroVersion": {
         "enabled": True,
         "optional": True,
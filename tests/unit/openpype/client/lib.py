@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""In-memory collection used to test mongo client functions."""
+import copy
+
+from pymongo import DeleteOne, InsertOne, UpdateOne
+
+
+def _get_value(doc, key):
+    value = doc
+    for part in key.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None, False
+        value = value[part]
+    return value, True
+
+
+def _match_condition(doc, key, condition):
+    value, exists = _get_value(doc, key)
+    if not isinstance(condition, dict):
+        return exists and value == condition
+
+    for operator, expected in condition.items():
+        if operator == "$in":
+            if not exists or value not in expected:
+                return False
+        elif operator == "$exists":
+            if exists != bool(expected):
+                return False
+        elif operator == "$type":
+            if expected != "null" or not exists or value is not None:
+                return False
+        elif operator == "$lt":
+            if value is None or not value < expected:
+                return False
+        else:
+            raise ValueError("Unsupported operator {}".format(operator))
+    return True
+
+
+def match_filter(doc, query_filter):
+    for key, condition in query_filter.items():
+        if key == "$or":
+            if not any(match_filter(doc, item) for item in condition):
+                return False
+        elif not _match_condition(doc, key, condition):
+            return False
+    return True
+
+
+def _project(doc, projection):
+    if not projection:
+        return copy.deepcopy(doc)
+    output = {"_id": doc["_id"]}
+    for key in projection:
+        value, exists = _get_value(doc, key)
+        if exists:
+            output[key] = copy.deepcopy(value)
+    return output
+
+
+class FakeCollection(object):
+    """Collection storing documents in a list.
+
+    Supports only the query operators used by tested functions. Called
+    methods are stored to 'calls' so tests can check queries.
+    """
+
+    def __init__(self, docs=None):
+        self.docs = [copy.deepcopy(doc) for doc in docs or []]
+        self.calls = []
+
+    def get_doc(self, doc_id):
+        for doc in self.docs:
+            if doc["_id"] == doc_id:
+                return doc
+        return None
+
+    def find(self, query_filter, projection=None):
+        self.calls.append(("find", query_filter))
+        return [
+            _project(doc, projection)
+            for doc in self.docs
+            if match_filter(doc, query_filter)
+        ]
+
+    def aggregate(self, pipeline):
+        self.calls.append(("aggregate", pipeline))
+        docs = [copy.deepcopy(doc) for doc in self.docs]
+        for stage in pipeline:
+            (operator, value), = stage.items()
+            if operator == "$match":
+                docs = [doc for doc in docs if match_filter(doc, value)]
+            elif operator == "$sort":
+                for key, direction in reversed(list(value.items())):
+                    docs.sort(
+                        key=lambda doc: _get_value(doc, key)[0],
+                        reverse=direction < 0
+                    )
+            elif operator == "$group":
+                docs = self._group(docs, value)
+            elif operator == "$lookup":
+                docs = self._lookup(docs, value)
+            elif operator == "$unwind":
+                docs = self._unwind(docs, value)
+            else:
+                raise ValueError("Unsupported stage {}".format(operator))
+        return docs
+
+    def _group(self, docs, group):
+        groups = {}
+        for doc in docs:
+            group_id = _get_value(doc, group["_id"][1:])[0]
+            item = groups.setdefault(group_id, {"_id": group_id})
+            for key, accumulator in group.items():
+                if key == "_id":
+                    continue
+                (operator, field), = accumulator.items()
+                if operator != "$last":
+                    raise ValueError(
+                        "Unsupported accumulator {}".format(operator))
+                item[key] = _get_value(doc, field[1:])[0]
+        return list(groups.values())
+
+    def _lookup(self, docs, lookup):
+        for doc in docs:
+            value, exists = _get_value(doc, lookup["localField"])
+            doc[lookup["as"]] = [
+                copy.deepcopy(foreign_doc)
+                for foreign_doc in self.docs
+                if _get_value(foreign_doc, lookup["foreignField"])[0] == value
+            ] if exists else []
+        return docs
+
+    def _unwind(self, docs, unwind):
+        key = unwind["path"][1:]
+        output = []
+        for doc in docs:
+            values = doc.pop(key, None)
+            if not values:
+                if unwind.get("preserveNullAndEmptyArrays"):
+                    output.append(doc)
+                continue
+            for value in values:
+                new_doc = copy.deepcopy(doc)
+                new_doc[key] = value
+                output.append(new_doc)
+        return output
+
+    def bulk_write(self, operations):
+        self.calls.append(("bulk_write", operations))
+        for operation in operations:
+            if isinstance(operation, InsertOne):
+                self.docs.append(copy.deepcopy(operation._doc))
+
+            elif isinstance(operation, DeleteOne):
+                self.docs = [
+                    doc
+                    for doc in self.docs
+                    if not match_filter(doc, operation._filter)
+                ]
+
+            elif isinstance(operation, UpdateOne):
+                for doc in self.docs:
+                    if not match_filter(doc, operation._filter):
+                        continue
+                    for key, value in operation._doc.get("$set", {}).items():
+                        doc[key] = copy.deepcopy(value)
+                    for key in operation._doc.get("$unset", {}):
+                        doc.pop(key, None)
+                    break
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Test suite for conversion of AYON entities to v3 structure."""
+import copy
+
+import arrow
+
+from openpype.client.server import conversion_utils
+
+
+def _project():
+    return {
+        "name": "demo",
+        "code": "dm",
+        "active": True,
+        "updatedAt": "2023-05-01T10:11:12.123456+00:00",
+        "attrib": {"fps": 25.0, "applications": ["maya/2024"]},
+        "data": {},
+        "taskTypes": [{"name": "Animation", "shortName": "anim"}],
+    }
+
+
+def test_created_at_matches_arrow():
+    for value in (
+        "2023-05-01T10:11:12.123456+00:00",
+        "2023-07-15T00:00:00.5+02:00",
+        "2023-03-26T01:30:00Z",
+    ):
+        expected = arrow.get(value).to("local").strftime("%Y%m%dT%H%M%SZ")
+        assert conversion_utils._convert_created_at(value) == expected
+
+
+def test_converted_project_is_memoized():
+    conversion_utils._CONVERTED_PROJECTS_CACHE.clear()
+    expected = conversion_utils._convert_v4_project_to_v3(_project())
+
+    first = conversion_utils.convert_v4_project_to_v3(_project())
+    assert first == expected
+    first["config"]["tasks"]["Animation"]["short_name"] = "changed"
+
+    second = conversion_utils.convert_v4_project_to_v3(_project())
+    assert second == expected
+
+    # Project changed on server is converted again
+    project = _project()
+    project["updatedAt"] = "2023-05-02T10:11:12+00:00"
+    project["attrib"]["fps"] = 24.0
+    changed_expected = conversion_utils._convert_v4_project_to_v3(
+        copy.deepcopy(project)
+    )
+    assert conversion_utils.convert_v4_project_to_v3(project) == (
+        changed_expected
+    )
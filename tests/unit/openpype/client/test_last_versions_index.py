@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""Test suite for index of last versions stored on subset documents."""
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.client.mongo import entities, operations
+from openpype.client.mongo.entities import LAST_VERSION_KEY
+from openpype.client.mongo.operations import (
+    MongoCreateOperation,
+    MongoUpdateOperation,
+    MongoDeleteOperation,
+    MongoOperationsSession,
+    _LastVersionIndexUpdater,
+    update_last_versions_index,
+)
+
+from tests.unit.openpype.client.lib import FakeCollection
+
+PROJECT_NAME = "demo"
+
+
+def _subset_doc(subset_id, last_version=False):
+    doc = {"_id": subset_id, "type": "subset", "name": "model"}
+    if last_version is not False:
+        doc[LAST_VERSION_KEY] = last_version
+    return doc
+
+
+def _version_doc(version_id, subset_id, name):
+    return {
+        "_id": version_id,
+        "type": "version",
+        "parent": subset_id,
+        "name": name,
+        "data": {"comment": "v{}".format(name)},
+    }
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = FakeCollection()
+    monkeypatch.setattr(
+        operations, "get_project_connection", lambda _: collection)
+    monkeypatch.setattr(
+        entities, "get_project_connection", lambda _: collection)
+    return collection
+
+
+def test_add_operation(collection):
+    subset_id = ObjectId()
+    other_subset_id = ObjectId()
+    updated_id = ObjectId()
+    moved_id = ObjectId()
+    deleted_id = ObjectId()
+    collection.docs.extend([
+        _version_doc(updated_id, subset_id, 1),
+        _version_doc(moved_id, subset_id, 2),
+        _version_doc(deleted_id, subset_id, 3),
+    ])
+
+    created = MongoCreateOperation(
+        PROJECT_NAME, "version", {"parent": str(subset_id), "name": 4})
+    updater = _LastVersionIndexUpdater(PROJECT_NAME)
+    for operation in (
+        created,
+        MongoCreateOperation(PROJECT_NAME, "subset", {"name": "look"}),
+        MongoUpdateOperation(
+            PROJECT_NAME, "version", updated_id, {"name": 5}),
+        MongoUpdateOperation(
+            PROJECT_NAME, "version", moved_id, {"parent": other_subset_id}),
+        # Change of other keys does not affect index
+        MongoUpdateOperation(
+            PROJECT_NAME, "version", ObjectId(), {"data.comment": "text"}),
+        MongoDeleteOperation(PROJECT_NAME, "version", deleted_id),
+    ):
+        updater.add_operation(operation)
+
+    assert updater._created_versions == [
+        (subset_id, created.entity_id, 4)
+    ]
+    assert updater._changed_version_ids == {
+        updated_id, moved_id, deleted_id
+    }
+    assert updater._changed_subset_ids == {other_subset_id}
+
+    # Current parents of changed versions are found before write
+    updater.prepare()
+    assert updater._changed_subset_ids == {subset_id, other_subset_id}
+
+
+def test_created_versions_update_index_conditionally(collection):
+    empty_id = ObjectId()
+    lower_id = ObjectId()
+    higher_id = ObjectId()
+    higher_version = {"_id": ObjectId(), "name": 10}
+    collection.docs.extend([
+        _subset_doc(empty_id, None),
+        _subset_doc(lower_id, {"_id": ObjectId(), "name": 1}),
+        _subset_doc(higher_id, higher_version),
+    ])
+
+    updater = _LastVersionIndexUpdater(PROJECT_NAME)
+    created_ids = {}
+    for subset_id in (empty_id, lower_id, higher_id):
+        operation = MongoCreateOperation(
+            PROJECT_NAME, "version", {"parent": subset_id, "name": 5})
+        created_ids[subset_id] = operation.entity_id
+        updater.add_operation(operation)
+
+    mongo_operations = updater.get_mongo_operations()
+    assert mongo_operations[0]._filter == {
+        "_id": empty_id,
+        "$or": [
+            {LAST_VERSION_KEY: {"$type": "null"}},
+            {"{}.name".format(LAST_VERSION_KEY): {"$lt": 5}},
+        ]
+    }
+
+    collection.bulk_write(mongo_operations)
+    assert collection.get_doc(empty_id)[LAST_VERSION_KEY] == {
+        "_id": created_ids[empty_id], "name": 5
+    }
+    assert collection.get_doc(lower_id)[LAST_VERSION_KEY] == {
+        "_id": created_ids[lower_id], "name": 5
+    }
+    # Index is never lowered
+    assert collection.get_doc(higher_id)[LAST_VERSION_KEY] == higher_version
+
+
+def test_session_commit_recomputes_index(collection):
+    subset_id = ObjectId()
+    not_indexed_id = ObjectId()
+    first_id = ObjectId()
+    last_id = ObjectId()
+    collection.docs.extend([
+        _subset_doc(subset_id, {"_id": last_id, "name": 2}),
+        _subset_doc(not_indexed_id),
+        _version_doc(first_id, subset_id, 1),
+        _version_doc(last_id, subset_id, 2),
+        _version_doc(ObjectId(), not_indexed_id, 1),
+    ])
+
+    session = MongoOperationsSession()
+    session.delete_entity(PROJECT_NAME, "version", last_id)
+    session.commit()
+    assert collection.get_doc(subset_id)[LAST_VERSION_KEY] == {
+        "_id": first_id, "name": 1
+    }
+
+    session.delete_entity(PROJECT_NAME, "version", first_id)
+    session.commit()
+    assert collection.get_doc(subset_id)[LAST_VERSION_KEY] is None
+
+    # Subsets without index are not changed by session
+    session.create_entity(
+        PROJECT_NAME,
+        "version",
+        {"type": "version", "parent": not_indexed_id, "name": 2}
+    )
+    session.commit()
+    assert LAST_VERSION_KEY not in collection.get_doc(not_indexed_id)
+
+    # But are indexed explicitly
+    assert update_last_versions_index(PROJECT_NAME) == 2
+    assert collection.get_doc(not_indexed_id)[LAST_VERSION_KEY]["name"] == 2
+
+
+@pytest.fixture
+def mixed_subsets(collection):
+    indexed_id = ObjectId()
+    not_indexed_id = ObjectId()
+    empty_id = ObjectId()
+    indexed_version = _version_doc(ObjectId(), indexed_id, 3)
+    last_version = _version_doc(ObjectId(), not_indexed_id, 2)
+    collection.docs.extend([
+        _subset_doc(
+            indexed_id,
+            {"_id": indexed_version["_id"], "name": 3}
+        ),
+        _subset_doc(not_indexed_id),
+        _subset_doc(empty_id, None),
+        _version_doc(ObjectId(), indexed_id, 1),
+        indexed_version,
+        _version_doc(ObjectId(), not_indexed_id, 1),
+        last_version,
+    ])
+    return {
+        indexed_id: indexed_version,
+        not_indexed_id: last_version,
+        empty_id: None,
+    }
+
+
+def _aggregated_subset_ids(collection):
+    return [
+        set(pipeline[0]["$match"]["parent"]["$in"])
+        for method, pipeline in collection.calls
+        if method == "aggregate"
+    ]
+
+
+def test_get_last_versions_limit_query(collection, mixed_subsets):
+    output = entities.get_last_versions(
+        PROJECT_NAME, list(mixed_subsets), fields=["_id", "name"])
+
+    assert output == {
+        subset_id: {
+            "_id": version_doc["_id"],
+            "parent": subset_id,
+            "name": version_doc["name"],
+        }
+        for subset_id, version_doc in mixed_subsets.items()
+        if version_doc is not None
+    }
+    # Only not indexed subset is aggregated
+    not_indexed_id = list(mixed_subsets)[1]
+    assert _aggregated_subset_ids(collection) == [{not_indexed_id}]
+
+
+def test_get_last_versions_full_docs(collection, mixed_subsets):
+    output = entities.get_last_versions(PROJECT_NAME, list(mixed_subsets))
+
+    assert output == {
+        subset_id: version_doc
+        for subset_id, version_doc in mixed_subsets.items()
+        if version_doc is not None
+    }
+
+    # Index is not used when active state is requested
+    collection.calls = []
+    entities.get_last_versions(
+        PROJECT_NAME, list(mixed_subsets), active=True)
+    assert _aggregated_subset_ids(collection) == [set(mixed_subsets)]
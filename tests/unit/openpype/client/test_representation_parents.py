@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""Test suite for parents of representations resolved by aggregation."""
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.client.mongo import entities
+from openpype.pipeline.load import utils as load_utils
+
+from tests.unit.openpype.client.lib import FakeCollection
+
+PROJECT_NAME = "demo"
+
+
+def _doc(doc_type, parent_id=None, **kwargs):
+    doc = {"_id": ObjectId(), "type": doc_type, "data": {}}
+    if parent_id is not None:
+        doc["parent"] = parent_id
+    doc.update(kwargs)
+    return doc
+
+
+@pytest.fixture
+def docs(monkeypatch):
+    project = _doc("project", name=PROJECT_NAME, data={"code": "dm"})
+    asset = _doc("asset", project["_id"], name="sh010")
+    subset = _doc("subset", asset["_id"], name="modelMain")
+    version = _doc(
+        "version", subset["_id"], name=1, data={"comment": "first"})
+    hero = _doc(
+        "hero_version", subset["_id"], version_id=version["_id"])
+    orphan_subset = _doc("subset", ObjectId(), name="lookMain")
+    orphan_version = _doc("version", ObjectId(), name=1)
+    version_without_asset = _doc("version", orphan_subset["_id"], name=2)
+    collection = FakeCollection([
+        project, asset, subset, version, hero,
+        orphan_subset, orphan_version, version_without_asset,
+        # Documents which are not part of output
+        _doc("asset", project["_id"], name="sh020"),
+        _doc("version", subset["_id"], name=2),
+    ])
+    monkeypatch.setattr(
+        entities, "get_project_connection", lambda _: collection)
+
+    def _repre(parent_id):
+        return _doc("representation", parent_id, name="abc")
+
+    return {
+        "collection": collection,
+        "project": project,
+        "asset": asset,
+        "subset": subset,
+        "version": version,
+        "hero": hero,
+        "orphan_subset": orphan_subset,
+        "repre": _repre(version["_id"]),
+        "hero_repre": _repre(hero["_id"]),
+        "no_version_repre": _repre(ObjectId()),
+        "no_subset_repre": _repre(orphan_version["_id"]),
+        "no_asset_repre": _repre(version_without_asset["_id"]),
+        "orphan_version": orphan_version,
+        "version_without_asset": version_without_asset,
+    }
+
+
+def test_get_representations_parents(docs):
+    repre_docs = [
+        docs["repre"],
+        docs["hero_repre"],
+        docs["no_version_repre"],
+        docs["no_subset_repre"],
+        docs["no_asset_repre"],
+    ]
+    output = entities.get_representations_parents(PROJECT_NAME, repre_docs)
+
+    # Same output as separate queries of versions, subsets, assets
+    #   and project
+    project = docs["project"]
+    assert output == {
+        docs["repre"]["_id"]: (
+            docs["version"], docs["subset"], docs["asset"], project
+        ),
+        docs["hero_repre"]["_id"]: (
+            docs["hero"], docs["subset"], docs["asset"], project
+        ),
+        docs["no_version_repre"]["_id"]: (None, None, None, project),
+        docs["no_subset_repre"]["_id"]: (
+            docs["orphan_version"], None, None, project
+        ),
+        docs["no_asset_repre"]["_id"]: (
+            docs["version_without_asset"], docs["orphan_subset"], None,
+            project
+        ),
+    }
+    assert [method for method, _ in docs["collection"].calls] == [
+        "aggregate"
+    ]
+    assert entities.get_representations_parents(PROJECT_NAME, []) == {}
+
+
+def test_get_contexts_for_repre_docs(docs):
+    repre_docs = [docs["repre"], docs["hero_repre"], docs["no_subset_repre"]]
+    contexts = load_utils.get_contexts_for_repre_docs(
+        PROJECT_NAME, repre_docs)
+
+    context = contexts[docs["repre"]["_id"]]
+    assert context == {
+        "project": {"name": PROJECT_NAME, "code": "dm"},
+        "asset": docs["asset"],
+        "subset": docs["subset"],
+        "version": docs["version"],
+        "representation": docs["repre"],
+    }
+
+    # Hero version has data of source version
+    hero_context = contexts[docs["hero_repre"]["_id"]]
+    assert hero_context["version"]["type"] == "hero_version"
+    assert hero_context["version"]["data"] == {"comment": "first"}
+    assert hero_context["subset"] == docs["subset"]
+
+    no_subset_context = contexts[docs["no_subset_repre"]["_id"]]
+    assert no_subset_context["version"] == docs["orphan_version"]
+    assert no_subset_context["subset"] is None
+    assert no_subset_context["asset"] is None
+
+    # Only source versions of hero versions are queried separately
+    assert [method for method, _ in docs["collection"].calls] == [
+        "aggregate", "find"
+    ]
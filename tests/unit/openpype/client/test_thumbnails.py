@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Test suite for AYON thumbnails cache index."""
+import os
+import time
+
+from openpype.client.server.thumbnails import AYONThumbnailCache
+
+
+def _create_cache(thumbnails_dir):
+    cache = AYONThumbnailCache(cleanup=False)
+    cache._thumbnails_dir = thumbnails_dir
+    return cache
+
+
+def test_index_eviction(tmp_path):
+    thumbnails_dir = str(tmp_path / "thumbnails")
+    # File created before index existed
+    legacy_dir = os.path.join(thumbnails_dir, "demo")
+    os.makedirs(legacy_dir)
+    legacy_path = os.path.join(legacy_dir, "legacy.png")
+    with open(legacy_path, "wb") as stream:
+        stream.write(b"0" * 10)
+    expired_time = time.time() - 10 * 24 * 60 * 60
+    os.utime(legacy_path, (expired_time, expired_time))
+
+    cache = _create_cache(thumbnails_dir)
+    paths = [
+        cache.store_thumbnail(
+            "demo", "thumb{}".format(idx), b"1" * 100, "image/png"
+        )
+        for idx in range(3)
+    ]
+    assert cache.get_thumbnails_dir_size() == 310
+
+    # Expired legacy file is removed by soft cleanup
+    cache.cleanup()
+    assert not os.path.exists(legacy_path)
+    assert cache.get_thumbnails_dir_size() == 300
+
+    # Access to first thumbnail makes second one least recently used
+    time.sleep(0.01)
+    assert cache.get_thumbnail_filepath("demo", "thumb0") == paths[0]
+    cache.max_filesize = 250
+    cache.cleanup(check_max_size=True)
+    assert os.path.exists(paths[0])
+    assert not os.path.exists(paths[1])
+    assert os.path.exists(paths[2])
+    assert cache.get_thumbnails_dir_size() == 200
+    cache.close()
+
+    # Index is shared with new cache object and matches the directory
+    other_cache = _create_cache(thumbnails_dir)
+    files_info = other_cache.get_thumbnails_dir_file_info()
+    assert other_cache.get_thumbnails_dir_size() == 200
+    assert other_cache.get_thumbnails_dir_size(files_info) == 200
+    other_cache.close()
@@ -0,0 +1,24 @@
+import os
+
+
+class DemoBase(object):
+    """Base class of classes in python files written by 'write_module'."""
+
+
+MODULE_CONTENT = """
+from {module} import DemoBase
+
+
+class {name}(DemoBase):
+    families = ["render"]
+"""
+
+
+def write_module(dirpath, name, padding=""):
+    """Write python file with one 'DemoBase' subclass into directory."""
+    path = os.path.join(dirpath, "{}.py".format(name.lower()))
+    with open(path, "w") as stream:
+        stream.write(MODULE_CONTENT.format(
+            module=__name__, name=name
+        ) + padding)
+    return path
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Test suite for launch hooks discovery and environments cache."""
+import os
+import logging
+
+from openpype.lib import applications
+
+
+HOOKS_CONTENT = """
+from openpype.lib.applications import PreLaunchHook, PostLaunchHook
+
+
+class PreHook(PreLaunchHook):
+    def execute(self):
+        pass
+
+
+class PostHook(PostLaunchHook):
+    def execute(self):
+        pass
+"""
+
+
+def test_launch_hook_classes(tmp_path):
+    dirpath = str(tmp_path)
+    with open(os.path.join(dirpath, "hooks.py"), "w") as stream:
+        stream.write(HOOKS_CONTENT)
+
+    applications.clear_launch_hooks_cache()
+    pre_classes, post_classes = applications._get_launch_hook_classes(
+        dirpath)
+    assert [cls.__name__ for cls in pre_classes] == ["PreHook"]
+    assert [cls.__name__ for cls in post_classes] == ["PostHook"]
+
+    # Module is imported only once
+    again_pre, _ = applications._get_launch_hook_classes(dirpath)
+    assert again_pre[0] is pre_classes[0]
+
+    applications.clear_launch_hooks_cache()
+    cleared_pre, _ = applications._get_launch_hook_classes(dirpath)
+    assert cleared_pre[0] is not pre_classes[0]
+
+
+class FakeGroup(object):
+    environment = {}
+
+
+class FakeManager(object):
+    tools = {}
+
+    def __init__(self, cached):
+        self.cached = cached
+        self.requested_keys = []
+
+    def get_cached_environments(self, key):
+        self.requested_keys.append(key)
+        return self.cached
+
+
+class FakeApp(object):
+    full_name = "maya/2024"
+    group = FakeGroup()
+    environment = {}
+    host_name = "maya"
+
+    def __init__(self, manager):
+        self.manager = manager
+
+
+def _prepare_data(app):
+    return {
+        "app": app,
+        "log": logging.getLogger(__name__),
+        "env": {"KEY": "value", "REMOVED": "value"},
+        "system_settings": {"general": {"local_env_white_list": ["KEY"]}},
+    }
+
+
+def test_cached_environments_skip_preparation(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("Environments are prepared again")
+
+    monkeypatch.setattr(
+        applications, "get_local_settings_revision", lambda: 1)
+    monkeypatch.setattr(applications, "get_local_settings", fail)
+    monkeypatch.setattr(applications, "_add_python_version_paths", fail)
+
+    manager = FakeManager(({"KEY": "cached"}, {"REMOVED"}))
+    data = _prepare_data(FakeApp(manager))
+    applications.prepare_app_environments(data)
+    assert data["env"] == {"KEY": "cached"}
+
+    # Change of local settings changes the key
+    monkeypatch.setattr(
+        applications, "get_local_settings_revision", lambda: 2)
+    applications.prepare_app_environments(_prepare_data(FakeApp(manager)))
+    first_key, second_key = manager.requested_keys
+    assert first_key != second_key
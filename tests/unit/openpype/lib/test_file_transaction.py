@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Test suite for file transaction."""
+import os
+import hashlib
+
+import pytest
+
+from openpype.lib.file_transaction import FileTransaction
+
+
+def _create_files(dirpath, count):
+    os.makedirs(dirpath)
+    paths = []
+    for idx in range(count):
+        path = os.path.join(dirpath, "file.{:04d}.txt".format(idx))
+        with open(path, "w") as stream:
+            stream.write("content {}".format(idx))
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_transfer_with_progress_and_checksums(tmp_path, max_workers):
+    src_paths = _create_files(str(tmp_path / "src"), 10)
+    dst_dir = str(tmp_path / "dst")
+    progress = []
+    transaction = FileTransaction(
+        max_workers=max_workers,
+        max_workers_per_volume=2,
+        progress_callback=lambda *args: progress.append(args),
+        checksum_algorithm="md5"
+    )
+    for src_path in src_paths:
+        transaction.add(
+            src_path, os.path.join(dst_dir, os.path.basename(src_path))
+        )
+    transaction.process()
+    transaction.finalize()
+
+    total_bytes = sum(os.path.getsize(path) for path in src_paths)
+    assert len(transaction.transferred) == 10
+    assert progress[-1] == (10, 10, total_bytes, total_bytes)
+
+    checksums = transaction.checksums
+    for src_path in src_paths:
+        dst_path = os.path.join(dst_dir, os.path.basename(src_path))
+        with open(src_path, "rb") as stream:
+            expected = hashlib.md5(stream.read()).hexdigest()
+        assert checksums[dst_path] == expected
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_rollback_restores_backups(tmp_path, max_workers):
+    src_paths = _create_files(str(tmp_path / "src"), 3)
+    dst_dir = str(tmp_path / "dst")
+    os.makedirs(dst_dir)
+    existing_path = os.path.join(dst_dir, os.path.basename(src_paths[0]))
+    with open(existing_path, "w") as stream:
+        stream.write("original")
+
+    transaction = FileTransaction(max_workers=max_workers)
+    for src_path in src_paths:
+        transaction.add(
+            src_path, os.path.join(dst_dir, os.path.basename(src_path))
+        )
+    transaction.add(
+        str(tmp_path / "src" / "missing.txt"),
+        os.path.join(dst_dir, "missing.txt")
+    )
+    with pytest.raises(OSError):
+        transaction.process()
+
+    transaction.rollback()
+    assert os.listdir(dst_dir) == [os.path.basename(existing_path)]
+    with open(existing_path, "r") as stream:
+        assert stream.read() == "original"
+
+
+def test_transfer_strategies(tmp_path):
+    src_paths = _create_files(str(tmp_path / "src"), 3)
+    dst_dir = str(tmp_path / "dst")
+    transaction = FileTransaction(copy_strategies=[])
+    copy_dst = os.path.join(dst_dir, "copy.txt")
+    link_dst = os.path.join(dst_dir, "link.txt")
+    link_or_copy_dst = os.path.join(dst_dir, "link_or_copy.txt")
+    transaction.add(src_paths[0], copy_dst)
+    transaction.add(src_paths[1], link_dst, FileTransaction.MODE_HARDLINK)
+    transaction.add(
+        src_paths[2], link_or_copy_dst, FileTransaction.MODE_HARDLINK_OR_COPY
+    )
+    transaction.process()
+
+    assert transaction.transfer_strategies == {
+        copy_dst: "copy",
+        link_dst: "hardlink",
+        link_or_copy_dst: "hardlink",
+    }
+    stats = transaction.get_transfer_stats()
+    assert stats["copy"] == {
+        "files": 1, "bytes": os.path.getsize(src_paths[0])
+    }
+    assert stats["hardlink"]["files"] == 2
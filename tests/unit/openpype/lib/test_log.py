@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Test suite for mongo log shipping."""
+import logging
+import threading
+
+from openpype.lib.log import MongoLogShipper, QueuedMongoHandler
+
+
+class FakeCollection(object):
+    def __init__(self):
+        self.batches = []
+
+    def insert_many(self, documents, ordered=True):
+        self.batches.append(list(documents))
+
+
+def test_shipper_batches_and_flush():
+    collection = FakeCollection()
+    shipper = MongoLogShipper(
+        collection, batch_size=3, flush_interval=10.0
+    )
+    for idx in range(7):
+        shipper.put({"idx": idx})
+    shipper.stop()
+
+    documents = [doc for batch in collection.batches for doc in batch]
+    assert [doc["idx"] for doc in documents] == list(range(7))
+    assert all(len(batch) <= 3 for batch in collection.batches)
+    assert shipper.get_metrics() == {
+        "shipped": 7, "dropped": 0, "failed": 0, "pending": 0
+    }
+
+
+def test_shipper_overflow_policies():
+    for policy, expected in (
+        (MongoLogShipper.DROP_OLDEST, [2, 3]),
+        (MongoLogShipper.DROP_NEWEST, [0, 1]),
+    ):
+        collection = FakeCollection()
+        shipper = MongoLogShipper(
+            collection,
+            buffer_size=2,
+            flush_interval=10.0,
+            overflow_policy=policy
+        )
+        # Do not start background thread
+        shipper._thread = threading.current_thread()
+        for idx in range(4):
+            shipper.put({"idx": idx})
+        shipper.flush()
+
+        assert [doc["idx"] for doc in collection.batches[0]] == expected
+        assert shipper.get_metrics()["dropped"] == 2
+
+
+def test_handler_formats_in_emitting_thread():
+    collection = FakeCollection()
+    shipper = MongoLogShipper(collection, flush_interval=10.0)
+    shipper._thread = threading.current_thread()
+
+    handler = QueuedMongoHandler.__new__(QueuedMongoHandler)
+    logging.Handler.__init__(handler)
+    handler.fail_silently = False
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    handler.shipper = shipper
+
+    record = logging.LogRecord(
+        "test", logging.INFO, __file__, 1, "message %s", ("value",), None
+    )
+    handler.emit(record)
+    assert shipper.get_metrics()["pending"] == 1
+    shipper.flush()
+    assert collection.batches == [["message value"]]
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Test suite for path templates."""
+import pytest
+
+from openpype.lib.path_templates import StringTemplate
+
+DATA = {
+    "root": {"work": "/mnt/work"},
+    "project": {"name": "demo", "code": "dm"},
+    "asset": "sh010",
+    "subset": "renderMain",
+    "version": 3,
+    "ext": "exr",
+    "frame": 1,
+    "hierarchy": {"nested": "value"},
+}
+
+TEMPLATES = [
+    "{root[work]}/{project[name]}/{asset}/v{version:0>3}/"
+    "{project[code]}_{subset}.{frame:0>4}.{ext}",
+    "{asset}_{frame}_{frame:0>4}_{frame}.{ext}",
+    "{asset}<_{frame:0>4}>.{ext}",
+    "{asset}[{frame}].{ext}",
+    "{asset}.{missing}.{frame}.{ext}",
+    "{asset}.{hierarchy}.{frame}.{ext}",
+    "{asset}<.{missing}>.{frame}<.{ext}>",
+    "{asset}.{ext}",
+]
+
+
+def _result_info(result):
+    return (
+        str(result),
+        result.template,
+        result.solved,
+        result.used_values,
+        set(result.missing_keys),
+        result.invalid_types,
+    )
+
+
+@pytest.mark.parametrize("template", TEMPLATES)
+def test_format_many_matches_format(template):
+    template_obj = StringTemplate(template)
+    values = [1001, 1002, 1010, 999, "abc", {"invalid": "type"}]
+    results = template_obj.format_many(DATA, "frame", values)
+
+    assert len(results) == len(values)
+    for value, result in zip(values, results):
+        data = dict(DATA)
+        data["frame"] = value
+        expected = template_obj.format(data)
+        assert _result_info(result) == _result_info(expected)
+
+
+def test_format_many_results_are_independent():
+    template_obj = StringTemplate("{root[work]}/{asset}.{frame}.{ext}")
+    results = template_obj.format_many(DATA, "frame", [1, 2])
+    results[0].used_values["root"]["work"] = "changed"
+    assert results[1].used_values["root"]["work"] == "/mnt/work"
+    assert DATA["frame"] == 1
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Test suite for copy strategies of 'copy_file'."""
+import os
+import errno
+
+from openpype.lib import path_tools
+
+
+def _raising_strategy(error_number, calls):
+    def strategy(src_path, dst_path):
+        calls.append(dst_path)
+        raise OSError(error_number, os.strerror(error_number))
+    return strategy
+
+
+def test_unsupported_strategies_cached_by_device(tmp_path, monkeypatch):
+    unsupported_calls = []
+    invalid_calls = []
+    monkeypatch.setattr(path_tools, "_copy_strategies", [
+        (
+            "unsupported",
+            _raising_strategy(errno.EOPNOTSUPP, unsupported_calls)
+        ),
+        ("invalid", _raising_strategy(errno.EINVAL, invalid_calls)),
+    ])
+    monkeypatch.setattr(path_tools, "_unsupported_strategies", set())
+
+    src_path = tmp_path / "src.txt"
+    src_path.write_text("content")
+    dst_paths = []
+    for idx in range(3):
+        dst_dir = tmp_path / "dst{}".format(idx)
+        dst_dir.mkdir()
+        dst_path = str(dst_dir / "dst.txt")
+        dst_paths.append(dst_path)
+        used = path_tools.copy_file(str(src_path), dst_path)
+        assert used == path_tools.COPY_STRATEGY_COPY
+        with open(dst_path, "r") as stream:
+            assert stream.read() == "content"
+
+    # Unsupported strategy is not tried again for other directories on
+    #   the same device
+    assert unsupported_calls == dst_paths[:1]
+    # Errors caused by files are not cached
+    assert invalid_calls == dst_paths
+    assert len(path_tools._unsupported_strategies) == 1
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Test suite for profiles filtering."""
+import random
+
+from openpype.lib.profiles_filtering import (
+    CompiledProfiles,
+    filter_profiles,
+    get_compiled_profiles,
+)
+
+HOSTS = ["maya", "nuke", "houdini", "", None]
+FAMILIES = ["render", "review", "model", "plate", "renderLayer"]
+TASKS = ["comp", "lighting", "modeling", "", None]
+PATTERNS = [
+    [], ["*"], [""], ["render"], ["render.*"], ["ren.*", "model"],
+    ["review", "plate"], "model", ["comp"], ["light.+"], [None],
+]
+
+
+def _random_profiles(rand, count):
+    profiles = []
+    for idx in range(count):
+        profile = {"name": "profile_{}".format(idx)}
+        for key in ("hosts", "families", "tasks"):
+            value = rand.choice(PATTERNS + [HOSTS[:2], FAMILIES[:2]])
+            if value is not None or rand.random() > 0.5:
+                profile[key] = value
+        profiles.append(profile)
+    return profiles
+
+
+def test_compiled_profiles_match_filter_profiles():
+    rand = random.Random(0)
+    for _ in range(50):
+        profiles = _random_profiles(rand, rand.randint(0, 15))
+        compiled = CompiledProfiles(profiles)
+        for _ in range(30):
+            key_values = {
+                "hosts": rand.choice(HOSTS),
+                "families": rand.choice(FAMILIES),
+                "tasks": rand.choice(TASKS),
+            }
+            keys_order = rand.choice([None, ["tasks"], ["families", "hosts"]])
+            expected = filter_profiles(profiles, key_values, keys_order)
+            # Run twice to check memoized result
+            for _ in range(2):
+                result = compiled.filter_profiles(key_values, keys_order)
+                assert result is expected
+
+
+def test_get_compiled_profiles_by_identity():
+    profiles = [{"hosts": ["maya"]}]
+    compiled = get_compiled_profiles(profiles)
+    assert get_compiled_profiles(profiles) is compiled
+    assert get_compiled_profiles(list(profiles)) is not compiled
+    assert compiled.filter_profiles({"hosts": "maya"}) is profiles[0]
+    assert compiled.filter_profiles({"hosts": "nuke"}) is None
+
+
+def test_get_compiled_profiles_by_content():
+    profiles = [{"hosts": ["maya"], "tasks": ["comp.*"]}]
+    compiled = get_compiled_profiles(profiles)
+    compiled.filter_profiles({"hosts": "maya", "tasks": "comp"})
+
+    profiles_copy = [dict(profiles[0])]
+    compiled_copy = get_compiled_profiles(profiles_copy)
+    assert compiled_copy is not compiled
+    assert compiled_copy._keys is compiled._keys
+    # Profiles from passed list are returned
+    result = compiled_copy.filter_profiles({"hosts": "maya", "tasks": "comp"})
+    assert result is profiles_copy[0]
+    assert get_compiled_profiles(profiles_copy) is compiled_copy
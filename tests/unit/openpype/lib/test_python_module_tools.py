@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cache of python modules imported from directories."""
+import os
+
+from openpype.lib.python_module_tools import PathModulesCache
+
+from tests.unit.openpype.lib.lib import DemoBase, write_module
+
+
+def _get_classes(cache, dirpath, subclass_defined=False):
+    file_items, _ = cache.get_file_items(dirpath)
+    return [
+        cls
+        for file_item in file_items
+        for cls in file_item.get_classes(DemoBase, subclass_defined)
+    ]
+
+
+def test_unchanged_files_are_not_imported_again(tmp_path):
+    dirpath = str(tmp_path)
+    write_module(dirpath, "ModuleA")
+    path_b = write_module(dirpath, "ModuleB")
+
+    cache = PathModulesCache()
+    class_a, class_b = _get_classes(cache, dirpath)
+    assert class_a.__name__ == "ModuleA"
+    assert class_a.__module__ == "modulea"
+
+    again_a, again_b = _get_classes(cache, dirpath)
+    assert again_a is class_a
+    assert again_b is class_b
+
+    # Changed file is imported again
+    write_module(dirpath, "ModuleB", padding="\n# changed\n")
+    os.utime(path_b, ns=(0, 0))
+    changed_a, changed_b = _get_classes(cache, dirpath)
+    assert changed_a is class_a
+    assert changed_b is not class_b
+
+    # New and removed files
+    write_module(dirpath, "ModuleC")
+    os.remove(path_b)
+    assert [
+        cls.__name__ for cls in _get_classes(cache, dirpath)
+    ] == ["ModuleA", "ModuleC"]
+
+    # Cleared directory is imported again
+    cache.clear(dirpath)
+    assert _get_classes(cache, dirpath)[0] is not class_a
+
+
+def test_subclass_defined_classes(tmp_path):
+    dirpath = str(tmp_path)
+    write_module(dirpath, "ModuleA")
+
+    cache = PathModulesCache()
+    class_a = _get_classes(cache, dirpath, True)[0]
+    class_a.families.append("review")
+    class_a.enabled = False
+
+    again_a = _get_classes(cache, dirpath, True)[0]
+    assert again_a is not class_a
+    assert again_a.__bases__ == class_a.__bases__
+    assert again_a.__name__ == "ModuleA"
+    assert again_a.families == ["render"]
+    assert not hasattr(again_a, "enabled")
+
+
+def test_not_copyable_attributes(tmp_path):
+    dirpath = str(tmp_path)
+    write_module(
+        dirpath,
+        "ModuleA",
+        padding="\nimport threading\nModuleA.locks = [threading.Lock()]\n"
+    )
+    write_module(dirpath, "ModuleB")
+
+    cache = PathModulesCache()
+    class_a, class_b = _get_classes(cache, dirpath)
+    # Class is used as is if attributes can't be copied
+    again_a, again_b = _get_classes(cache, dirpath, True)
+    assert again_a is class_a
+    assert again_b is not class_b
+    assert again_b.__bases__ == (class_b, )
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Test suite for transcoding functions."""
+import os
+
+from openpype.lib.transcoding import (
+    ProbeCache,
+    get_contiguous_frame_ranges,
+    get_oiio_frame_chunks,
+)
+
+
+def test_contiguous_frame_ranges():
+    indexes = [1, 2, 3, 5, 7, 8, 9, 10]
+    assert get_contiguous_frame_ranges(indexes) == [
+        (1, 3), (5, 5), (7, 10)
+    ]
+    assert get_contiguous_frame_ranges(indexes, 2) == [
+        (1, 2), (3, 3), (5, 5), (7, 8), (9, 10)
+    ]
+    assert get_contiguous_frame_ranges([]) == []
+
+
+def test_oiio_frame_chunks_keep_gaps():
+    input_dir = os.path.join("input", "dir")
+    output_dir = os.path.join("output", "dir")
+    frames = list(range(1001, 1011)) + [1015] + list(range(1020, 1024))
+    input_paths = [
+        os.path.join(input_dir, "shot.{:04d}.exr".format(frame))
+        for frame in frames
+    ]
+    chunks = get_oiio_frame_chunks(input_paths, output_dir, 2)
+
+    sequence_input = os.path.join(input_dir, "shot.%04d.exr")
+    sequence_output = os.path.join(output_dir, "shot.%04d.exr")
+    assert chunks == [
+        (sequence_input, sequence_output, "1001-1008"),
+        (sequence_input, sequence_output, "1009-1010"),
+        (sequence_input, sequence_output, "1020-1023"),
+        (
+            os.path.join(input_dir, "shot.1015.exr"),
+            os.path.join(output_dir, "shot.1015.exr"),
+            None
+        ),
+    ]
+
+
+def test_oiio_frame_chunks_single_file():
+    input_path = os.path.join("input", "single.exr")
+    chunks = get_oiio_frame_chunks([input_path], "output")
+    assert chunks == [
+        (input_path, os.path.join("output", "single.exr"), None)
+    ]
+
+
+def test_oiio_frame_chunks_wildcard_chars():
+    """Sequences with oiiotool wildcard characters are not batched."""
+    input_paths = [
+        os.path.join("input", "shot#.{}.exr".format(frame))
+        for frame in (1001, 1002)
+    ]
+    chunks = get_oiio_frame_chunks(input_paths, "output")
+    assert [chunk[2] for chunk in chunks] == [None, None]
+
+
+def test_probe_cache_invalidation(tmp_path):
+    filepath = str(tmp_path / "input.exr")
+    with open(filepath, "w") as stream:
+        stream.write("data")
+
+    cache = ProbeCache(max_items=1)
+    key = cache.get_key("oiio", filepath)
+    assert cache.get(key) is None
+    cache.set(key, "output")
+    assert cache.get(key) == "output"
+
+    # Changed file has different key
+    os.utime(filepath, ns=(0, 0))
+    assert cache.get(cache.get_key("oiio", filepath)) is None
+
+    # Oldest item is removed
+    cache.set(cache.get_key("oiio", filepath), "new output")
+    assert cache.get(key) is None
+
+    # Not existing files are not cached
+    assert cache.get_key("oiio", str(tmp_path / "missing.exr")) is None
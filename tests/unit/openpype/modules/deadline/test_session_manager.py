@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""Test suite for shared sessions to Deadline webservice."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from openpype.modules.deadline.abstract_submit_deadline import (
+    DeadlineSessionManager
+)
+
+
+class FakeWebserviceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and content at once
+    wbufsize = -1
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self, status, data):
+        content = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        server = self.server
+        server.client_ports.append(self.client_address[1])
+        if server.unavailable_count > 0:
+            server.unavailable_count -= 1
+            self._respond(503, {})
+            return
+        self._respond(200, ["pool_a", "pool_b"])
+
+    def do_POST(self):
+        server = self.server
+        server.client_ports.append(self.client_address[1])
+        length = int(self.headers["Content-Length"])
+        payload = json.loads(self.rfile.read(length))
+        if server.unavailable_count > 0:
+            server.unavailable_count -= 1
+            self._respond(503, {})
+            return
+        if server.drop_count > 0:
+            server.drop_count -= 1
+            self.close_connection = True
+            return
+        self._respond(200, {"_id": payload["JobInfo"]["Name"]})
+
+
+class FakeSessionManager(DeadlineSessionManager):
+    backoff_factor = 0
+
+
+def _start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeWebserviceHandler)
+    server.client_ports = []
+    server.unavailable_count = 0
+    server.drop_count = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def test_connection_reused_and_retried():
+    server = _start_server()
+    url = "http://127.0.0.1:{}".format(server.server_address[1])
+    manager = FakeSessionManager()
+    try:
+        for idx in range(5):
+            response = manager.request(
+                "POST",
+                "{}/api/jobs".format(url),
+                json={"JobInfo": {"Name": str(idx)}}
+            )
+            assert response.json() == {"_id": str(idx)}
+
+        server.unavailable_count = 2
+        response = manager.request(
+            "GET", "{}/api/pools?NamesOnly=true".format(url)
+        )
+        assert response.ok
+        assert response.json() == ["pool_a", "pool_b"]
+
+        # Requests of each session used single keep-alive connection
+        assert len(server.client_ports) == 8
+        assert len(set(server.client_ports[:5])) == 1
+        assert len(set(server.client_ports[5:])) == 1
+        assert manager.get_session(url) is manager.get_session(
+            "{}/api/jobs".format(url)
+        )
+        assert manager.get_session(url) is not manager.get_session(
+            url, "POST"
+        )
+    finally:
+        manager.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_post_not_retried_after_sent():
+    server = _start_server()
+    url = "http://127.0.0.1:{}/api/jobs".format(server.server_address[1])
+    manager = FakeSessionManager()
+    payload = {"JobInfo": {"Name": "job"}}
+    try:
+        server.unavailable_count = 1
+        response = manager.request("POST", url, json=payload)
+        assert response.status_code == 503
+        assert len(server.client_ports) == 1
+
+        server.drop_count = 1
+        with pytest.raises(requests.exceptions.ConnectionError):
+            manager.request("POST", url, json=payload)
+        assert len(server.client_ports) == 2
+
+        retry = manager.get_session(url, "POST").get_adapter(url).max_retries
+        assert retry.connect == manager.get_retries()
+        assert retry.read == 0
+        assert retry.status == 0
+    finally:
+        manager.close()
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,65 @@
+"""Test file for buffered writer of Sync Server file statuses."""
+from bson.objectid import ObjectId
+
+from openpype.modules.sync_server.status_writer import SyncStatusWriter
+
+
+class FakeCollection(object):
+    def __init__(self):
+        self.writes = []
+
+    def bulk_write(self, operations, ordered=True):
+        self.writes.append(operations)
+
+
+def test_updates_merged_per_representation():
+    collection = FakeCollection()
+    writer = SyncStatusWriter(lambda _: collection, max_items=10)
+    repre_id = ObjectId()
+    file_ids = [ObjectId(), ObjectId()]
+    released = []
+
+    writer.add("demo", repre_id, file_ids[0], "gdrive",
+               {"$set": {"files.$[f].sites.$[s].progress": 0.5}})
+    writer.add("demo", repre_id, file_ids[0], "gdrive",
+               {"$set": {"files.$[f].sites.$[s].id": "a"},
+                "$unset": {"files.$[f].sites.$[s].progress": ""}},
+               callback=lambda: released.append(0))
+    writer.add("demo", repre_id, file_ids[1], "gdrive",
+               {"$set": {"files.$[f].sites.$[s].error": "failed"}},
+               callback=lambda: released.append(1))
+    assert writer.pending_count == 2
+    assert collection.writes == []
+
+    writer.flush()
+    assert released == [0, 1]
+    assert writer.pending_count == 0
+    assert len(collection.writes) == 1
+
+    operations = collection.writes[0]
+    assert len(operations) == 1
+    document = operations[0]._doc
+    assert document == {
+        "$set": {
+            "files.$[f0].sites.$[s0].id": "a",
+            "files.$[f1].sites.$[s1].error": "failed",
+        },
+        "$unset": {"files.$[f0].sites.$[s0].progress": ""},
+    }
+    assert operations[0]._array_filters == [
+        {"f0._id": file_ids[0]}, {"s0.name": "gdrive"},
+        {"f1._id": file_ids[1]}, {"s1.name": "gdrive"},
+    ]
+
+
+def test_flush_on_size_threshold():
+    collection = FakeCollection()
+    writer = SyncStatusWriter(lambda _: collection, max_items=2)
+    for _ in range(3):
+        writer.add("demo", ObjectId(), ObjectId(), "studio",
+                   {"$set": {"files.$[f].sites.$[s].progress": 0.1}})
+
+    assert len(collection.writes) == 1
+    assert writer.pending_count == 1
+    writer.flush(force=False)
+    assert len(collection.writes) == 1
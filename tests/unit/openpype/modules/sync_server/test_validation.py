@@ -0,0 +1,102 @@
+"""Test file for Sync Server project validation."""
+import os
+
+import pytest
+from bson.objectid import ObjectId
+
+from openpype.modules.sync_server.validation import ProjectSiteValidator
+
+
+class InterruptError(Exception):
+    pass
+
+
+class FakeCursor(object):
+    def __init__(self, docs):
+        self._docs = docs
+
+    def sort(self, key, direction):
+        self._docs = sorted(self._docs, key=lambda doc: doc[key])
+        return self
+
+    def batch_size(self, size):
+        return self
+
+    def __iter__(self):
+        return iter(self._docs)
+
+
+class FakeCollection(object):
+    def __init__(self, docs, fail_on_write=None):
+        self.docs = docs
+        self.writes = []
+        self.fail_on_write = fail_on_write
+
+    def find(self, query, projection=None):
+        docs = self.docs
+        if "_id" in query:
+            last_id = query["_id"]["$gt"]
+            docs = [doc for doc in docs if doc["_id"] > last_id]
+        return FakeCursor(docs)
+
+    def bulk_write(self, operations, ordered=True):
+        if self.fail_on_write == len(self.writes):
+            raise InterruptError()
+        self.writes.append(operations)
+
+
+def _create_docs(dirpath, count):
+    docs = []
+    for idx in range(count):
+        filename = "file_{}.txt".format(idx)
+        # Even files exist, odd files are marked on site
+        sites = [{"name": "studio", "created_dt": "x"}]
+        if idx % 2:
+            sites.append({"name": "local", "created_dt": "x"})
+        else:
+            with open(os.path.join(dirpath, filename), "w") as stream:
+                stream.write("data")
+
+        docs.append({
+            "_id": ObjectId(),
+            "files": [{
+                "_id": ObjectId(),
+                "path": "{root}/" + filename,
+                "sites": sites,
+            }]
+        })
+    return docs
+
+
+@pytest.mark.parametrize("reset_missing", [False, True])
+def test_validation_resumes(tmp_path, monkeypatch, reset_missing):
+    files_dir = tmp_path / "files"
+    files_dir.mkdir()
+    docs = _create_docs(str(files_dir), 5)
+    collection = FakeCollection(docs, fail_on_write=1)
+    monkeypatch.setattr(ProjectSiteValidator, "page_size", 2)
+
+    def create_validator():
+        return ProjectSiteValidator(
+            collection,
+            "demo",
+            "local",
+            lambda path: path.format(root=str(files_dir)),
+            reset_missing=reset_missing,
+            checkpoint_dir=str(tmp_path / "checkpoints")
+        )
+
+    validator = create_validator()
+    with pytest.raises(InterruptError):
+        validator.validate()
+    assert validator.load_checkpoint()["last_id"] == str(docs[1]["_id"])
+
+    collection.fail_on_write = None
+    result = create_validator().validate()
+    assert result == (3, 2 if reset_missing else 0)
+    assert not os.path.exists(validator.checkpoint_path)
+
+    operations = [op for ops in collection.writes for op in ops]
+    pushed = [op for op in operations if "$push" in op._doc]
+    assert len(pushed) == 3
+    assert len(operations) == sum(result)
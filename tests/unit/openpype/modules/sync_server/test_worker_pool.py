@@ -0,0 +1,115 @@
+"""Test file for workers pool of Sync Server remote site."""
+import asyncio
+import logging
+import threading
+
+from openpype.modules.sync_server import sync_server
+from openpype.modules.sync_server.sync_server import SiteWorkerPool, SyncItem
+from openpype.modules.sync_server.utils import SyncStatus
+
+
+class FakeModule(object):
+    def __init__(self, failing_paths=None):
+        self.failing_paths = set(failing_paths or [])
+        self.updates = []
+        self.update_threads = set()
+
+    def update_db(self, project_name, file_id, file, representation, site,
+                  error, callback=None):
+        self.update_threads.add(threading.get_ident())
+        if file["path"] in self.failing_paths:
+            raise RuntimeError("Failed to write status")
+        self.updates.append((file["path"], file_id, error))
+        if callback is not None:
+            callback()
+
+
+class FakeThread(object):
+    def __init__(self, module):
+        self.module = module
+        self.log = logging.getLogger(__name__)
+        self.in_progress_keys = set()
+        self.failed_keys = set()
+
+
+async def fake_upload(module, project_name, file, *args, **kwargs):
+    await asyncio.sleep(0)
+    return "id_{}".format(file["path"])
+
+
+def _create_item(thread, path):
+    key = ("demo", path)
+    thread.in_progress_keys.add(key)
+    return SyncItem(
+        "demo", SyncStatus.DO_UPLOAD, {"path": path}, {}, "local_drive",
+        "remote", "remote", None, {}, key
+    )
+
+
+def test_worker_survives_exception(monkeypatch):
+    monkeypatch.setattr(sync_server, "upload", fake_upload)
+    module = FakeModule(failing_paths={"a"})
+    thread = FakeThread(module)
+
+    async def run():
+        pool = SiteWorkerPool(thread, "remote", 1)
+        for path in ("a", "b"):
+            await pool.put(_create_item(thread, path))
+        await asyncio.wait_for(pool.queue.join(), 5)
+        assert not any(task.done() for task in pool._worker_tasks)
+        await pool.close()
+
+    asyncio.run(run())
+    assert module.updates == [("b", "id_b", None)]
+    assert thread.failed_keys == {("demo", "a")}
+    assert thread.in_progress_keys == set()
+
+
+def test_close_processes_queued_files(monkeypatch):
+    monkeypatch.setattr(sync_server, "upload", fake_upload)
+    module = FakeModule()
+    thread = FakeThread(module)
+    paths = ["file_{}".format(idx) for idx in range(7)]
+
+    async def run():
+        pool = SiteWorkerPool(thread, "remote", 2)
+        for path in paths:
+            await pool.put(_create_item(thread, path))
+        await pool.close()
+        return pool
+
+    pool = asyncio.run(run())
+    assert sorted(update[0] for update in module.updates) == sorted(paths)
+    assert all(task.done() for task in pool._worker_tasks)
+    assert thread.in_progress_keys == set()
+
+
+def test_shutdown_cancels_workers(monkeypatch):
+    monkeypatch.setattr(sync_server, "upload", fake_upload)
+    thread = FakeThread(FakeModule())
+
+    async def run():
+        pool = SiteWorkerPool(thread, "remote", 2)
+        pool.shutdown()
+        await asyncio.gather(*pool._worker_tasks, return_exceptions=True)
+        return pool
+
+    pool = asyncio.run(run())
+    assert all(task.cancelled() for task in pool._worker_tasks)
+
+
+def test_status_updated_outside_of_loop(monkeypatch):
+    monkeypatch.setattr(sync_server, "upload", fake_upload)
+    module = FakeModule()
+    thread = FakeThread(module)
+
+    async def run():
+        pool = SiteWorkerPool(thread, "remote", 2)
+        for path in ("a", "b", "c"):
+            await pool.put(_create_item(thread, path))
+        await pool.close()
+
+    asyncio.run(run())
+    assert len(module.updates) == 3
+    # Writes of status don't block event loop
+    assert threading.get_ident() not in module.update_threads
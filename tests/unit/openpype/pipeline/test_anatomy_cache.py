@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Test suite for anatomy data shared between Anatomy objects."""
+import gc
+import collections
+
+import pytest
+
+from openpype.lib.events import emit_event
+from openpype.pipeline.anatomy import (
+    ANATOMY_CHANGED_TOPIC,
+    Anatomy,
+    AnatomyCache,
+)
+
+
+def _project_doc(project_name, code):
+    return {
+        "name": project_name,
+        "data": {"code": code},
+        "config": {
+            "roots": {
+                "work": {
+                    "windows": "C:/projects",
+                    "linux": "/mnt/projects",
+                    "darwin": "/Volumes/projects",
+                }
+            },
+            "templates": {
+                "work": {
+                    "folder": "{root[work]}/{project[name]}",
+                    "file": "{project[code]}_v{version:0>3}",
+                    "path": "{@folder}/{@file}",
+                },
+                "others": {},
+            },
+        },
+    }
+
+
+@pytest.fixture
+def project_docs(monkeypatch):
+    docs = {"test": _project_doc("test", "tst")}
+
+    monkeypatch.setattr(
+        Anatomy,
+        "_get_cached_project_doc",
+        classmethod(lambda cls, project_name: docs[project_name])
+    )
+    monkeypatch.setattr(
+        Anatomy,
+        "_get_site_root_overrides",
+        classmethod(lambda cls, project_name, site_name: None)
+    )
+    monkeypatch.setattr(AnatomyCache, "_entries", {})
+    monkeypatch.setattr(AnatomyCache, "_unused", collections.OrderedDict())
+    yield docs
+    gc.collect()
+
+
+def _get_entry(anatomy):
+    for entry in AnatomyCache._entries.values():
+        if entry.base_anatomy.templates_obj is anatomy.templates_obj:
+            return entry
+    return None
+
+
+def test_entry_released_with_anatomy(project_docs):
+    anatomy = Anatomy("test")
+    other_anatomy = Anatomy("test")
+    assert anatomy.templates_obj is other_anatomy.templates_obj
+
+    entry = _get_entry(anatomy)
+    assert entry.refcount == 2
+
+    del anatomy
+    gc.collect()
+    assert entry.refcount == 1
+    assert entry.key not in AnatomyCache._unused
+
+    del other_anatomy
+    gc.collect()
+    assert entry.refcount == 0
+    assert entry.key in AnatomyCache._unused
+    assert AnatomyCache._entries[entry.key] is entry
+
+    # Unused entry is used again for same anatomy data
+    anatomy = Anatomy("test")
+    assert _get_entry(anatomy) is entry
+    assert entry.key not in AnatomyCache._unused
+
+
+def test_unused_entries_evicted(project_docs, monkeypatch):
+    monkeypatch.setattr(AnatomyCache, "max_unused", 1)
+
+    anatomy = Anatomy("test")
+    first_key = _get_entry(anatomy).key
+    del anatomy
+    gc.collect()
+
+    project_docs["test"] = _project_doc("test", "changed")
+    anatomy = Anatomy("test")
+    second_key = _get_entry(anatomy).key
+    assert second_key != first_key
+    assert first_key in AnatomyCache._entries
+
+    del anatomy
+    gc.collect()
+    assert list(AnatomyCache._unused.keys()) == [second_key]
+    assert first_key not in AnatomyCache._entries
+
+
+def test_entries_invalidated_on_anatomy_change(project_docs):
+    anatomy = Anatomy("test")
+    key = _get_entry(anatomy).key
+
+    emit_event(ANATOMY_CHANGED_TOPIC, {"project_name": "test"})
+    assert key not in AnatomyCache._entries
+
+    # Existing objects keep their data, new objects get new entry
+    new_anatomy = Anatomy("test")
+    assert new_anatomy.templates_obj is not anatomy.templates_obj
+    assert anatomy.templates["work"]["file"] == (
+        new_anatomy.templates["work"]["file"]
+    )
+
+
+def test_templates_are_not_shared(project_docs):
+    anatomy = Anatomy("test")
+    other_anatomy = Anatomy("test")
+
+    templates = anatomy.templates
+    templates["work"]["file"] = "changed"
+    assert other_anatomy.templates["work"]["file"] != "changed"
+    assert anatomy.templates["work"]["file"] != "changed"
@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""Test suite for shared asset hierarchy index."""
+import copy
+
+from bson.objectid import ObjectId
+
+from openpype.pipeline.create import asset_hierarchy
+from openpype.pipeline.create import context as create_context
+
+
+def _asset_doc(name, parent_id=None, tasks=None):
+    return {
+        "_id": ObjectId(),
+        "name": name,
+        "data": {
+            "visualParent": parent_id,
+            "parents": [],
+            "tasks": tasks or {},
+        }
+    }
+
+
+class FakeDatabase(object):
+    def __init__(self, asset_docs):
+        self.asset_docs = asset_docs
+        self.changed_ids = set()
+        self.full_queries = 0
+        self.queried_names = []
+
+    def get_assets(self, project_name, asset_names=None, fields=None):
+        if asset_names is not None:
+            self.queried_names.append(set(asset_names))
+            return [
+                copy.deepcopy(asset_doc)
+                for asset_doc in self.asset_docs
+                if asset_doc["name"] in asset_names
+            ]
+        if fields != ["_id"]:
+            self.full_queries += 1
+        return [copy.deepcopy(asset_doc) for asset_doc in self.asset_docs]
+
+    def get_assets_changed_since(self, project_name, since, fields=None):
+        return [
+            copy.deepcopy(asset_doc)
+            for asset_doc in self.asset_docs
+            if asset_doc["_id"] in self.changed_ids
+        ]
+
+
+def test_incremental_refresh(monkeypatch):
+    shot = _asset_doc("sh010", tasks={"anim": {"type": "Animation"}})
+    seq = _asset_doc("sq01")
+    shot["data"]["visualParent"] = seq["_id"]
+    database = FakeDatabase([seq, shot])
+    monkeypatch.setattr(asset_hierarchy, "AYON_SERVER_ENABLED", False)
+    monkeypatch.setattr(asset_hierarchy, "get_assets", database.get_assets)
+    monkeypatch.setattr(
+        asset_hierarchy,
+        "get_assets_changed_since",
+        database.get_assets_changed_since
+    )
+
+    cache = asset_hierarchy._AssetHierarchyIndexCache()
+    index = cache.get("demo")
+    assert cache.get("demo") is index
+    assert index.get_task_type("sh010", "anim") == "Animation"
+    hierarchy = index.get_hierarchy()
+    assert hierarchy[str(seq["_id"])][0]["_id"] == str(shot["_id"])
+    assert [doc["name"] for doc in hierarchy[None]] == ["sq01"]
+
+    # Add new asset, change task of shot and remove sequence
+    new_shot = _asset_doc("sh020")
+    shot["data"]["tasks"]["comp"] = {"type": "Compositing"}
+    database.asset_docs = [shot, new_shot]
+    database.changed_ids = {shot["_id"], new_shot["_id"]}
+
+    refreshed = cache.get("demo", refresh=True)
+    assert database.full_queries == 1
+    assert refreshed is not index
+    assert index.get_asset_by_name("sq01") is not None
+    assert refreshed.get_asset_by_name("sq01") is None
+    assert refreshed.get_asset_by_id(new_shot["_id"])["name"] == "sh020"
+    assert refreshed.get_task_names_by_asset_name()["sh010"] == [
+        "anim", "comp"
+    ]
+
+    # Unchanged documents are shared between indexes
+    database.changed_ids = set()
+    again = cache.get("demo", refresh=True)
+    assert (
+        again.get_asset_by_name("sh020")
+        is refreshed.get_asset_by_name("sh020")
+    )
+
+
+class FakeInstance(dict):
+    has_valid_asset = True
+    has_valid_task = True
+
+    def set_asset_invalid(self, invalid):
+        self.has_valid_asset = not invalid
+
+    def set_task_invalid(self, invalid):
+        self.has_valid_task = not invalid
+
+
+class FakeCreator(object):
+    label = identifier = "fake"
+
+    def __init__(self, create_context, instance):
+        self.create_context = create_context
+        self.instance = instance
+
+    def collect_instances(self):
+        self.create_context._instances_by_id["id"] = self.instance
+
+
+def test_validation_refreshes_instance_assets(monkeypatch):
+    shot = _asset_doc("sh010", tasks={"anim": {"type": "Animation"}})
+    other_shot = _asset_doc("sh020")
+    database = FakeDatabase([shot, other_shot])
+    cache = asset_hierarchy._AssetHierarchyIndexCache()
+    monkeypatch.setattr(asset_hierarchy, "AYON_SERVER_ENABLED", False)
+    monkeypatch.setattr(asset_hierarchy, "get_assets", database.get_assets)
+    monkeypatch.setattr(create_context, "AYON_SERVER_ENABLED", False)
+    monkeypatch.setattr(create_context, "get_asset_hierarchy_index", cache.get)
+    monkeypatch.setattr(
+        create_context.CreateContext,
+        "project_name",
+        property(lambda self: "demo")
+    )
+
+    context = create_context.CreateContext.__new__(
+        create_context.CreateContext)
+    context._log = None
+    context._bulk_counter = 0
+    context._bulk_instances_to_process = []
+    instance = FakeInstance(asset="sh010", task="anim")
+    creator = FakeCreator(context, instance)
+    monkeypatch.setattr(
+        context, "get_sorted_creators", lambda *args, **kwargs: [creator]
+    )
+
+    context.reset_instances()
+    context.validate_instances_context()
+    assert instance.has_valid_task
+    assert database.full_queries == 1
+
+    # Task was removed but asset exists in cached index
+    shot["data"]["tasks"] = {}
+    context.reset_instances()
+    context.validate_instances_context()
+    assert instance.has_valid_asset
+    assert not instance.has_valid_task
+
+    # Only asset of instance was queried again
+    assert database.full_queries == 1
+    assert database.queried_names == [{"sh010"}]
+    index = cache.get("demo")
+    assert index.get_asset_by_name("sh020") is not None
+    assert index.get_task_names_by_asset_name()["sh010"] == []
+
+    # Removed asset is removed from index
+    database.asset_docs.remove(shot)
+    instance.set_task_invalid(False)
+    context.validate_instances_context()
+    assert not instance.has_valid_asset
+    assert cache.get("demo").get_asset_by_name("sh010") is None
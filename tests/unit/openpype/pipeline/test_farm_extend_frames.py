@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Test suite for back-fill of frames from previous version."""
+import os
+import logging
+
+from openpype.pipeline.farm import pyblish_functions
+
+
+class FakeAnatomy(object):
+    def __init__(self, root):
+        self.root = root
+
+    def fill_root(self, path):
+        return path.format(root=self.root)
+
+
+class FakeContext(object):
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeInstance(object):
+    def __init__(self, data, context):
+        self.data = data
+        self.context = context
+
+
+def test_copy_extend_frames(tmp_path, monkeypatch):
+    published_dir = tmp_path / "publish"
+    published_dir.mkdir()
+    published_paths = []
+    for frame in range(1, 11):
+        path = str(published_dir / "sh010_beauty_v001.{:04d}.exr".format(
+            frame))
+        with open(path, "w") as stream:
+            stream.write(str(frame))
+        published_paths.append(path)
+
+    monkeypatch.setattr(
+        pyblish_functions,
+        "get_last_version_by_subset_name",
+        lambda *args, **kwargs: {"_id": "version_id"}
+    )
+    monkeypatch.setattr(
+        pyblish_functions,
+        "get_resources",
+        lambda *args, **kwargs: list(published_paths)
+    )
+
+    context = FakeContext({
+        "project": "demo",
+        "anatomy": FakeAnatomy(str(tmp_path)),
+    })
+    instance = FakeInstance(
+        {
+            "frameStart": 4,
+            "frameEnd": 6,
+            "overrideExistingFrame": True,
+            "subset": "renderMain",
+            "asset": "sh010",
+        },
+        context
+    )
+    representation = {
+        "ext": "exr",
+        "files": ["sh010_beauty.{:04d}.exr".format(frame)
+                  for frame in range(4, 7)],
+        "stagingDir": "{root}/render",
+    }
+    pyblish_functions.copy_extend_frames(
+        instance, representation, max_workers=4
+    )
+
+    render_dir = str(tmp_path / "render")
+    expected = [
+        "sh010_beauty.{:04d}.exr".format(frame)
+        for frame in (1, 2, 3, 7, 8, 9, 10)
+    ]
+    assert sorted(os.listdir(render_dir)) == expected
+    with open(os.path.join(render_dir, expected[-1]), "r") as stream:
+        assert stream.read() == "10"
+
+
+def test_extend_frames_progress(caplog):
+    log = logging.getLogger("test_extend_frames_progress")
+    progress = pyblish_functions._ExtendFramesProgress(log)
+    with caplog.at_level(logging.DEBUG, logger=log.name):
+        for files_done in range(1, 101):
+            progress(files_done, 100, 0, 0)
+
+    assert [
+        (record.levelno, record.getMessage())
+        for record in caplog.records
+    ] == [
+        (logging.DEBUG, "Copied {}% of existing frames".format(percent))
+        for percent in (25, 50, 75, 100)
+    ]
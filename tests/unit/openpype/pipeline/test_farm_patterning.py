@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Test suite for matching of AOV patterns."""
+import re
+
+from openpype.pipeline.farm.patterning import (
+    AOVPatternMatcher,
+    get_aov_pattern_matcher,
+    match_aov_pattern,
+)
+
+
+FILE_NAMES = [
+    "/renders/sh010_beauty.1001.exr",
+    "/renders/sh010_Beauty.1001.exr",
+    "sh010_diffuse.1001.exr",
+    "sh010_lightgroup_key.1001.exr",
+    "sh010_crypto.1001.exr",
+    "preview.exr",
+]
+
+
+def test_matches_same_as_re_match():
+    patterns = [r".*([Bb]eauty).*", r".*_lightgroup_(?P<light>\w+)\..*", r"p"]
+    matcher = AOVPatternMatcher(patterns)
+    for file_name in FILE_NAMES:
+        expected = next(
+            (pattern for pattern in patterns if re.match(pattern, file_name)),
+            None
+        )
+        assert matcher.get_matched_pattern(file_name) == expected
+        # Cached result
+        assert matcher.get_matched_pattern(file_name) == expected
+
+
+def test_patterns_not_combinable():
+    patterns = [r"(?i).*BEAUTY.*", r"(\w+)_\1"]
+    matcher = AOVPatternMatcher(patterns)
+    assert matcher.match("sh010_beauty.1001.exr")
+    assert matcher.match("abc_abc.exr")
+    assert not matcher.match("abc_def.exr")
+
+
+def test_shared_matcher_by_host():
+    aov_filter = {"maya": [r".*([Bb]eauty).*"]}
+    matcher = get_aov_pattern_matcher("maya", aov_filter)
+    assert get_aov_pattern_matcher("maya", aov_filter) is matcher
+    assert match_aov_pattern("maya", aov_filter, FILE_NAMES[0])
+    assert not match_aov_pattern("nuke", aov_filter, FILE_NAMES[0])
+    assert not match_aov_pattern("maya", {}, FILE_NAMES[0])
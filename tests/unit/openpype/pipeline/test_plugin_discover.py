@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""Test suite for plugin discovery cache."""
+from openpype.pipeline.plugin_discover import PluginDiscoverContext
+
+from tests.unit.openpype.lib.lib import DemoBase, write_module
+
+
+def test_discover_returns_new_subclasses(tmp_path):
+    dirpath = str(tmp_path)
+    write_module(dirpath, "PluginA")
+    write_module(dirpath, "PluginB")
+
+    context = PluginDiscoverContext()
+    context.register_plugin_path(DemoBase, dirpath)
+    plugin_a, plugin_b = context.discover(DemoBase)
+    assert plugin_a.__name__ == "PluginA"
+    assert issubclass(plugin_a, DemoBase)
+
+    # Class attributes changes are not kept between discoveries
+    plugin_a.families.append("review")
+    plugin_a.enabled = False
+
+    again_a, again_b = context.discover(DemoBase)
+    assert again_a is not plugin_a
+    # Module is not imported again
+    assert again_a.__bases__ == plugin_a.__bases__
+    assert again_b.__bases__ == plugin_b.__bases__
+    assert again_a.families == ["render"]
+    assert not hasattr(again_a, "enabled")
+
+    # Forced reset imports all files
+    forced_a, _ = context.discover(DemoBase, force_reset=True)
+    assert forced_a.__bases__ != plugin_a.__bases__
+
+
+def test_discover_ignore_classes(tmp_path):
+    dirpath = str(tmp_path)
+    write_module(dirpath, "PluginA")
+    write_module(dirpath, "PluginB")
+
+    context = PluginDiscoverContext()
+    context.register_plugin_path(DemoBase, dirpath)
+    plugin_a, plugin_b = context.discover(DemoBase)
+
+    # Ignored classes are compared with classes defined in files
+    original_a = plugin_a.__bases__[0]
+    result = context.discover(
+        DemoBase, ignore_classes=[original_a], return_report=True
+    )
+    assert [plugin.__name__ for plugin in result.plugins] == ["PluginB"]
+    assert result.ignored_plugins == {original_a}
@@ -0,0 +1,17 @@
+import logging
+
+from openpype.plugins.publish.integrate import _TransferProgressLogger
+
+
+def test_transfer_progress_logged_in_steps(caplog):
+    log = logging.getLogger("test_transfer_progress")
+    progress = _TransferProgressLogger(log)
+    bytes_total = 1000 * 1024
+    with caplog.at_level(logging.DEBUG, logger=log.name):
+        for files_done in range(1, 1001):
+            progress(files_done, 1000, files_done * 1024, bytes_total)
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert len(messages) == 10, "Progress is not throttled"
+    assert messages[0] == "Transferred 10% (100/1000 files, 100.0KiB)"
+    assert messages[-1].startswith("Transferred 100% (1000/1000 files")
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+"""Test suite for settings resolution cache."""
+import copy
+import json
+import os
+
+import pytest
+
+from openpype.settings import lib
+from openpype.settings.handlers import CacheValues
+
+
+def test_frozen_settings():
+    value = {"a": {"b": [1, {"c": 2}]}}
+    frozen = lib.freeze_settings(value)
+    assert frozen == value
+    assert json.loads(json.dumps(frozen)) == value
+    with pytest.raises(TypeError):
+        frozen["a"]["d"] = 1
+    with pytest.raises(TypeError):
+        frozen["a"]["b"].append(3)
+
+    mutable = copy.deepcopy(frozen)
+    assert type(mutable) is dict
+    assert type(mutable["a"]["b"]) is list
+    mutable["a"]["b"][1]["c"] = 3
+    assert frozen["a"]["b"][1]["c"] == 2
+
+
+def test_resolved_settings_cached_by_revisions(monkeypatch):
+    revisions = {"value": (1, 1)}
+    calls = []
+
+    def resolve(clear_metadata, exclude_locals):
+        calls.append((clear_metadata, exclude_locals))
+        return {"value": len(calls)}
+
+    monkeypatch.setattr(
+        lib, "_get_settings_revisions", lambda *args: revisions["value"]
+    )
+    monkeypatch.setattr(lib, "_RESOLVED_SETTINGS_CACHE", {})
+
+    first = lib._get_resolved_settings("type", "project", True, None, resolve)
+    second = lib._get_resolved_settings("type", "project", True, None, resolve)
+    assert first is second
+    assert calls == [(True, False)]
+
+    revisions["value"] = (1, 2)
+    third = lib._get_resolved_settings("type", "project", True, None, resolve)
+    assert third == {"value": 2}
+
+    # Handler without revisions
+    revisions["value"] = None
+    lib._get_resolved_settings("type", "project", True, None, resolve)
+    lib._get_resolved_settings("type", "project", True, None, resolve)
+    assert len(calls) == 4
+
+
+def test_cache_values_revision():
+    cache = CacheValues()
+    cache.update_data({"a": 1}, "1.0.0")
+    revision = cache.revision
+    assert not cache.is_outdated
+
+    cache.update_from_document({"data": {"a": 1}}, "1.0.0")
+    assert cache.revision == revision
+
+    cache.update_from_document({"data": {"a": 2}}, "1.0.0")
+    assert cache.revision != revision
+
+    cache.set_outdated()
+    assert cache.is_outdated
+
+
+def _load_snapshot_env(monkeypatch, env):
+    monkeypatch.setattr(lib, "_SETTINGS_SNAPSHOT", None)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+
+def test_settings_snapshot(tmp_path, monkeypatch):
+    state = {"system": ["3.0.0", "2023-01-01 00:00:00.000000"]}
+    calls = []
+
+    def get_frozen_settings(settings_type, project_name=None, **kwargs):
+        calls.append(kwargs)
+        return lib.freeze_settings(
+            {"type": settings_type, "project": project_name}
+        )
+
+    monkeypatch.setattr(lib, "_get_frozen_settings", get_frozen_settings)
+    monkeypatch.setattr(
+        lib, "_get_settings_state", lambda *args: copy.deepcopy(state)
+    )
+    filepath = str(tmp_path / "snapshot" / "settings.json")
+    env = lib.save_settings_snapshot(filepath, ["demo"])
+    assert calls == [{"exclude_locals": False}, {"exclude_locals": False}]
+
+    _load_snapshot_env(monkeypatch, env)
+    settings = lib.get_project_settings("demo")
+    assert settings == {"type": "project_settings", "project": "demo"}
+    settings["project"] = "changed"
+    assert lib.get_frozen_project_settings("demo")["project"] == "demo"
+    assert lib.get_frozen_system_settings()["type"] == "system_settings"
+    # Processes started from this process don't inherit the snapshot
+    assert lib.SETTINGS_SNAPSHOT_ENV_KEY not in os.environ
+    assert os.path.exists(filepath)
+
+    # Snapshot with local settings is not used without local settings
+    monkeypatch.setattr(
+        lib,
+        "_get_frozen_project_settings",
+        lambda *args, **kwargs: lib.freeze_settings({"resolved": True})
+    )
+    assert lib.get_frozen_project_settings(
+        "demo", exclude_locals=True
+    ) == {"resolved": True}
+    assert lib.get_frozen_project_settings(
+        "demo", clear_metadata=False
+    ) == {"resolved": True}
+
+
+def test_settings_snapshot_without_locals(tmp_path, monkeypatch):
+    state = {"system": ["3.0.0", "2023-01-01 00:00:00.000000"]}
+    local_settings = {"revision": 1, "site": "studio"}
+
+    def apply_local_settings(project_settings, _local_settings, _name):
+        project_settings["site"] = _local_settings["site"]
+
+    monkeypatch.setattr(
+        lib,
+        "_get_frozen_settings",
+        lambda *args, **kwargs: lib.freeze_settings({"site": None})
+    )
+    monkeypatch.setattr(
+        lib, "_get_settings_state", lambda *args: copy.deepcopy(state)
+    )
+    monkeypatch.setattr(
+        lib, "get_local_settings", lambda: copy.deepcopy(local_settings)
+    )
+    monkeypatch.setattr(
+        lib,
+        "_get_local_settings_revision",
+        lambda: local_settings["revision"]
+    )
+    monkeypatch.setattr(
+        lib, "apply_local_settings_on_project_settings", apply_local_settings
+    )
+    filepath = str(tmp_path / "settings.json")
+    env = lib.save_settings_snapshot(
+        filepath, ["demo"], exclude_locals=True, remove_after_load=True
+    )
+
+    _load_snapshot_env(monkeypatch, env)
+    assert lib.get_frozen_project_settings(
+        "demo", exclude_locals=True
+    ) == {"site": None}
+    assert not os.path.exists(filepath)
+
+    # Local settings of this machine are applied on snapshot values
+    settings = lib.get_frozen_project_settings("demo")
+    assert settings == {"site": "studio"}
+    assert lib.get_frozen_project_settings("demo") is settings
+
+    local_settings.update({"revision": 2, "site": "local"})
+    assert lib.get_project_settings("demo") == {"site": "local"}
+
+
+def test_outdated_settings_snapshot(tmp_path, monkeypatch):
+    state = {"system": ["3.0.0", "2023-01-01 00:00:00.000000"]}
+    current_time = {"value": 1000}
+    monkeypatch.setattr(lib.time, "time", lambda: current_time["value"])
+    monkeypatch.setattr(
+        lib,
+        "_get_frozen_settings",
+        lambda *args, **kwargs: lib.freeze_settings({"value": 1})
+    )
+    monkeypatch.setattr(
+        lib, "_get_settings_state", lambda *args: copy.deepcopy(state)
+    )
+    monkeypatch.setattr(
+        lib,
+        "_get_frozen_project_settings",
+        lambda *args, **kwargs: lib.freeze_settings({"value": 2})
+    )
+    filepath = str(tmp_path / "settings.json")
+    env = lib.save_settings_snapshot(filepath, ["demo"])
+
+    # Overrides changed after snapshot was created
+    state["system"][1] = "2023-01-02 00:00:00.000000"
+    _load_snapshot_env(monkeypatch, env)
+    assert lib._get_settings_snapshot() is None
+    assert lib.get_frozen_project_settings("demo") == {"value": 2}
+
+    # Overrides changed after snapshot was loaded
+    env = lib.save_settings_snapshot(filepath, ["demo"])
+    _load_snapshot_env(monkeypatch, env)
+    assert lib.get_frozen_project_settings("demo") == {"value": 1}
+
+    state["system"][1] = "2023-01-03 00:00:00.000000"
+    # State is checked again only after interval
+    assert lib.get_frozen_project_settings("demo") == {"value": 1}
+    current_time["value"] += lib.SNAPSHOT_CHECK_INTERVAL
+    assert lib.get_frozen_project_settings("demo") == {"value": 2}
+
+    # Dropped snapshot is not used even if state would match
+    state["system"][1] = "2023-01-02 00:00:00.000000"
+    current_time["value"] += lib.SNAPSHOT_CHECK_INTERVAL
+    assert lib.get_frozen_project_settings("demo") == {"value": 2}
+
+    # Snapshot is not created without state
+    monkeypatch.setattr(lib, "_get_settings_state", lambda *args: None)
+    assert lib.save_settings_snapshot(str(tmp_path / "other.json")) == {}
+    assert not os.path.exists(str(tmp_path / "other.json"))
+
+
+def test_default_settings_bundle(tmp_path, monkeypatch):
+    defaults_dir = tmp_path / "defaults"
+    (defaults_dir / "project_settings").mkdir(parents=True)
+    filepath = defaults_dir / "project_settings" / "global.json"
+    filepath.write_text(json.dumps({"value": 1}))
+    bundle_path = str(tmp_path / "bundle.json")
+
+    monkeypatch.setattr(lib, "DEFAULTS_DIR", str(defaults_dir))
+    monkeypatch.setattr(lib, "DEFAULTS_BUNDLE_PATH", bundle_path)
+    expected = {"project_settings": {"global": {"value": 1}}}
+    assert lib._load_default_settings_bundle() is None
+
+    lib.create_default_settings_bundle()
+    assert lib._load_default_settings_bundle() == expected
+    assert lib.load_openpype_default_settings() == expected
+
+    # Changed modification time with same content is valid
+    os.utime(str(filepath), (0, 0))
+    assert lib._load_default_settings_bundle() == expected
+
+    # Changed content invalidates bundle
+    filepath.write_text(json.dumps({"value": 2}))
+    assert lib._load_default_settings_bundle() is None
+    assert lib.load_openpype_default_settings() == {
+        "project_settings": {"global": {"value": 2}}
+    }
+
+
+def test_default_settings_bundle_stamp(tmp_path, monkeypatch):
+    defaults_dir = tmp_path / "defaults"
+    (defaults_dir / "project_settings").mkdir(parents=True)
+    filepath = defaults_dir / "project_settings" / "global.json"
+    filepath.write_text(json.dumps({"value": 1}))
+    bundle_path = str(tmp_path / "bundle.json")
+
+    monkeypatch.setattr(lib, "DEFAULTS_DIR", str(defaults_dir))
+    monkeypatch.setattr(lib, "DEFAULTS_BUNDLE_PATH", bundle_path)
+    monkeypatch.setattr(lib.openpype.version, "__version__", "3.0.0")
+    lib.create_default_settings_bundle()
+
+    expected = {"project_settings": {"global": {"value": 1}}}
+    assert lib._load_default_settings_bundle() == expected
+
+    # Bundle of different version is outdated
+    monkeypatch.setattr(lib.openpype.version, "__version__", "3.0.1")
+    assert lib._load_default_settings_bundle() is None
+
+    # Changed files invalidate bundle of same version
+    monkeypatch.setattr(lib.openpype.version, "__version__", "3.0.0")
+    filepath.write_text(json.dumps({"value": 22}))
+    assert lib._load_default_settings_bundle() is None
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""Test suite for concurrent validation in publisher controller."""
+import time
+
+import pytest
+import pyblish.api
+
+from openpype.pipeline.publish import PublishValidationError
+from openpype.tools.publisher import control
+from openpype.tools.publisher.control import PublisherController
+
+
+class CollectInstances(pyblish.api.ContextPlugin):
+    order = pyblish.api.CollectorOrder
+
+    def process(self, context):
+        for name in ("first", "second", "third"):
+            instance = context.create_instance(name)
+            instance.data["family"] = "test"
+
+
+class ValidateSlow(pyblish.api.InstancePlugin):
+    order = pyblish.api.ValidatorOrder
+    thread_safe = True
+
+    def process(self, instance):
+        # First instances finish last
+        delay = {"first": 0.2, "second": 0.1}.get(instance.name, 0)
+        time.sleep(delay)
+        self.log.info("Validated {}".format(instance.name))
+
+
+class ValidateContext(pyblish.api.ContextPlugin):
+    order = pyblish.api.ValidatorOrder + 0.1
+    thread_safe = True
+
+    def process(self, context):
+        self.log.info("Validated context")
+
+
+class ValidateFails(pyblish.api.InstancePlugin):
+    order = pyblish.api.ValidatorOrder + 0.2
+    thread_safe = True
+
+    def process(self, instance):
+        if instance.name == "second":
+            raise PublishValidationError("Invalid second")
+
+
+class ExtractTest(pyblish.api.InstancePlugin):
+    order = pyblish.api.ExtractorOrder
+
+    def process(self, instance):
+        instance.data["extracted"] = True
+
+
+class FakeCreateContext(object):
+    publish_plugins = []
+
+    def __init__(self, *args, **kwargs):
+        self.creator_discover_result = None
+        self.convertor_discover_result = None
+        self.publish_discover_result = None
+        self.publish_plugins_mismatch_targets = []
+        self.publish_plugins = list(self.publish_plugins)
+
+
+class StoredJobsController(PublisherController):
+    """Controller which processes concurrent jobs on demand."""
+
+    def __init__(self, *args, **kwargs):
+        super(StoredJobsController, self).__init__(*args, **kwargs)
+        self.stored_jobs = []
+
+    def _run_concurrent_jobs(self, context, jobs, callback):
+        self.stored_jobs.append((context, jobs, callback))
+
+
+@pytest.fixture
+def create_controller(monkeypatch):
+    monkeypatch.setattr(control, "registered_host", lambda: None)
+    monkeypatch.setattr(control, "CreateContext", FakeCreateContext)
+
+    def _create(plugins, workers, controller_cls=PublisherController):
+        monkeypatch.setattr(FakeCreateContext, "publish_plugins", plugins)
+        monkeypatch.setenv(
+            "OPENPYPE_PUBLISH_VALIDATION_WORKERS", str(workers))
+        controller = controller_cls(headless=True)
+        controller._reset_publish()
+        return controller
+    return _create
+
+
+def _results_summary(controller):
+    return [
+        (
+            result["plugin"].__name__,
+            (
+                result["instance"].name
+                if result["instance"] is not None
+                else None
+            ),
+            [record.getMessage() for record in result["records"]],
+        )
+        for result in controller._publish_context.data["results"]
+    ]
+
+
+def _report_summary(controller):
+    report = controller.get_publish_report()
+    return [
+        (
+            plugin_data["name"],
+            plugin_data["skipped"],
+            plugin_data["passed"],
+            [
+                instance_data["id"] is not None
+                for instance_data in plugin_data["instances_data"]
+            ],
+        )
+        for plugin_data in report["plugins_data"]
+    ]
+
+
+def test_results_merged_in_order(create_controller):
+    plugins = [CollectInstances, ValidateSlow, ValidateContext, ExtractTest]
+    sequential = create_controller(plugins, 0)
+    sequential.publish()
+    concurrent = create_controller(plugins, 4)
+    concurrent.publish()
+
+    assert concurrent.publish_has_finished
+    assert not concurrent.publish_has_crashed
+    assert _results_summary(concurrent) == _results_summary(sequential)
+    assert [
+        item[:2] for item in _results_summary(concurrent)
+    ] == [
+        ("CollectInstances", None),
+        ("ValidateSlow", "first"),
+        ("ValidateSlow", "second"),
+        ("ValidateSlow", "third"),
+        ("ValidateContext", None),
+        ("ExtractTest", "first"),
+        ("ExtractTest", "second"),
+        ("ExtractTest", "third"),
+    ]
+    assert _report_summary(concurrent) == _report_summary(sequential)
+
+
+def test_validation_error_stops_before_extraction(create_controller):
+    plugins = [
+        CollectInstances, ValidateSlow, ValidateFails, ExtractTest
+    ]
+    controller = create_controller(plugins, 4)
+    controller.publish()
+
+    assert controller.publish_has_validation_errors
+    assert not controller.publish_has_crashed
+    assert not controller.publish_has_finished
+    assert not controller.publish_is_running
+    results = controller._publish_context.data["results"]
+    assert [
+        result["plugin"].__name__
+        for result in results
+        if result["error"]
+    ] == ["ValidateFails"]
+    assert "ExtractTest" not in {
+        result["plugin"].__name__ for result in results
+    }
+    assert not any(
+        instance.data.get("extracted")
+        for instance in controller._publish_context
+    )
+
+
+def test_reset_during_concurrent_validation(create_controller):
+    plugins = [CollectInstances, ValidateSlow, ValidateContext, ExtractTest]
+    controller = create_controller(plugins, 4, StoredJobsController)
+    controller.publish()
+
+    # Publishing waits for concurrent jobs
+    assert len(controller.stored_jobs) == 1
+    assert controller._concurrent_validation_running
+    old_context, jobs, callback = controller.stored_jobs.pop(0)
+
+    controller._reset_publish()
+    assert not controller._concurrent_validation_running
+    new_context = controller._publish_context
+    assert new_context is not old_context
+
+    # Results of previous publishing are ignored
+    results = controller._process_concurrent_jobs(old_context, jobs)
+    callback(results)
+    assert "results" not in new_context.data
+    assert not any(
+        instance_data
+        for _, _, _, instance_data in _report_summary(controller)
+    )
+
+    # New publishing is not affected
+    controller.publish()
+    old_context, jobs, callback = controller.stored_jobs.pop(0)
+    assert old_context is new_context
+    callback(controller._process_concurrent_jobs(new_context, jobs))
+    assert controller.publish_has_finished
+    assert len(new_context.data["results"]) == 8
+
+
+def test_instances_logs_match_report(create_controller, monkeypatch):
+    monkeypatch.setattr(control.PublishReportMaker, "logs_page_size", 2)
+    plugins = [CollectInstances, ValidateSlow, ValidateContext, ExtractTest]
+    controller = create_controller(plugins, 0)
+    controller.publish()
+
+    report = controller.get_publish_report()
+    expected_logs = {}
+    for plugin_data in report["plugins_data"]:
+        for instance_data in plugin_data["instances_data"]:
+            logs = expected_logs.setdefault(instance_data["id"], [])
+            for log_item in instance_data["logs"]:
+                log_item["plugin_id"] = plugin_data["id"]
+                logs.append(log_item)
+    expected_logs = {
+        instance_id: logs
+        for instance_id, logs in expected_logs.items()
+        if logs
+    }
+
+    logs_report = controller.get_publish_instances_logs()
+    assert logs_report["context_label"] == report["context"]["label"]
+    assert logs_report["instances"] == report["instances"]
+    assert logs_report["logs_by_instance_id"] == expected_logs
+    assert len(expected_logs) == 4
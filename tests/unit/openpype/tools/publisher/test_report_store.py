@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""Test suite for publish report store."""
+from openpype.tools.publisher.report_store import PublishReportStore
+
+
+def _log_items(count, with_error=False):
+    items = [
+        {"type": "record", "msg": "message {}".format(idx)}
+        for idx in range(count)
+    ]
+    if with_error:
+        items.append({"type": "error", "msg": "failed"})
+    return items
+
+
+def test_items_are_paged_and_capped():
+    store = PublishReportStore(max_logs_per_plugin=3)
+    store.reset()
+    first = store.add_item("plugin_a", {"id": None, "logs": _log_items(2)})
+    store.add_item("plugin_b", {"id": "x", "logs": _log_items(1)})
+    last = store.add_item(
+        "plugin_a",
+        {"id": "y", "logs": _log_items(2, True), "process_time": 2.5}
+    )
+    assert len(store) == 3
+
+    # Only one record fits to limit of plugin, error is always stored
+    item = store.get_item(last)
+    assert [log["msg"] for log in item["logs"]] == ["message 0", "failed"]
+    assert store.get_item(first)["logs"][1]["msg"] == "message 1"
+
+    summary = store.get_summary("plugin_a")
+    assert summary["items_count"] == 2
+    assert summary["logs_count"] == 3
+    assert summary["logs_overflow"] == 1
+    assert summary["errors_count"] == 1
+    assert summary["process_time"] == 2.5
+    assert [
+        summary["plugin_id"] for summary in store.get_summary()
+    ] == ["plugin_a", "plugin_b"]
+
+    page = store.get_page(start=1, limit=1, plugin_id="plugin_a")
+    assert [item["id"] for item in page] == ["y"]
+    assert [item["id"] for item in store.get_page(1)] == ["x", "y"]
+
+    store.reset()
+    assert len(store) == 0
+    assert store.get_summary() == []
+    store.close()
@@ -168,6 +168,13 @@ Get-ChildItem $openpype_root -Filter "*.pyo" -Force -Recurse | Where-Object { $_
 Get-ChildItem $openpype_root -Filter "__pycache__" -Force -Recurse | Where-Object { $_.FullName -inotmatch 'build' } | Remove-Item -Force -Recurse
 Write-Color -Text "OK" -Color green
 
+Write-Color -Text ">>> ", "Creating default settings bundle ..." -Color Green, Gray
+& "$($env:POETRY_HOME)\bin\poetry" run python "$($openpype_root)\tools\build_settings_bundle.py"
+if ($LASTEXITCODE -ne 0) {
+    Write-Color -Text "!!! ", "Failed to create default settings bundle." -Color Red, Yellow
+    Exit-WithCode $LASTEXITCODE
+}
+
 Write-Color -Text ">>> ", "Building OpenPype ..." -Color Green, White
 $startTime = [int][double]::Parse((Get-Date -UFormat %s))
 
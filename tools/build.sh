@@ -183,6 +183,8 @@ if [ "$disable_submodule_update" == 1 ]; then
     echo -e "${BIGreen}>>>${RST} Making sure submodules are up-to-date ..."
     git submodule update --init --recursive || { echo -e "${BIRed}!!!${RST} Poetry installation failed"; return 1; }
   fi
+  echo -e "${BIGreen}>>>${RST} Creating default settings bundle ..."
+  "$POETRY_HOME/bin/poetry" run python "$openpype_root/tools/build_settings_bundle.py" || { echo -e "${BIRed}!!!>${RST} ${BIYellow}Failed to create default settings bundle${RST}"; return 1; }
   echo -e "${BIGreen}>>>${RST} Building ..."
   if [[ "$OSTYPE" == "linux-gnu"* ]]; then
     "$POETRY_HOME/bin/poetry" run python "$openpype_root/setup.py" build &> "$openpype_root/build/build.log" || { echo -e "${BIRed}------------------------------------------${RST}"; cat "$openpype_root/build/build.log"; echo -e "${BIRed}------------------------------------------${RST}"; echo -e "${BIRed}!!!${RST} Build failed, see the build log."; return 1; }
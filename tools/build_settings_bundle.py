@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""Create precompiled bundle of OpenPype default settings.
+
+Default settings are stored in many json files which are loaded one by one
+in each process. The bundle contains all of them in one file with a stamp
+of OpenPype version and hash of the source files. Bundle is validated by
+the stamp and by manifest of the source files. Outdated bundle is ignored
+and default settings are loaded from json files.
+
+This must be executed before build and it is done by build scripts on each
+build.
+"""
+import os
+import sys
+
+openpype_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, openpype_root)
+
+from openpype.settings.lib import create_default_settings_bundle  # noqa
+
+
+if __name__ == "__main__":
+    output_path = None
+    if len(sys.argv) > 1:
+        output_path = sys.argv[1]
+    print("Created default settings bundle: {}".format(
+        create_default_settings_bundle(output_path)
+    ))